@@ -1,40 +1,113 @@
 """The Climate Control integration."""
+from collections.abc import Mapping
 import logging
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN
+from .accounting import async_remove_accounting
+from .const import (
+    CONF_INSTRUMENTATION,
+    DEFAULT_INSTRUMENTATION,
+    DOMAIN,
+    LIVE_OPTION_KEYS,
+    OPTION_DEFAULTS,
+    SIGNAL_OPTIONS_UPDATED,
+)
+from .heat_source import is_heat_source_entry
+from .instrumentation import Instrumentation
+from .models import ClimateControlData, HeatSourceData
+from .router import TopicRouter
+from .services import async_setup_services
+from .zones import expand_zones
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS = [Platform.CLIMATE]
+PLATFORMS = [Platform.CLIMATE, Platform.SENSOR, Platform.SWITCH]
+HEAT_SOURCE_PLATFORMS = [Platform.BINARY_SENSOR, Platform.SENSOR, Platform.SWITCH]
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the Climate Control component."""
     hass.data.setdefault(DOMAIN, {})
+    async_setup_services(hass)
     return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Climate Control from a config entry."""
     hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = entry.data
+    if is_heat_source_entry(entry):
+        return await async_setup_heat_source_entry(hass, entry)
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    instrumentation = Instrumentation(
+        entry.options.get(CONF_INSTRUMENTATION, DEFAULT_INSTRUMENTATION)
+    )
+    router = TopicRouter(hass, instrumentation=instrumentation)
+    hass.data[DOMAIN][entry.entry_id] = ClimateControlData(
+        entry_config(entry), router
+    )
+    entry.async_on_unload(router.async_unsubscribe)
+
+    # The power switches drive the climate entities of their zones, so the
+    # climate platform is set up first
+    await hass.config_entries.async_forward_entry_setups(entry, [Platform.CLIMATE])
+    await hass.config_entries.async_forward_entry_setups(
+        entry, [platform for platform in PLATFORMS if platform != Platform.CLIMATE]
+    )
     
     entry.async_on_unload(entry.add_update_listener(async_update_options))
     
     return True
 
 
+async def async_setup_heat_source_entry(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> bool:
+    """Set up the switch, demand sensor and accounting of a heat source.
+
+    The switch and the demand sensor are registered first, so the demand
+    automation and the accounting know their entity ids before any platform
+    is set up.
+    """
+    registry = er.async_get(hass)
+    switch_entry = registry.async_get_or_create(
+        Platform.SWITCH,
+        DOMAIN,
+        f"{entry.entry_id}_switch",
+        config_entry=entry,
+        suggested_object_id=entry.title,
+    )
+    demand_entry = registry.async_get_or_create(
+        Platform.BINARY_SENSOR,
+        DOMAIN,
+        f"{entry.entry_id}_demand",
+        config_entry=entry,
+        suggested_object_id=f"{entry.title} demand",
+    )
+    config = entry_config(entry)
+    hass.data[DOMAIN][entry.entry_id] = HeatSourceData(
+        config,
+        switch_entry.entity_id,
+        demand_entry.entity_id,
+        Instrumentation(config.get(CONF_INSTRUMENTATION, DEFAULT_INSTRUMENTATION)),
+    )
+    await hass.config_entries.async_forward_entry_setups(
+        entry, HEAT_SOURCE_PLATFORMS
+    )
+    return True
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(
-        entry, PLATFORMS
+        entry,
+        HEAT_SOURCE_PLATFORMS if is_heat_source_entry(entry) else PLATFORMS,
     )
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
@@ -42,8 +115,51 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the saved accounting totals of a heat source."""
+    if is_heat_source_entry(entry):
+        await async_remove_accounting(hass, entry.entry_id)
+
+
+def entry_config(entry: ConfigEntry) -> dict[str, Any]:
+    """Return the config of an entry, with the options taking precedence."""
+    return {**entry.data, **entry.options}
+
+
+def changed_keys(old: Mapping[str, Any], new: Mapping[str, Any]) -> set[str]:
+    """Return the keys whose values differ between two configs.
+
+    Options that are not set count with their default, so the first save of
+    the options form does not change every field it submits.
+    """
+    return {
+        key
+        for key in old.keys() | new.keys()
+        if old.get(key, OPTION_DEFAULTS.get(key))
+        != new.get(key, OPTION_DEFAULTS.get(key))
+    }
+
+
 async def async_update_options(
     hass: HomeAssistant, entry: ConfigEntry
 ) -> None:
-    """Update options."""
-    await hass.config_entries.async_reload(entry.entry_id)
\ No newline at end of file
+    """Apply updated options, reloading the entry only if required.
+
+    Temperature limits, step and precision are applied to the running
+    entities. Any other change, such as topics, reloads the entry.
+    """
+    data: ClimateControlData = hass.data[DOMAIN][entry.entry_id]
+    config = entry_config(entry)
+    changed = changed_keys(data.config, config)
+    if not changed:
+        return
+    if not changed.issubset(LIVE_OPTION_KEYS):
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    data.config = config
+    async_dispatcher_send(
+        hass,
+        SIGNAL_OPTIONS_UPDATED.format(entry.entry_id),
+        dict(expand_zones(config)),
+    )
\ No newline at end of file
@@ -0,0 +1,309 @@
+"""Heat source runtime accounting for Climate Control."""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping
+from datetime import datetime
+from typing import Any
+
+from homeassistant.const import STATE_ON
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import EventStateChangedData, async_track_time_change
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .automation import CLIMATE_ACTIVE_SENSOR, CLIMATE_SWITCH
+from .const import ATTR_ACTIVE_ZONES, DOMAIN
+from .listeners import async_get_listener_tracker
+
+STORAGE_KEY = f"{DOMAIN}.accounting"
+STORAGE_VERSION = 1
+
+
+class RuntimeAccount:
+    """On time, cycles and zone shares of the heat source.
+
+    While the switch is on, each second is shared by the active zones in
+    proportion to their weights, and counted as unattributed if no zone is
+    active. Instead of crediting every active zone on each change, the
+    integral of 1 / total weight over the on time is kept and a zone leaving
+    the active set is credited its weight times the growth of the integral
+    since it entered, so each switch or zone transition costs O(1).
+    """
+
+    def __init__(
+        self,
+        weights: Mapping[str, float] | None = None,
+        data: Mapping[str, Any] | None = None,
+    ) -> None:
+        """Initialize the account, optionally from saved totals."""
+        data = data or {}
+        self._weights = dict(weights or {})
+        self.is_on = False
+        self.cycles: int = data.get("cycles", 0)
+        self._on_time: float = data.get("on_time", 0.0)
+        self._unattributed: float = data.get("unattributed", 0.0)
+        self._zone_time: dict[str, float] = dict(data.get("zones", {}))
+        self._day_start: dict[str, Any] = dict(data.get("day_start", {}))
+        self._since = 0.0
+        self._share = 0.0
+        self._total_weight = 0.0
+        self._active: dict[str, float] = {}
+
+    @property
+    def zones(self) -> set[str]:
+        """Return the zones with any time, or active now."""
+        return self._zone_time.keys() | self._active.keys()
+
+    def _settle(self, now: float) -> None:
+        """Account the time since the last transition."""
+        if self.is_on and (elapsed := now - self._since) > 0:
+            self._on_time += elapsed
+            if self._total_weight > 0:
+                self._share += elapsed / self._total_weight
+            else:
+                self._unattributed += elapsed
+        self._since = now
+
+    def set_switch(self, is_on: bool, now: float) -> None:
+        """Record a switch transition."""
+        self._settle(now)
+        if is_on and not self.is_on:
+            self.cycles += 1
+        self.is_on = is_on
+
+    def resume(self, is_on: bool, now: float) -> None:
+        """Take over the switch state at start without counting a cycle."""
+        self._settle(now)
+        self.is_on = is_on
+
+    def set_active(self, zones: Iterable[str], now: float) -> None:
+        """Record the active zones."""
+        active = set(zones)
+        if active == self._active.keys():
+            return
+        self._settle(now)
+        weights = self._weights
+        for zone in self._active.keys() - active:
+            weight = weights.get(zone, 1.0)
+            entered = self._active.pop(zone)
+            self._zone_time[zone] = (
+                self._zone_time.get(zone, 0.0) + weight * (self._share - entered)
+            )
+            self._total_weight -= weight
+        for zone in active - self._active.keys():
+            self._active[zone] = self._share
+            self._total_weight += weights.get(zone, 1.0)
+        if not self._active:
+            # Drop the rounding error of the additions
+            self._total_weight = 0.0
+
+    def on_time(self, now: float) -> float:
+        """Return the on time in seconds."""
+        if self.is_on:
+            return self._on_time + now - self._since
+        return self._on_time
+
+    def unattributed(self, now: float) -> float:
+        """Return the on time without active zones in seconds."""
+        if self.is_on and self._total_weight <= 0:
+            return self._unattributed + now - self._since
+        return self._unattributed
+
+    def zone_on_time(self, zone: str, now: float) -> float:
+        """Return the share of the on time of a zone in seconds."""
+        total = self._zone_time.get(zone, 0.0)
+        if (entered := self._active.get(zone)) is None:
+            return total
+        share = self._share
+        if self.is_on and self._total_weight > 0:
+            share += (now - self._since) / self._total_weight
+        return total + self._weights.get(zone, 1.0) * (share - entered)
+
+    def start_day(self, now: float) -> None:
+        """Start counting the totals of a new day."""
+        self._day_start = {
+            "on_time": self.on_time(now),
+            "cycles": self.cycles,
+            "zones": {zone: self.zone_on_time(zone, now) for zone in self.zones},
+        }
+
+    def today(self, key: str, value: float) -> float:
+        """Return the part of a total counted today."""
+        return value - self._day_start.get(key, 0)
+
+    def zone_today(self, zone: str, value: float) -> float:
+        """Return the part of a zone total counted today."""
+        return value - self._day_start.get("zones", {}).get(zone, 0.0)
+
+    def as_dict(self, now: float) -> dict[str, Any]:
+        """Return the totals for storage."""
+        return {
+            "on_time": self.on_time(now),
+            "cycles": self.cycles,
+            "unattributed": self.unattributed(now),
+            "zones": {zone: self.zone_on_time(zone, now) for zone in self.zones},
+            "day_start": self._day_start,
+        }
+
+
+def accounting_storage_key(entry_id: str | None = None) -> str:
+    """Return the storage key of the YAML or a heat source entry accounting."""
+    return STORAGE_KEY if entry_id is None else f"{STORAGE_KEY}.{entry_id}"
+
+
+async def async_remove_accounting(hass: HomeAssistant, entry_id: str) -> None:
+    """Remove the saved totals of a heat source entry."""
+    await Store(hass, STORAGE_VERSION, accounting_storage_key(entry_id)).async_remove()
+
+
+class HeatSourceAccounting:
+    """Feed a heat source switch and the active zones into an account.
+
+    The YAML accounting follows ``switch.climate`` and the zones of
+    ``binary_sensor.climate_active``, a heat source entry passes its switch,
+    demand sensor and storage key. The totals are saved at most once per
+    ``save_interval`` seconds, and on shutdown.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        weights: Mapping[str, float] | None = None,
+        power: float | None = None,
+        save_interval: float = 900,
+        switch_entity_id: str = CLIMATE_SWITCH,
+        sensor_entity_id: str = CLIMATE_ACTIVE_SENSOR,
+        storage_key: str = STORAGE_KEY,
+    ) -> None:
+        """Initialize the accounting."""
+        self.hass = hass
+        self.power = power
+        self._weights = weights
+        self._save_interval = save_interval
+        self._switch_entity_id = switch_entity_id
+        self._sensor_entity_id = sensor_entity_id
+        self._storage_key = storage_key
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, storage_key)
+        self._save_pending = False
+        self._day = dt_util.now().date().isoformat()
+        self._zone_listeners: list[Callable[[str], None]] = []
+        self.account = RuntimeAccount(weights)
+
+    async def async_load(self) -> None:
+        """Load the saved totals."""
+        if (data := await self._store.async_load()) is None:
+            return
+        self.account = RuntimeAccount(self._weights, data)
+        if data.get("day") != self._day:
+            self.account.start_day(self.hass.loop.time())
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Start accounting and return a callback that stops it."""
+        listeners = async_get_listener_tracker(self.hass, self._storage_key)
+        now = self.hass.loop.time()
+        if (state := self.hass.states.get(self._switch_entity_id)) is not None:
+            self.account.resume(state.state == STATE_ON, now)
+        if (state := self.hass.states.get(self._sensor_entity_id)) is not None:
+            self._async_set_active(state.attributes.get(ATTR_ACTIVE_ZONES, ()), now)
+
+        unsubs = [
+            listeners.async_track_state_change_event(
+                self._switch_entity_id, self._handle_switch_change
+            ),
+            listeners.async_track_state_change_event(
+                self._sensor_entity_id, self._handle_sensor_change
+            ),
+            async_track_time_change(
+                self.hass, self._async_new_day, hour=0, minute=0, second=0
+            ),
+        ]
+
+        @callback
+        def async_stop() -> None:
+            """Stop accounting and save the totals."""
+            for unsub in unsubs:
+                unsub()
+            self._store.async_delay_save(self._data_to_save, 0)
+
+        return async_stop
+
+    @callback
+    def async_add_zone_listener(self, listener: Callable[[str], None]) -> None:
+        """Call a listener with each zone that becomes active the first time."""
+        self._zone_listeners.append(listener)
+
+    @callback
+    def _handle_switch_change(self, event: Event[EventStateChangedData]) -> None:
+        """Account a switch transition."""
+        if (new_state := event.data["new_state"]) is None:
+            return
+        is_on = new_state.state == STATE_ON
+        if is_on != self.account.is_on:
+            self.account.set_switch(is_on, self.hass.loop.time())
+            self._async_schedule_save()
+
+    @callback
+    def _handle_sensor_change(self, event: Event[EventStateChangedData]) -> None:
+        """Account a change of the active zones."""
+        if (new_state := event.data["new_state"]) is None:
+            return
+        self._async_set_active(
+            new_state.attributes.get(ATTR_ACTIVE_ZONES, ()), self.hass.loop.time()
+        )
+        self._async_schedule_save()
+
+    @callback
+    def _async_set_active(self, zones: Iterable[str], now: float) -> None:
+        """Pass the active zones to the account and announce new zones."""
+        known = self.account.zones
+        self.account.set_active(zones, now)
+        if self._zone_listeners and (new := self.account.zones - known):
+            for zone in sorted(new):
+                for listener in self._zone_listeners:
+                    listener(zone)
+
+    @callback
+    def _async_new_day(self, now: datetime) -> None:
+        """Start the totals of a new day at midnight."""
+        self._day = now.date().isoformat()
+        self.account.start_day(self.hass.loop.time())
+        self._async_schedule_save()
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Save the totals after the save interval unless already scheduled."""
+        if self._save_pending:
+            return
+        self._save_pending = True
+        self._store.async_delay_save(self._data_to_save, self._save_interval)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the totals to save."""
+        self._save_pending = False
+        return {**self.account.as_dict(self.hass.loop.time()), "day": self._day}
+
+    def on_time(self, zone: str | None = None, today: bool = False) -> float:
+        """Return the on time of the heat source or the share of a zone."""
+        now = self.hass.loop.time()
+        if zone is None:
+            value = self.account.on_time(now)
+            return self.account.today("on_time", value) if today else value
+        value = self.account.zone_on_time(zone, now)
+        return self.account.zone_today(zone, value) if today else value
+
+    def cycles(self, today: bool = False) -> int:
+        """Return the switch on cycles."""
+        value = self.account.cycles
+        return int(self.account.today("cycles", value)) if today else value
+
+    def energy(self, zone: str | None = None, today: bool = False) -> float | None:
+        """Return the energy estimated from the power in kWh."""
+        if self.power is None:
+            return None
+        return self.on_time(zone, today) * self.power / 3600
+
+    def unattributed(self) -> float:
+        """Return the on time without active zones in seconds."""
+        return self.account.unattributed(self.hass.loop.time())
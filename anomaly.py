@@ -0,0 +1,168 @@
+"""Anomaly detection on the current temperature of a Climate Control zone."""
+from __future__ import annotations
+
+from asyncio import TimerHandle
+from collections.abc import Callable
+import math
+
+from homeassistant.core import HomeAssistant, callback
+
+ANOMALY_STALE = "stale"
+ANOMALY_NO_RESPONSE = "no_response"
+ANOMALY_JUMP = "jump"
+
+# A step is implausible beyond this many standard deviations of the usual
+# steps, and at least beyond the jump limit
+JUMP_SIGMAS = 6.0
+# Weight of a new step in the rolling step variance
+STEP_SMOOTHING = 0.05
+# Samples away from the last plausible value that confirm a new level
+JUMP_CONFIRM_SAMPLES = 3
+
+
+class AnomalyDetector:
+    """Flag a dead sensor, a zone not warming up and implausible jumps.
+
+    A sample only updates a few running values, so the memory and the work
+    per sample are constant:
+
+    - ``stale``: no sample for ``stale_timeout`` seconds. A sample only
+      records its time, the watchdog timer re-arms itself when it fires early.
+    - ``no_response``: heat was demanded for ``response_time`` seconds without
+      the temperature rising by ``min_rise`` within that time.
+    - ``jump``: a step from the last plausible value beyond ``jump_limit`` and
+      beyond JUMP_SIGMAS of the rolling step deviation. The flag clears with
+      the next plausible sample, or once JUMP_CONFIRM_SAMPLES samples confirm
+      the new level.
+
+    A limit of 0 disables its check.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        on_change: Callable[[], None],
+        stale_timeout: float = 0,
+        response_time: float = 0,
+        min_rise: float = 0,
+        jump_limit: float = 0,
+    ) -> None:
+        """Initialize the detector."""
+        self.hass = hass
+        self._on_change = on_change
+        self.stale_timeout = stale_timeout
+        self.response_time = response_time
+        self.min_rise = min_rise
+        self.jump_limit = jump_limit
+        self.flags: set[str] = set()
+        self.jumps = 0
+
+        self._last_seen = -math.inf
+        self._watchdog: TimerHandle | None = None
+        self._reference: float | None = None
+        self._step_variance = 0.0
+        self._outliers = 0
+        self._window_start: float | None = None
+        self._window_temperature = 0.0
+
+    @callback
+    def async_start(self) -> None:
+        """Start the watchdog, a sensor that never reports is stale too."""
+        if self.stale_timeout > 0:
+            self._last_seen = self.hass.loop.time()
+            self._async_arm(self._last_seen + self.stale_timeout)
+
+    @callback
+    def async_sample(self, temperature: float, heating: bool) -> None:
+        """Check a current temperature, with heat demanded or not."""
+        now = self.hass.loop.time()
+        self._last_seen = now
+        changed = self._set_flag(ANOMALY_STALE, False)
+        if self._watchdog is None and self.stale_timeout > 0:
+            self._async_arm(now + self.stale_timeout)
+
+        changed |= self._check_jump(temperature)
+        if not self._outliers:
+            changed |= self._check_response(now, temperature, heating)
+        if changed:
+            self._on_change()
+
+    def _set_flag(self, flag: str, active: bool) -> bool:
+        """Set or clear a flag, returning True if it changed."""
+        if active == (flag in self.flags):
+            return False
+        if active:
+            self.flags.add(flag)
+        else:
+            self.flags.discard(flag)
+        return True
+
+    def _check_jump(self, temperature: float) -> bool:
+        """Flag a step that is too large to be real."""
+        if self.jump_limit <= 0:
+            return False
+        if (reference := self._reference) is None:
+            self._reference = temperature
+            return False
+
+        step = temperature - reference
+        limit = max(self.jump_limit, JUMP_SIGMAS * math.sqrt(self._step_variance))
+        if abs(step) <= limit:
+            self._reference = temperature
+            self._outliers = 0
+            self._step_variance += STEP_SMOOTHING * (step * step - self._step_variance)
+            return self._set_flag(ANOMALY_JUMP, False)
+
+        self._outliers += 1
+        if self._outliers == 1:
+            self.jumps += 1
+        if self._outliers >= JUMP_CONFIRM_SAMPLES:
+            # The level really changed, e.g. the sensor was moved
+            self._reference = temperature
+            self._outliers = 0
+            return self._set_flag(ANOMALY_JUMP, False)
+        return self._set_flag(ANOMALY_JUMP, True)
+
+    def _check_response(self, now: float, temperature: float, heating: bool) -> bool:
+        """Flag a zone that does not warm up while heat is demanded."""
+        if self.response_time <= 0:
+            return False
+        if not heating:
+            self._window_start = None
+            return self._set_flag(ANOMALY_NO_RESPONSE, False)
+
+        if (
+            self._window_start is None
+            or temperature - self._window_temperature >= self.min_rise
+        ):
+            # Warming up, the next rise is expected from here
+            self._window_start = now
+            self._window_temperature = temperature
+            return self._set_flag(ANOMALY_NO_RESPONSE, False)
+
+        if now - self._window_start >= self.response_time:
+            return self._set_flag(ANOMALY_NO_RESPONSE, True)
+        return False
+
+    @callback
+    def _async_arm(self, when: float) -> None:
+        """Arm the watchdog."""
+        self._watchdog = self.hass.loop.call_at(when, self._async_watchdog)
+
+    @callback
+    def _async_watchdog(self) -> None:
+        """Flag the sensor as stale unless a sample arrived meanwhile."""
+        self._watchdog = None
+        due = self._last_seen + self.stale_timeout
+        if self.hass.loop.time() < due:
+            self._async_arm(due)
+            return
+        if self._set_flag(ANOMALY_STALE, True):
+            self._on_change()
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Stop the watchdog."""
+        if self._watchdog is not None:
+            self._watchdog.cancel()
+            self._watchdog = None
@@ -1,28 +1,124 @@
 """Automation handling for Climate Control."""
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.event import async_track_state_change
-from homeassistant.const import STATE_ON
+from __future__ import annotations
 
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Any
 
-async def setup_automations(hass: HomeAssistant) -> None:
-    """Set up the automations for Climate Control."""
-    
-    async def handle_binary_sensor_change(entity_id, old_state, new_state):
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import EventStateChangedData, async_call_later
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    SERVICE_TURN_OFF,
+    SERVICE_TURN_ON,
+    STATE_ON,
+)
+
+from .const import (
+    ATTR_ACTIVE_ZONES,
+    CONF_DEMAND_OFF_THRESHOLD,
+    CONF_DEMAND_ON_THRESHOLD,
+    CONF_MIN_OFF_TIME,
+    CONF_MIN_ON_TIME,
+    CONF_ZONE_WEIGHTS,
+    DEFAULT_DEMAND_OFF_THRESHOLD,
+    DEFAULT_DEMAND_ON_THRESHOLD,
+    DEFAULT_MIN_OFF_TIME,
+    DEFAULT_MIN_ON_TIME,
+)
+from .demand import DemandEngine
+from .listeners import ListenerTracker, async_get_listener_tracker
+
+CLIMATE_ACTIVE_SENSOR = "binary_sensor.climate_active"
+CLIMATE_SWITCH = "switch.climate"
+
+
+async def setup_automations(
+    hass: HomeAssistant,
+    config: Mapping[str, Any] | None = None,
+    listeners: ListenerTracker | None = None,
+    sensor_entity_id: str = CLIMATE_ACTIVE_SENSOR,
+    switch_entity_id: str = CLIMATE_SWITCH,
+) -> CALLBACK_TYPE:
+    """Set up the automations for Climate Control.
+
+    The binary sensor feeds a DemandEngine, which applies the demand
+    thresholds and minimum on and off times before the switch is toggled.
+    Each heat source passes its own sensor and switch.
+    Returns a callback that removes the automations, to be passed to
+    async_on_remove or entry.async_on_unload by the owner.
+    """
+    config = config or {}
+    if listeners is None:
+        listeners = async_get_listener_tracker(hass, sensor_entity_id)
+    switch_state = hass.states.get(switch_entity_id)
+    engine = DemandEngine(
+        config.get(CONF_ZONE_WEIGHTS),
+        config.get(CONF_DEMAND_ON_THRESHOLD, DEFAULT_DEMAND_ON_THRESHOLD),
+        config.get(CONF_DEMAND_OFF_THRESHOLD, DEFAULT_DEMAND_OFF_THRESHOLD),
+        config.get(CONF_MIN_ON_TIME, DEFAULT_MIN_ON_TIME),
+        config.get(CONF_MIN_OFF_TIME, DEFAULT_MIN_OFF_TIME),
+        switch_state is not None and switch_state.state == STATE_ON,
+    )
+    unsub_retry: CALLBACK_TYPE | None = None
+
+    async def async_apply(_now: datetime | None = None) -> None:
+        """Command the switch if the engine asks for a change."""
+        nonlocal unsub_retry
+        if unsub_retry is not None:
+            unsub_retry()
+            unsub_retry = None
+
+        state, delay = engine.evaluate(hass.loop.time())
+        if delay is not None:
+            unsub_retry = async_call_later(hass, delay, async_apply)
+        if state is None:
+            return
+
+        engine.set_switch_state(state, hass.loop.time())
+        current = hass.states.get(switch_entity_id)
+        if current is not None and (current.state == STATE_ON) == state:
+            return
+
+        await hass.services.async_call(
+            "switch",
+            SERVICE_TURN_ON if state else SERVICE_TURN_OFF,
+            {ATTR_ENTITY_ID: switch_entity_id},
+        )
+
+    async def handle_binary_sensor_change(
+        event: Event[EventStateChangedData],
+    ) -> None:
         """Handle changes to the binary sensor state."""
-        if new_state is None:
+        if (new_state := event.data["new_state"]) is None:
             return
 
-        if new_state.state == STATE_ON:
-            await hass.services.async_call(
-                "switch", "turn_on", {"entity_id": "switch.climate"}
-            )
-        else:
-            await hass.services.async_call(
-                "switch", "turn_off", {"entity_id": "switch.climate"}
-            )
-
-    async_track_state_change(
-        hass,
-        "binary_sensor.climate_active",
-        handle_binary_sensor_change
-    ) 
\ No newline at end of file
+        if (active_zones := new_state.attributes.get(ATTR_ACTIVE_ZONES)) is None:
+            active_zones = [new_state.entity_id] if new_state.state == STATE_ON else []
+        engine.update_demand(active_zones)
+        await async_apply()
+
+    @callback
+    def handle_switch_change(event: Event[EventStateChangedData]) -> None:
+        """Track switch changes, including manual ones, for the minimum times."""
+        if (new_state := event.data["new_state"]) is not None:
+            engine.set_switch_state(new_state.state == STATE_ON, hass.loop.time())
+
+    unsubs = [
+        listeners.async_track_state_change_event(
+            sensor_entity_id, handle_binary_sensor_change
+        ),
+        listeners.async_track_state_change_event(
+            switch_entity_id, handle_switch_change
+        ),
+    ]
+
+    @callback
+    def async_remove() -> None:
+        """Remove the automations."""
+        if unsub_retry is not None:
+            unsub_retry()
+        for unsub in unsubs:
+            unsub()
+
+    return async_remove
@@ -0,0 +1,56 @@
+"""State write batching for the Climate Control entities."""
+from __future__ import annotations
+
+from asyncio import Handle, TimerHandle
+from collections.abc import Callable
+
+from homeassistant.core import HomeAssistant, callback
+
+
+class StateWriteBatcher:
+    """Merge the state writes of an entity into one write per window.
+
+    With a window of 0 all updates handled within the same event loop
+    iteration result in a single write.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        write: Callable[[], None],
+        window: float,
+    ) -> None:
+        """Initialize the batcher."""
+        self.hass = hass
+        self._write = write
+        self._window = window
+        self._handle: Handle | TimerHandle | None = None
+
+        self.requested = 0
+        self.written = 0
+
+    @callback
+    def async_schedule(self) -> None:
+        """Request a state write."""
+        self.requested += 1
+        if self._handle is not None:
+            return
+
+        if self._window <= 0:
+            self._handle = self.hass.loop.call_soon(self._async_write)
+        else:
+            self._handle = self.hass.loop.call_later(self._window, self._async_write)
+
+    @callback
+    def _async_write(self) -> None:
+        """Write the state."""
+        self._handle = None
+        self.written += 1
+        self._write()
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel a scheduled write."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
@@ -1,14 +1,50 @@
 """Binary sensor platform for Climate Control."""
+from __future__ import annotations
+
 from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
     BinarySensorDeviceClass,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import ATTR_ENTITY_ID, CONF_NAME
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, State, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import EventStateChangedData
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
-from homeassistant.helpers.event import async_track_state_change
+
+from .automation import CLIMATE_ACTIVE_SENSOR, CLIMATE_SWITCH, setup_automations
+from .const import (
+    ATTR_ACTIVE_ZONES,
+    ATTR_ANOMALIES,
+    CONF_CLIMATE_ENTITIES,
+    CONF_CLIMATE_GROUP,
+    CONF_EXCLUDE_ANOMALOUS_ZONES,
+    DOMAIN,
+)
+from .heat_source import async_get_heat_source_router
+from .listeners import (
+    ListenerTracker,
+    async_get_listener_tracker,
+    async_remove_listener_tracker,
+)
+from .models import HeatSourceData
 
 CLIMATE_GROUP = "group.climate_devices"
+INACTIVE_STATES = frozenset({"off", "idle"})
+
+
+def is_climate_active(state: State | None, exclude_anomalous: bool = False) -> bool:
+    """Return True if a climate state counts as demand.
+
+    With ``exclude_anomalous``, zones flagged by their anomaly detection do not
+    count, so a dead sensor or a stuck valve cannot keep the heat source on.
+    """
+    return (
+        state is not None
+        and state.state not in INACTIVE_STATES
+        and not (exclude_anomalous and state.attributes.get(ATTR_ANOMALIES))
+    )
+
 
 async def async_setup_platform(
     hass: HomeAssistant,
@@ -17,51 +53,205 @@ async def async_setup_platform(
     discovery_info: DiscoveryInfoType | None = None,
 ) -> None:
     """Set up the Climate binary sensor."""
-    add_entities([ClimateActiveSensor(hass)])
+    add_entities([ClimateActiveSensor(hass, config)])
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the demand sensor of a heat source."""
+    data: HeatSourceData = hass.data[DOMAIN][config_entry.entry_id]
+    async_add_entities(
+        [
+            HeatSourceDemandSensor(
+                hass, data.config, config_entry.entry_id, data.switch_entity_id
+            )
+        ]
+    )
+
 
 class ClimateActiveSensor(BinarySensorEntity):
-    """Binary sensor that monitors if any climate device is active."""
+    """Binary sensor that monitors if any climate device is active.
+
+    The set of active members is maintained incrementally from the state
+    change events, so each event costs O(1). The group is only re-read when
+    its membership changes. The state is written when the active set changes.
+    The heat source automation is set up and removed together with the sensor.
+    """
 
     _attr_name = "Climate Active"
     _attr_device_class = BinarySensorDeviceClass.RUNNING
     _attr_unique_id = "climate_active_sensor"
-    
-    def __init__(self, hass: HomeAssistant) -> None:
+    _attr_should_poll = False
+
+    def __init__(self, hass: HomeAssistant, config: ConfigType | None = None) -> None:
         """Initialize the sensor."""
         self.hass = hass
+        self._config = config or {}
+        self._exclude_anomalous = self._config.get(CONF_EXCLUDE_ANOMALOUS_ZONES, False)
+        self._group = self._config.get(CONF_CLIMATE_GROUP, CLIMATE_GROUP)
+        self._listeners: ListenerTracker | None = None
         self._attr_is_on = False
+        self._members: frozenset[str] = frozenset()
+        self._active: set[str] = set()
+        self._unsub_members: CALLBACK_TYPE | None = None
 
     async def async_added_to_hass(self) -> None:
         """Handle added to Hass."""
-        self.async_schedule_update_ha_state(True)
-        
-        # Track state changes for all climate entities in the group
-        group_state = self.hass.states.get(CLIMATE_GROUP)
-        if group_state:
-            climate_entities = group_state.attributes.get("entity_id", [])
-            async_track_state_change(
-                self.hass, climate_entities, self._handle_climate_state_change
+        self._listeners = async_get_listener_tracker(self.hass, self.entity_id)
+        self._async_start_tracking(self._listeners)
+        self._attr_is_on = bool(self._active)
+
+        sensor_entity_id, switch_entity_id = self._automation_entity_ids
+        self.async_on_remove(
+            await setup_automations(
+                self.hass,
+                self._config,
+                self._listeners,
+                sensor_entity_id,
+                switch_entity_id,
+            )
+        )
+
+    @property
+    def _automation_entity_ids(self) -> tuple[str, str]:
+        """Return the sensor and switch driven by the automation."""
+        return CLIMATE_ACTIVE_SENSOR, CLIMATE_SWITCH
+
+    @callback
+    def _async_start_tracking(self, listeners: ListenerTracker) -> None:
+        """Track the climate group and its members."""
+        self._async_track_members(self.hass.states.get(self._group))
+
+        # Track the group itself so membership changes are picked up
+        self.async_on_remove(
+            listeners.async_track_state_change_event(
+                self._group, self._handle_group_state_change
             )
+        )
 
-    async def _handle_climate_state_change(
-        self, entity_id, old_state, new_state
-    ):
+    async def async_will_remove_from_hass(self) -> None:
+        """Stop tracking the group members."""
+        if self._unsub_members is not None:
+            self._unsub_members()
+            self._unsub_members = None
+        async_remove_listener_tracker(self.hass, self.entity_id)
+
+    @callback
+    def _async_track_members(self, group_state: State | None) -> None:
+        """Re-read the group membership and track its climate entities."""
+        if self._unsub_members is not None:
+            self._unsub_members()
+            self._unsub_members = None
+
+        self._members = frozenset(
+            group_state.attributes.get(ATTR_ENTITY_ID, ()) if group_state else ()
+        )
+        self._active = {
+            entity_id
+            for entity_id in self._members
+            if is_climate_active(
+                self.hass.states.get(entity_id), self._exclude_anomalous
+            )
+        }
+
+        if self._members and self._listeners is not None:
+            self._unsub_members = self._listeners.async_track_state_change_event(
+                self._members, self._handle_climate_state_change
+            )
+
+    @callback
+    def _handle_group_state_change(self, event: Event[EventStateChangedData]) -> None:
+        """Handle changes of the climate group."""
+        new_state = event.data["new_state"]
+        members = frozenset(
+            new_state.attributes.get(ATTR_ENTITY_ID, ()) if new_state else ()
+        )
+        if members == self._members:
+            return
+
+        self._async_track_members(new_state)
+        self._attr_is_on = bool(self._active)
+        self.async_write_ha_state()
+
+    @callback
+    def _handle_climate_state_change(
+        self, event: Event[EventStateChangedData]
+    ) -> None:
         """Handle climate state changes."""
-        await self.async_update()
+        entity_id = event.data["entity_id"]
+        is_active = is_climate_active(
+            event.data["new_state"], self._exclude_anomalous
+        )
+        if is_active == (entity_id in self._active):
+            return
+
+        if is_active:
+            self._active.add(entity_id)
+        else:
+            self._active.discard(entity_id)
+        self._attr_is_on = bool(self._active)
+        self.async_write_ha_state()
+
+    @property
+    def extra_state_attributes(self) -> dict[str, list[str]]:
+        """Return the active climate entities."""
+        return {ATTR_ACTIVE_ZONES: sorted(self._active)}
 
     async def async_update(self) -> None:
-        """Update the sensor state."""
-        group_state = self.hass.states.get(CLIMATE_GROUP)
-        if not group_state:
-            self._attr_is_on = False
-            return
+        """Rescan all group members."""
+        self._active = {
+            entity_id
+            for entity_id in self._members
+            if is_climate_active(
+                self.hass.states.get(entity_id), self._exclude_anomalous
+            )
+        }
+        self._attr_is_on = bool(self._active)
+
 
-        climate_entities = group_state.attributes.get("entity_id", [])
-        active_climates = []
+class HeatSourceDemandSensor(ClimateActiveSensor):
+    """Demand of the zones assigned to a heat source.
 
-        for entity_id in climate_entities:
-            state = self.hass.states.get(entity_id)
-            if state and state.state not in ["off", "idle"]:
-                active_climates.append(entity_id)
+    The zones are fixed by the config entry, their state changes arrive
+    through the heat source router, so a change only reaches the sources
+    of its zone.
+    """
 
-        self._attr_is_on = len(active_climates) > 0
\ No newline at end of file
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config: ConfigType,
+        entry_id: str,
+        switch_entity_id: str,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(hass, config)
+        self._attr_name = f"{config[CONF_NAME]} demand"
+        self._attr_unique_id = f"{entry_id}_demand"
+        self._zones = frozenset(config[CONF_CLIMATE_ENTITIES])
+        self._switch_entity_id = switch_entity_id
+
+    @property
+    def _automation_entity_ids(self) -> tuple[str, str]:
+        """Return the sensor and switch driven by the automation."""
+        return self.entity_id, self._switch_entity_id
+
+    @callback
+    def _async_start_tracking(self, listeners: ListenerTracker) -> None:
+        """Route the state changes of the zones to the sensor."""
+        self._members = self._zones
+        self._active = {
+            entity_id
+            for entity_id in self._members
+            if is_climate_active(
+                self.hass.states.get(entity_id), self._exclude_anomalous
+            )
+        }
+        self.async_on_remove(
+            async_get_heat_source_router(self.hass).async_add_source(
+                self.entity_id, self._zones, self._handle_climate_state_change
+            )
+        )
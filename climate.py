@@ -1,23 +1,46 @@
 """Platform for Climate Control integration."""
 from __future__ import annotations
 
+import asyncio
+from collections import Counter
+from collections.abc import Callable, Mapping
+from datetime import datetime, timedelta
 import logging
+import time
 from typing import Any
 
+import voluptuous as vol
+
 from homeassistant.components.climate import (
     ClimateEntity,
     ClimateEntityFeature,
     HVACMode,
 )
-from homeassistant.components.climate.const import ATTR_TEMPERATURE
+from homeassistant.components.climate.const import ATTR_CURRENT_TEMPERATURE
 from homeassistant.components import mqtt
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
+    ATTR_TEMPERATURE,
     CONF_NAME,
     UnitOfTemperature,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    HomeAssistant,
+    ServiceResponse,
+    State,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv, entity_platform
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
 
 from .const import (
     DOMAIN,
@@ -25,20 +48,84 @@ from .const import (
     CONF_MAX_TEMP,
     CONF_TEMP_STEP,
     CONF_PRECISION,
+    CONF_COMMAND_DEBOUNCE,
+    CONF_COMMAND_MAX_LATENCY,
+    CONF_STATE_WRITE_WINDOW,
+    CONF_CURRENT_TEMPERATURE_MIN_INTERVAL,
+    CONF_CURRENT_TEMPERATURE_DEADBAND,
+    CONF_STALE_TIMEOUT,
+    CONF_RESPONSE_TIME,
+    CONF_MIN_RISE,
+    CONF_JUMP_LIMIT,
     CONF_MODE_COMMAND_TOPIC,
     CONF_MODE_STATE_TOPIC,
     CONF_TEMPERATURE_COMMAND_TOPIC,
     CONF_TEMPERATURE_STATE_TOPIC,
     CONF_CURRENT_TEMPERATURE_TOPIC,
+    CONF_STATE_TOPIC,
+    CONF_POWER_COMMAND_TOPIC,
+    CONF_POWER_STATE_TOPIC,
+    CONF_FAN_MODE_COMMAND_TOPIC,
+    CONF_FAN_MODE_STATE_TOPIC,
+    CONF_MODE_STATE_DECODER,
+    CONF_TEMPERATURE_STATE_DECODER,
+    CONF_CURRENT_TEMPERATURE_DECODER,
+    CONF_TEMPERATURE_COMMAND_TEMPLATE,
     DEFAULT_MIN_TEMP,
     DEFAULT_MAX_TEMP,
     DEFAULT_TEMP_STEP,
     DEFAULT_PRECISION,
+    DEFAULT_COMMAND_DEBOUNCE,
+    DEFAULT_COMMAND_MAX_LATENCY,
+    DEFAULT_STATE_WRITE_WINDOW,
+    DEFAULT_CURRENT_TEMPERATURE_MIN_INTERVAL,
+    DEFAULT_CURRENT_TEMPERATURE_DEADBAND,
+    DEFAULT_STALE_TIMEOUT,
+    DEFAULT_RESPONSE_TIME,
+    DEFAULT_MIN_RISE,
+    DEFAULT_JUMP_LIMIT,
+    DEFAULT_DECODER,
+    DEFAULT_TEMPERATURE_COMMAND_TEMPLATE,
+    DEFAULT_STATE_MODE_PATH,
+    DEFAULT_STATE_TEMPERATURE_PATH,
+    DEFAULT_STATE_CURRENT_TEMPERATURE_PATH,
+    DEFAULT_PAYLOAD_ON,
+    DEFAULT_PAYLOAD_OFF,
+    SERVICE_SCHEDULE_PREHEAT,
+    ATTR_PREHEAT_AT,
+    ATTR_PREHEAT_TEMPERATURE,
+    ATTR_PREHEAT_START,
+    PREHEAT_MAX_LEAD_TIME,
+    SIGNAL_OPTIONS_UPDATED,
+    SERVICE_GET_TEMPERATURE_HISTORY,
+    ATTR_TEMPERATURE_MEAN,
+    ATTR_TEMPERATURE_MIN,
+    ATTR_TEMPERATURE_MAX,
+    ATTR_TEMPERATURE_RATE,
+    ATTR_ANOMALIES,
     HVAC_MODES,
+    FAN_MODES,
 )
+from .anomaly import AnomalyDetector
+from .batcher import StateWriteBatcher
+from .coalescer import CommandCoalescer
+from .decoder import DECODER_JSON, PayloadDecoder
+from .formatter import SetpointFormatter
+from .gate import InboundGate
+from .history import TemperatureHistory
+from .models import ClimateControlData
+from .reconcile import ATTR_UNCONFIRMED, CommandReconciler
+from .router import TopicRouter
+from .thermal import ThermalModel
+from .zones import expand_zones, subscription_filters
 
 _LOGGER = logging.getLogger(__name__)
 
+PREHEAT_RECHECK_INTERVAL = timedelta(minutes=5)
+
+# Publishes in flight at once for a group command
+GROUP_COMMAND_CONCURRENCY = 8
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -46,50 +133,209 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the Climate Control platform."""
-    config = config_entry.data
-    
-    async_add_entities(
-        [ClimateController(hass, config, config_entry.entry_id)],
-        True,
+    data: ClimateControlData = hass.data[DOMAIN][config_entry.entry_id]
+    config = data.config
+
+    controllers = [
+        ClimateController(
+            hass,
+            zone_config,
+            config_entry.entry_id
+            if zone is None
+            else f"{config_entry.entry_id}_{zone}",
+            data.router,
+            zone,
+        )
+        for zone, zone_config in expand_zones(config)
+    ]
+    data.controllers.update(
+        (controller.unique_id, controller) for controller in controllers
+    )
+    entities: list[ClimateEntity] = list(controllers)
+    if controllers[0].zone is not None:
+        entities.append(
+            ZoneGroupClimate(hass, f"{config_entry.entry_id}_group", controllers)
+        )
+    async_add_entities(entities, True)
+
+    # One subscription per topic filter, shared by all zones of the entry,
+    # made in the background so the setup does not wait for the MQTT client
+    config_entry.async_create_background_task(
+        hass,
+        data.router.async_subscribe_when_ready(subscription_filters(config)),
+        f"{DOMAIN} subscribe {config_entry.entry_id}",
+    )
+
+    platform = entity_platform.async_get_current_platform()
+    platform.async_register_entity_service(
+        SERVICE_SCHEDULE_PREHEAT,
+        {
+            vol.Required(ATTR_TEMPERATURE): vol.Coerce(float),
+            vol.Required(ATTR_PREHEAT_AT): cv.datetime,
+        },
+        "async_schedule_preheat",
+    )
+    platform.async_register_entity_service(
+        SERVICE_GET_TEMPERATURE_HISTORY,
+        {},
+        "async_get_temperature_history",
+        supports_response=SupportsResponse.ONLY,
     )
 
 
-class ClimateController(ClimateEntity):
+class ClimateController(ClimateEntity, RestoreEntity):
     """Representation of a Climate Control device."""
 
     _attr_has_entity_name = True
     _attr_name = None
     _enable_turn_on_off_backwards_compatibility = False
+    _unrecorded_attributes = frozenset(
+        {
+            ATTR_TEMPERATURE_MEAN,
+            ATTR_TEMPERATURE_MIN,
+            ATTR_TEMPERATURE_MAX,
+            ATTR_TEMPERATURE_RATE,
+            "current_temperature_forwarded",
+            "current_temperature_dropped",
+        }
+    )
 
     def __init__(
         self,
         hass: HomeAssistant,
         config: dict[str, Any],
-        entry_id: str,
+        unique_id: str,
+        router: TopicRouter,
+        zone: str | None = None,
     ) -> None:
         """Initialize the climate device."""
         self.hass = hass
         self._config = config
-        self._attr_unique_id = entry_id
+        self._router = router
+        self._attr_unique_id = unique_id
+        self.zone = zone
+        # Named after its device, the zone or the device of the entry
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, unique_id)},
+            name=zone if zone is not None else config.get(CONF_NAME),
+        )
         
         # Temperature settings
-        self._attr_min_temp = config.get(CONF_MIN_TEMP, DEFAULT_MIN_TEMP)
-        self._attr_max_temp = config.get(CONF_MAX_TEMP, DEFAULT_MAX_TEMP)
-        self._attr_target_temperature_step = config.get(
-            CONF_TEMP_STEP, DEFAULT_TEMP_STEP
-        )
-        self._attr_precision = config.get(CONF_PRECISION, DEFAULT_PRECISION)
+        self._apply_temperature_settings(config)
         
         # MQTT topics
         self._mode_command_topic = config[CONF_MODE_COMMAND_TOPIC]
-        self._mode_state_topic = config[CONF_MODE_STATE_TOPIC]
+        self._mode_state_topic = config.get(CONF_MODE_STATE_TOPIC)
         self._temp_command_topic = config[CONF_TEMPERATURE_COMMAND_TOPIC]
-        self._temp_state_topic = config[CONF_TEMPERATURE_STATE_TOPIC]
-        self._current_temp_topic = config[CONF_CURRENT_TEMPERATURE_TOPIC]
+        self._temp_state_topic = config.get(CONF_TEMPERATURE_STATE_TOPIC)
+        self._current_temp_topic = config.get(CONF_CURRENT_TEMPERATURE_TOPIC)
+        self._state_topic = config.get(CONF_STATE_TOPIC)
+        self._power_command_topic = config.get(CONF_POWER_COMMAND_TOPIC)
+        self._power_state_topic = config.get(CONF_POWER_STATE_TOPIC)
+        self._fan_mode_command_topic = config.get(CONF_FAN_MODE_COMMAND_TOPIC)
+        self._fan_mode_state_topic = config.get(CONF_FAN_MODE_STATE_TOPIC)
+
+        # Payload decoders, compiled once
+        self._mode_decoder = PayloadDecoder(
+            config.get(CONF_MODE_STATE_DECODER, DEFAULT_DECODER)
+        )
+        self._temp_decoder = PayloadDecoder(
+            config.get(CONF_TEMPERATURE_STATE_DECODER, DEFAULT_DECODER)
+        )
+        self._current_temp_decoder = PayloadDecoder(
+            config.get(CONF_CURRENT_TEMPERATURE_DECODER, DEFAULT_DECODER)
+        )
+        self._state_decoders = tuple(
+            decoder
+            if decoder.path is not None
+            else PayloadDecoder(f"{DECODER_JSON}:{default_path}")
+            for decoder, default_path in (
+                (self._mode_decoder, DEFAULT_STATE_MODE_PATH),
+                (self._temp_decoder, DEFAULT_STATE_TEMPERATURE_PATH),
+                (self._current_temp_decoder, DEFAULT_STATE_CURRENT_TEMPERATURE_PATH),
+            )
+        )
+
+        # Outbound commands, retried until the state topics confirm them
+        self._command_names = {
+            topic: name
+            for topic, name, confirmed in (
+                (
+                    self._mode_command_topic,
+                    "mode",
+                    self._mode_state_topic or self._state_topic,
+                ),
+                (
+                    self._temp_command_topic,
+                    "temperature",
+                    self._temp_state_topic or self._state_topic,
+                ),
+                (self._power_command_topic, "power", self._power_state_topic),
+                (self._fan_mode_command_topic, "fan_mode", self._fan_mode_state_topic),
+            )
+            if topic and confirmed
+        }
+        self._reconciler = CommandReconciler(
+            hass,
+            self._async_publish,
+            self._command_names,
+            self._async_unconfirmed_changed,
+        )
+        self._commands = CommandCoalescer(
+            hass,
+            self._async_publish,
+            config.get(CONF_COMMAND_DEBOUNCE, DEFAULT_COMMAND_DEBOUNCE),
+            config.get(CONF_COMMAND_MAX_LATENCY, DEFAULT_COMMAND_MAX_LATENCY),
+            router.instrumentation,
+            self._reconciler,
+        )
+
+        # Noisy current temperatures are rate limited, the deadband is given
+        # in units of the precision
+        self._current_temp_deadband = config.get(
+            CONF_CURRENT_TEMPERATURE_DEADBAND, DEFAULT_CURRENT_TEMPERATURE_DEADBAND
+        )
+        self._current_temp_gate = InboundGate(
+            hass,
+            self._async_set_current_temp,
+            config.get(
+                CONF_CURRENT_TEMPERATURE_MIN_INTERVAL,
+                DEFAULT_CURRENT_TEMPERATURE_MIN_INTERVAL,
+            ),
+            self._current_temp_deadband * self._attr_precision,
+        )
+
+        # Inbound updates are merged into a single state write
+        self._state_writes = StateWriteBatcher(
+            hass,
+            self._async_write_state,
+            config.get(CONF_STATE_WRITE_WINDOW, DEFAULT_STATE_WRITE_WINDOW),
+        )
+
+        # Dead sensors, zones not warming up and implausible readings
+        self._anomalies = AnomalyDetector(
+            hass,
+            self._async_anomalies_changed,
+            config.get(CONF_STALE_TIMEOUT, DEFAULT_STALE_TIMEOUT),
+            config.get(CONF_RESPONSE_TIME, DEFAULT_RESPONSE_TIME),
+            config.get(CONF_MIN_RISE, DEFAULT_MIN_RISE),
+            config.get(CONF_JUMP_LIMIT, DEFAULT_JUMP_LIMIT),
+        )
         
         # State
         self._attr_hvac_modes = HVAC_MODES
+        self._hvac_mode_lookup = {mode: HVACMode(mode) for mode in HVAC_MODES}
+        self._fan_mode_lookup = frozenset(FAN_MODES)
         self._attr_hvac_mode = HVACMode.OFF
+        self._power: bool | None = None
+
+        # Pre-heat scheduling
+        self._thermal = ThermalModel()
+        self._history = TemperatureHistory()
+        self._preheat: tuple[datetime, float] | None = None
+        self._preheat_start: datetime | None = None
+        self._unsub_preheat: CALLBACK_TYPE | None = None
+        self._update_listeners: list[Callable[[ClimateController], None]] = []
         self._attr_target_temperature = self.min_temp
         self._attr_current_temperature = None
         self._attr_temperature_unit = UnitOfTemperature.CELSIUS
@@ -100,77 +346,655 @@ class ClimateController(ClimateEntity):
             | ClimateEntityFeature.TURN_OFF
             | ClimateEntityFeature.TURN_ON
         )
+        if self._fan_mode_command_topic:
+            self._attr_fan_modes = FAN_MODES
+            self._attr_fan_mode = None
+            self._attr_supported_features |= ClimateEntityFeature.FAN_MODE
 
     async def async_added_to_hass(self) -> None:
-        """Subscribe to MQTT events."""
-        await mqtt.async_subscribe(
-            self.hass,
-            self._mode_state_topic,
-            self._handle_mode_state,
-            1,
+        """Restore the last state and register the MQTT handlers."""
+        # Restored values are only shown until the device reports, nothing
+        # is published for them
+        if (last_state := await self.async_get_last_state()) is not None:
+            self._async_restore(last_state)
+
+        for topic, handler in (
+            (self._mode_state_topic, self._handle_mode_state),
+            (self._temp_state_topic, self._handle_temp_state),
+            (self._current_temp_topic, self._handle_current_temp),
+            (self._state_topic, self._handle_state),
+            (self._power_state_topic, self._handle_power_state),
+            (self._fan_mode_state_topic, self._handle_fan_mode_state),
+        ):
+            if topic:
+                self.async_on_remove(self._router.async_register(topic, handler))
+        if self._current_temp_topic or self._state_topic:
+            self._anomalies.async_start()
+
+        if (entry := self.platform.config_entry) is not None:
+            self.async_on_remove(
+                async_dispatcher_connect(
+                    self.hass,
+                    SIGNAL_OPTIONS_UPDATED.format(entry.entry_id),
+                    self._async_options_updated,
+                )
+            )
+
+    def _apply_temperature_settings(self, config: Mapping[str, Any]) -> None:
+        """Set the temperature limits, step, precision and setpoint payload."""
+        self._attr_min_temp = config.get(CONF_MIN_TEMP, DEFAULT_MIN_TEMP)
+        self._attr_max_temp = config.get(CONF_MAX_TEMP, DEFAULT_MAX_TEMP)
+        self._attr_target_temperature_step = config.get(
+            CONF_TEMP_STEP, DEFAULT_TEMP_STEP
         )
-        await mqtt.async_subscribe(
-            self.hass,
-            self._temp_state_topic,
-            self._handle_temp_state,
-            1,
+        self._attr_precision = config.get(CONF_PRECISION, DEFAULT_PRECISION)
+        self._setpoint = SetpointFormatter(
+            config.get(
+                CONF_TEMPERATURE_COMMAND_TEMPLATE,
+                DEFAULT_TEMPERATURE_COMMAND_TEMPLATE,
+            ),
+            self._attr_target_temperature_step,
+            self._attr_min_temp,
+            self._attr_max_temp,
         )
-        await mqtt.async_subscribe(
-            self.hass,
-            self._current_temp_topic,
-            self._handle_current_temp,
-            1,
+
+    @callback
+    def _async_options_updated(
+        self, zone_configs: Mapping[str | None, Mapping[str, Any]]
+    ) -> None:
+        """Apply updated temperature settings without a reload."""
+        if (config := zone_configs.get(self.zone)) is None:
+            return
+        self._apply_temperature_settings(config)
+        self._current_temp_gate.deadband = (
+            self._current_temp_deadband * self._attr_precision
+        )
+        self._state_writes.async_schedule()
+
+    @callback
+    def _async_restore(self, last_state: State) -> None:
+        """Restore mode, setpoint and current temperature."""
+        if (mode := self._hvac_mode_lookup.get(last_state.state)) is not None:
+            self._attr_hvac_mode = mode
+        for attr, key in (
+            ("_attr_target_temperature", ATTR_TEMPERATURE),
+            ("_attr_current_temperature", ATTR_CURRENT_TEMPERATURE),
+        ):
+            try:
+                if (value := last_state.attributes.get(key)) is not None:
+                    setattr(self, attr, float(value))
+            except (TypeError, ValueError):
+                _LOGGER.debug("Could not restore %s of %s", key, self.entity_id)
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Drop queued commands, retries, state writes and pre-heat timers."""
+        self._commands.async_shutdown()
+        self._reconciler.async_shutdown()
+        self._current_temp_gate.async_shutdown()
+        self._anomalies.async_shutdown()
+        self._state_writes.async_shutdown()
+        if self._unsub_preheat is not None:
+            self._unsub_preheat()
+            self._unsub_preheat = None
+
+    @callback
+    def async_add_listener(
+        self, update_callback: Callable[[ClimateController], None]
+    ) -> CALLBACK_TYPE:
+        """Call a callback with the entity after each state write."""
+        self._update_listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._update_listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def _async_unconfirmed_changed(self) -> None:
+        """Show the commands waiting for confirmation."""
+        self._state_writes.async_schedule()
+
+    @callback
+    def _async_anomalies_changed(self) -> None:
+        """Log and show the anomalies of the zone."""
+        if flags := self._anomalies.flags:
+            _LOGGER.warning(
+                "%s looks anomalous: %s", self.entity_id, ", ".join(sorted(flags))
+            )
+        self._state_writes.async_schedule()
+
+    @callback
+    def _async_write_state(self) -> None:
+        """Write the state and notify the listeners."""
+        self.async_write_ha_state()
+        for update_callback in self._update_listeners:
+            update_callback(self)
+
+    @property
+    def power(self) -> bool | None:
+        """Return the reported state of the power channel."""
+        return self._power
+
+    @property
+    def has_power_channel(self) -> bool:
+        """Return True if the device is turned on and off by its power topic."""
+        return bool(self._power_command_topic)
+
+    @property
+    def power_unconfirmed(self) -> bool:
+        """Return True if a power command waits for confirmation."""
+        return (
+            self.has_power_channel
+            and self._reconciler.pending_payload(self._power_command_topic)
+            is not None
+        )
+
+    @property
+    def hvac_mode(self) -> HVACMode | None:
+        """Return the HVAC mode, which is off while the power is off."""
+        if self._power is False:
+            return HVACMode.OFF
+        return self._attr_hvac_mode
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the command and temperature statistics and the pre-heat."""
+        attributes: dict[str, Any] = {
+            "commands_published": self._commands.published,
+            "commands_suppressed": self._commands.suppressed,
+            "commands_retried": self._reconciler.retries,
+            ATTR_UNCONFIRMED: [
+                self._command_names[topic] for topic in self._reconciler.unconfirmed
+            ],
+            ATTR_ANOMALIES: sorted(self._anomalies.flags),
+        }
+        if self._current_temp_gate.enabled:
+            attributes["current_temperature_forwarded"] = (
+                self._current_temp_gate.forwarded
+            )
+            attributes["current_temperature_dropped"] = self._current_temp_gate.dropped
+        if self._history.count:
+            statistics = self._history.statistics()
+            attributes[ATTR_TEMPERATURE_MEAN] = round(statistics["current_mean"], 2)
+            attributes[ATTR_TEMPERATURE_MIN] = statistics["current_min"]
+            attributes[ATTR_TEMPERATURE_MAX] = statistics["current_max"]
+            if (rate := statistics["rate"]) is not None:
+                attributes[ATTR_TEMPERATURE_RATE] = round(rate, 2)
+        if self._preheat is not None:
+            attributes[ATTR_PREHEAT_TEMPERATURE] = self._preheat[1]
+            attributes[ATTR_PREHEAT_START] = self._preheat_start
+        return attributes
+
+    async def _async_publish(self, topic: str, payload: str) -> None:
+        """Publish a command to the device."""
+        await mqtt.async_publish(self.hass, topic, payload, 0, False)
+
+    @callback
+    def _async_parse_failed(self, msg, kind: str) -> None:
+        """Count and log a payload that could not be handled."""
+        self._router.instrumentation.record_parse_failure(msg.topic, msg.payload)
+        _LOGGER.error(
+            "Could not handle %s update on %s: %r", kind, msg.topic, msg.payload
         )
 
-    async def _handle_mode_state(self, msg):
+    @callback
+    def _handle_mode_state(self, msg):
         """Handle updates to the HVAC mode."""
         try:
-            payload = msg.payload
-            if payload in self.hvac_modes:
-                self._attr_hvac_mode = payload
-                self.async_write_ha_state()
+            self._async_update_mode(self._mode_decoder(msg.payload))
         except Exception:
-            _LOGGER.error("Could not handle mode state update")
+            self._async_parse_failed(msg, "mode state")
 
-    async def _handle_temp_state(self, msg):
+    @callback
+    def _handle_temp_state(self, msg):
         """Handle updates to the target temperature."""
         try:
-            self._attr_target_temperature = float(msg.payload)
-            self.async_write_ha_state()
-        except ValueError:
-            _LOGGER.error("Could not handle temperature state update")
+            self._async_update_target_temp(self._temp_decoder(msg.payload))
+        except (TypeError, ValueError):
+            self._async_parse_failed(msg, "temperature state")
 
-    async def _handle_current_temp(self, msg):
+    @callback
+    def _handle_current_temp(self, msg):
         """Handle updates to the current temperature."""
         try:
-            self._attr_current_temperature = float(msg.payload)
-            self.async_write_ha_state()
-        except ValueError:
-            _LOGGER.error("Could not handle current temperature update")
+            self._async_update_current_temp(self._current_temp_decoder(msg.payload))
+        except (TypeError, ValueError):
+            self._async_parse_failed(msg, "current temperature")
+
+    @callback
+    def _handle_state(self, msg):
+        """Handle updates to the combined state, parsing the JSON once."""
+        mode_decoder, temp_decoder, current_temp_decoder = self._state_decoders
+        try:
+            state = json_loads(msg.payload)
+            self._async_update_mode(mode_decoder.extract(state))
+            self._async_update_target_temp(temp_decoder.extract(state))
+            self._async_update_current_temp(current_temp_decoder.extract(state))
+        except (TypeError, ValueError):
+            self._async_parse_failed(msg, "state")
+
+    @callback
+    def _handle_power_state(self, msg):
+        """Handle updates to the power state."""
+        payload = msg.payload
+        if payload not in (DEFAULT_PAYLOAD_ON, DEFAULT_PAYLOAD_OFF):
+            self._async_parse_failed(msg, "power state")
+            return
+        self._commands.async_acknowledge(self._power_command_topic, payload)
+        if (power := payload == DEFAULT_PAYLOAD_ON) != self._power:
+            self._power = power
+            self._state_writes.async_schedule()
+
+    @callback
+    def _handle_fan_mode_state(self, msg):
+        """Handle updates to the fan mode."""
+        payload = msg.payload
+        if payload not in self._fan_mode_lookup:
+            return
+        self._commands.async_acknowledge(self._fan_mode_command_topic, payload)
+        if payload != self._attr_fan_mode:
+            self._attr_fan_mode = payload
+            self._state_writes.async_schedule()
+
+    @callback
+    def _async_update_mode(self, value: Any) -> None:
+        """Update the HVAC mode from a decoded value."""
+        if value is None or (mode := self._hvac_mode_lookup.get(str(value))) is None:
+            return
+        self._commands.async_acknowledge(self._mode_command_topic, mode)
+        if mode != self._attr_hvac_mode:
+            self._attr_hvac_mode = mode
+            self._state_writes.async_schedule()
+
+    @callback
+    def _async_update_target_temp(self, value: Any) -> None:
+        """Update the target temperature from a decoded value."""
+        if value is None:
+            return
+        temperature = self._setpoint.parse(value)
+        self._commands.async_acknowledge(
+            self._temp_command_topic, self._setpoint.confirmed_payload(value)
+        )
+        if temperature != self._attr_target_temperature:
+            self._attr_target_temperature = temperature
+            self._state_writes.async_schedule()
+
+    @callback
+    def _async_update_current_temp(self, value: Any) -> None:
+        """Update the current temperature from a decoded value."""
+        if value is None:
+            return
+        temperature = float(value)
+        self._anomalies.async_sample(temperature, self._heat_demanded(temperature))
+        if self._current_temp_gate.enabled:
+            self._current_temp_gate.async_offer(temperature)
+        else:
+            self._async_set_current_temp(temperature)
+
+    def _heat_demanded(self, temperature: float) -> bool:
+        """Return True if the zone heats towards its target temperature."""
+        return (
+            self.hvac_mode in (HVACMode.HEAT, HVACMode.AUTO)
+            and temperature < self._attr_target_temperature
+        )
+
+    @callback
+    def _async_set_current_temp(self, temperature: float) -> None:
+        """Set the current temperature once it passed the gate."""
+        self._thermal.add_sample(
+            self.hass.loop.time(), temperature, self._heat_demanded(temperature)
+        )
+        self._history.add(time.time(), temperature, self._attr_target_temperature)
+        current = self._attr_current_temperature
+        # Changes below the display precision are not worth a state write
+        if current is None or abs(temperature - current) >= self.precision:
+            self._attr_current_temperature = temperature
+            self._state_writes.async_schedule()
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
         if (temperature := kwargs.get(ATTR_TEMPERATURE)) is None:
             return
 
-        await mqtt.async_publish(
-            self.hass,
-            self._temp_command_topic,
-            temperature,
-            0,
-            False,
+        self._commands.async_queue(
+            self._temp_command_topic, self._setpoint_payload(temperature)
         )
 
+    def _setpoint_payload(self, temperature: float) -> str:
+        """Return the command payload of a setpoint on the step grid."""
+        return self._setpoint.format(self._setpoint.quantize(float(temperature)))
+
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set HVAC mode."""
+        for topic, payload in self._hvac_mode_commands(hvac_mode):
+            self._commands.async_queue(topic, payload)
+
+    def _hvac_mode_commands(self, hvac_mode: HVACMode) -> list[tuple[str, str]]:
+        """Return the (topic, payload) commands that set an HVAC mode."""
         if hvac_mode not in self.hvac_modes:
             _LOGGER.error("Unsupported HVAC mode: %s", hvac_mode)
+            return []
+
+        commands: list[tuple[str, str]] = []
+        if self._power_command_topic:
+            # Devices with a power channel are switched off through it
+            if hvac_mode == HVACMode.OFF:
+                return [(self._power_command_topic, DEFAULT_PAYLOAD_OFF)]
+            if self._power is not True:
+                commands.append((self._power_command_topic, DEFAULT_PAYLOAD_ON))
+        commands.append((self._mode_command_topic, str(hvac_mode)))
+        return commands
+
+    async def async_apply_group_command(
+        self,
+        temperature: float | None = None,
+        hvac_mode: HVACMode | None = None,
+    ) -> None:
+        """Publish the commands of a group immediately, without the debounce."""
+        commands: list[tuple[str, str]] = []
+        if hvac_mode is not None:
+            commands.extend(self._hvac_mode_commands(hvac_mode))
+        if temperature is not None:
+            commands.append(
+                (self._temp_command_topic, self._setpoint_payload(temperature))
+            )
+        for topic, payload in commands:
+            await self._commands.async_publish_now(topic, payload)
+
+    async def async_turn_on(self) -> None:
+        """Turn the device on."""
+        if not self._power_command_topic:
+            await super().async_turn_on()
             return
+        self._commands.async_queue(self._power_command_topic, DEFAULT_PAYLOAD_ON)
 
-        await mqtt.async_publish(
+    async def async_turn_off(self) -> None:
+        """Turn the device off."""
+        if not self._power_command_topic:
+            await super().async_turn_off()
+            return
+        self._commands.async_queue(self._power_command_topic, DEFAULT_PAYLOAD_OFF)
+
+    async def async_set_fan_mode(self, fan_mode: str) -> None:
+        """Set the fan mode."""
+        if not self._fan_mode_command_topic or fan_mode not in self._fan_mode_lookup:
+            _LOGGER.error("Unsupported fan mode: %s", fan_mode)
+            return
+
+        self._commands.async_queue(self._fan_mode_command_topic, fan_mode)
+
+    async def async_get_temperature_history(self) -> ServiceResponse:
+        """Return the buffered temperature samples and their statistics."""
+        return {
+            "statistics": self._history.statistics(),
+            "samples": [
+                {
+                    **sample,
+                    "timestamp": dt_util.utc_from_timestamp(
+                        sample["timestamp"]
+                    ).isoformat(),
+                }
+                for sample in self._history.samples()
+            ],
+        }
+
+    async def async_schedule_preheat(self, temperature: float, at: datetime) -> None:
+        """Reach a target temperature at a given time.
+
+        The setpoint is sent early by the time the learned heating rate needs
+        to heat the zone from its current temperature.
+        """
+        self._preheat = (dt_util.as_utc(at), temperature)
+        self._async_check_preheat()
+        self.async_write_ha_state()
+
+    @callback
+    def _async_check_preheat(self, _now: datetime | None = None) -> None:
+        """Send the scheduled setpoint once the pre-heat has to start."""
+        if self._unsub_preheat is not None:
+            self._unsub_preheat()
+            self._unsub_preheat = None
+        if self._preheat is None:
+            return
+
+        at, temperature = self._preheat
+        lead_time = self._thermal.lead_time(
+            self._attr_current_temperature, temperature, PREHEAT_MAX_LEAD_TIME
+        )
+        self._preheat_start = at - timedelta(seconds=lead_time)
+        now = dt_util.utcnow()
+
+        if now >= self._preheat_start:
+            self._preheat = self._preheat_start = None
+            self.hass.async_create_task(
+                self.async_set_temperature(**{ATTR_TEMPERATURE: temperature})
+            )
+            self._state_writes.async_schedule()
+            return
+
+        # The lead time is refined as the temperature changes
+        self._unsub_preheat = async_track_point_in_utc_time(
             self.hass,
-            self._mode_command_topic,
-            hvac_mode,
-            0,
-            False,
-        ) 
\ No newline at end of file
+            self._async_check_preheat,
+            min(self._preheat_start, now + PREHEAT_RECHECK_INTERVAL),
+        )
+
+
+def _replace_value(
+    values: dict[str, float], key: str, value: float | None
+) -> float | None:
+    """Store the value of a key, returning the change of the sum or None."""
+    old = values.get(key)
+    if value == old:
+        return None
+    if value is None:
+        del values[key]
+    else:
+        values[key] = value
+    return (value or 0.0) - (old or 0.0)
+
+
+class ZoneGroupClimate(ClimateEntity):
+    """Aggregate of all zones of a zone bank.
+
+    The mean temperatures and the mode counts are updated from the state
+    writes of the zones, one zone at a time. Commands are sent to all zones
+    at once with a bounded number of concurrent publishes.
+    """
+
+    _attr_has_entity_name = True
+    _attr_name = "All zones"
+    _attr_should_poll = False
+    _attr_hvac_modes = HVAC_MODES
+    _attr_supported_features = ClimateEntityFeature.TARGET_TEMPERATURE
+    _attr_temperature_unit = UnitOfTemperature.CELSIUS
+    _enable_turn_on_off_backwards_compatibility = False
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        unique_id: str,
+        members: list[ClimateController],
+    ) -> None:
+        """Initialize the group."""
+        self.hass = hass
+        self._attr_unique_id = unique_id
+        self._members = members
+
+        self._currents: dict[str, float] = {}
+        self._targets: dict[str, float] = {}
+        self._modes: dict[str, HVACMode] = {}
+        self._current_sum = 0.0
+        self._target_sum = 0.0
+        # Lowest and highest current temperature, None until read again once
+        # the zone holding either moved inwards or left
+        self._current_spread: tuple[float, float] | None = None
+        self._mode_counts: Counter[HVACMode] = Counter()
+        self._failed_zones: list[str] = []
+        self._state_writes = StateWriteBatcher(hass, self.async_write_ha_state, 0)
+
+    async def async_added_to_hass(self) -> None:
+        """Aggregate the zones and follow their updates."""
+        for member in self._members:
+            self._async_update_member(member)
+            self.async_on_remove(member.async_add_listener(self._handle_member_update))
+        if (entry := self.platform.config_entry) is not None:
+            # The limits of the zones may change with the options
+            self.async_on_remove(
+                async_dispatcher_connect(
+                    self.hass,
+                    SIGNAL_OPTIONS_UPDATED.format(entry.entry_id),
+                    self._async_options_updated,
+                )
+            )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Drop a scheduled state write."""
+        self._state_writes.async_shutdown()
+
+    @callback
+    def _async_options_updated(
+        self, zone_configs: Mapping[str | None, Mapping[str, Any]]
+    ) -> None:
+        """Show the updated temperature limits of the zones."""
+        self._state_writes.async_schedule()
+
+    @callback
+    def _handle_member_update(self, member: ClimateController) -> None:
+        """Handle the state write of a zone."""
+        if self._async_update_member(member):
+            self._state_writes.async_schedule()
+
+    @callback
+    def _async_update_member(self, member: ClimateController) -> bool:
+        """Replace the values of a zone in the aggregate, return if changed."""
+        zone = member.zone
+        old_current = self._currents.get(zone)
+        current_delta = _replace_value(self._currents, zone, member.current_temperature)
+        target_delta = _replace_value(self._targets, zone, member.target_temperature)
+        if current_delta is not None:
+            self._current_sum += current_delta
+            self._async_update_spread(old_current, member.current_temperature)
+        if target_delta is not None:
+            self._target_sum += target_delta
+
+        mode = member.hvac_mode
+        if (old_mode := self._modes.get(zone)) == mode:
+            return current_delta is not None or target_delta is not None
+        if old_mode is not None:
+            self._mode_counts[old_mode] -= 1
+        if mode is None:
+            del self._modes[zone]
+        else:
+            self._modes[zone] = mode
+            self._mode_counts[mode] += 1
+        return True
+
+    @callback
+    def _async_update_spread(self, old: float | None, new: float | None) -> None:
+        """Widen the spread by the new current temperature of a zone.
+
+        The spread is dropped, to be found again when read, only if the zone
+        held the lowest or highest temperature and gave it up.
+        """
+        if (spread := self._current_spread) is None:
+            return
+        low, high = spread
+        if old is not None and (
+            (old == low and (new is None or new > low))
+            or (old == high and (new is None or new < high))
+        ):
+            self._current_spread = None
+        elif new is not None:
+            self._current_spread = (min(low, new), max(high, new))
+
+    @property
+    def min_temp(self) -> float:
+        """Return the lowest temperature all zones accept."""
+        return max(member.min_temp for member in self._members)
+
+    @property
+    def max_temp(self) -> float:
+        """Return the highest temperature all zones accept."""
+        return min(member.max_temp for member in self._members)
+
+    @property
+    def target_temperature_step(self) -> float | None:
+        """Return the temperature step of the zones."""
+        return self._members[0].target_temperature_step
+
+    @property
+    def current_temperature(self) -> float | None:
+        """Return the mean current temperature of the zones."""
+        if not self._currents:
+            return None
+        return round(self._current_sum / len(self._currents), 2)
+
+    @property
+    def target_temperature(self) -> float | None:
+        """Return the mean target temperature of the zones."""
+        if not self._targets:
+            return None
+        return round(self._target_sum / len(self._targets), 2)
+
+    @property
+    def hvac_mode(self) -> HVACMode | None:
+        """Return the mode most zones are in, preferring active modes."""
+        counts = [(count, mode) for mode, count in self._mode_counts.items() if count]
+        if not counts:
+            return None
+        return max(counts, key=lambda item: (item[0], item[1] != HVACMode.OFF))[1]
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the temperature spread and the zones of the last failure."""
+        attributes: dict[str, Any] = {"zones": len(self._members)}
+        if self._currents:
+            if self._current_spread is None:
+                currents = self._currents.values()
+                self._current_spread = (min(currents), max(currents))
+            low, high = self._current_spread
+            attributes[ATTR_TEMPERATURE_MIN] = low
+            attributes[ATTR_TEMPERATURE_MAX] = high
+        if self._failed_zones:
+            attributes["failed_zones"] = self._failed_zones
+        return attributes
+
+    async def async_set_temperature(self, **kwargs: Any) -> None:
+        """Set the target temperature of all zones."""
+        if (temperature := kwargs.get(ATTR_TEMPERATURE)) is None:
+            return
+        await self._async_fan_out(temperature=temperature)
+
+    async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
+        """Set the HVAC mode of all zones."""
+        await self._async_fan_out(hvac_mode=hvac_mode)
+
+    async def _async_fan_out(self, **command: Any) -> None:
+        """Apply a command to all zones concurrently and report the failures."""
+        semaphore = asyncio.Semaphore(GROUP_COMMAND_CONCURRENCY)
+
+        async def apply(member: ClimateController) -> None:
+            async with semaphore:
+                await member.async_apply_group_command(**command)
+
+        results = await asyncio.gather(
+            *(apply(member) for member in self._members), return_exceptions=True
+        )
+        failed: list[str] = []
+        for member, result in zip(self._members, results):
+            if isinstance(result, Exception):
+                _LOGGER.error(
+                    "Group command failed for zone %s: %s", member.zone, result
+                )
+                failed.append(member.zone)
+
+        if failed != self._failed_zones:
+            self._failed_zones = failed
+            self.async_write_ha_state()
+        if failed:
+            raise HomeAssistantError(
+                f"Command failed for {len(failed)} of {len(self._members)} zones: "
+                + ", ".join(failed)
+            )
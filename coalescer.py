@@ -0,0 +1,159 @@
+"""Command coalescing for the Climate Control MQTT publishes."""
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+import logging
+from time import perf_counter
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .instrumentation import Instrumentation
+from .reconcile import CommandReconciler
+
+_LOGGER = logging.getLogger(__name__)
+
+PublishCallable = Callable[[str, str], Awaitable[None]]
+
+
+class CommandCoalescer:
+    """Debounce the commands of one entity and publish the last value per topic.
+
+    Commands queued within ``debounce`` seconds of each other are merged, but a
+    queued command is never held back for longer than ``max_latency`` seconds.
+    Commands matching the state a topic is already in or heading to are
+    dropped: the acknowledged state, unless another command was published
+    since, or the command still waiting for confirmation.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        publish: PublishCallable,
+        debounce: float,
+        max_latency: float,
+        instrumentation: Instrumentation | None = None,
+        reconciler: CommandReconciler | None = None,
+    ) -> None:
+        """Initialize the coalescer."""
+        self.hass = hass
+        self._publish = publish
+        self._instrumentation = instrumentation or Instrumentation()
+        self._reconciler = reconciler
+        self._debounce = debounce
+        self._max_latency = max(max_latency, debounce)
+        self._pending: dict[str, str] = {}
+        self._acknowledged: dict[str, str] = {}
+        self._last_published: dict[str, str] = {}
+        self._first_queued: float | None = None
+        self._unsub_flush: CALLBACK_TYPE | None = None
+
+        self.published = 0
+        self.coalesced = 0
+        self.deduplicated = 0
+
+    @property
+    def suppressed(self) -> int:
+        """Return the number of commands that were not published."""
+        return self.coalesced + self.deduplicated
+
+    @callback
+    def async_acknowledge(self, topic: str, payload: str) -> None:
+        """Record the state the device reported for a command topic."""
+        self._acknowledged[topic] = payload
+        if self._instrumentation.enabled:
+            self._instrumentation.record_echo(topic, payload)
+        if self._reconciler is not None:
+            self._reconciler.async_resolve(topic, payload)
+
+    @callback
+    def async_queue(self, topic: str, payload: str) -> None:
+        """Queue a command, replacing any pending command for the topic."""
+        if topic in self._pending:
+            self.coalesced += 1
+        self._pending[topic] = payload
+
+        now = self.hass.loop.time()
+        if self._first_queued is None:
+            self._first_queued = now
+        delay = min(self._debounce, self._first_queued + self._max_latency - now)
+
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+        self._unsub_flush = async_call_later(
+            self.hass, max(delay, 0), self._async_flush_timer
+        )
+
+    async def _async_flush_timer(self, _now: datetime) -> None:
+        """Flush the pending commands once the debounce window expired."""
+        self._unsub_flush = None
+        await self.async_flush()
+
+    async def async_flush(self) -> None:
+        """Publish all pending commands."""
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+
+        pending, self._pending = self._pending, {}
+        self._first_queued = None
+
+        for topic, payload in pending.items():
+            if self._is_current(topic, payload):
+                self._async_deduplicate(topic, payload)
+                continue
+            await self._async_send(topic, payload)
+
+    async def async_publish_now(self, topic: str, payload: str) -> None:
+        """Publish a command immediately, replacing a pending one."""
+        if self._pending.pop(topic, None) is not None:
+            self.coalesced += 1
+        if self._is_current(topic, payload):
+            self._async_deduplicate(topic, payload)
+            return
+        await self._async_send(topic, payload)
+
+    def _is_current(self, topic: str, payload: str) -> bool:
+        """Return True if the command would not change the state of a topic.
+
+        Once another command was published, the acknowledged state may be
+        stale until the device reports the new one, so only a payload equal
+        to the last published command can be current.
+        """
+        if self._last_published.get(topic, payload) != payload:
+            return False
+        if self._acknowledged.get(topic) == payload:
+            return True
+        return (
+            self._reconciler is not None
+            and self._reconciler.pending_payload(topic) == payload
+        )
+
+    @callback
+    def _async_deduplicate(self, topic: str, payload: str) -> None:
+        """Drop a command the device is already in or heading to."""
+        self.deduplicated += 1
+        _LOGGER.debug("Skipping %s on %s, already in that state", payload, topic)
+
+    async def _async_send(self, topic: str, payload: str) -> None:
+        """Publish a command, timing it while instrumented."""
+        if not self._instrumentation.enabled:
+            await self._publish(topic, payload)
+        else:
+            started = perf_counter()
+            await self._publish(topic, payload)
+            self._instrumentation.record_publish(topic, payload, started)
+        self.published += 1
+        self._last_published[topic] = payload
+        if self._reconciler is not None:
+            self._reconciler.async_track(topic, payload)
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Drop all pending commands."""
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+        self._pending.clear()
+        self._first_queued = None
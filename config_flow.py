@@ -1,15 +1,16 @@
 """Config flow for Climate Control integration."""
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+from typing import TYPE_CHECKING, Any
 
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.const import CONF_NAME
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
+from homeassistant.helpers import selector
 import homeassistant.helpers.config_validation as cv
-from homeassistant.components import mqtt
 
 from .const import (
     DOMAIN,
@@ -17,10 +18,30 @@ from .const import (
     CONF_MAX_TEMP,
     CONF_TEMP_STEP,
     CONF_PRECISION,
+    CONF_COMMAND_DEBOUNCE,
+    CONF_COMMAND_MAX_LATENCY,
+    CONF_STATE_WRITE_WINDOW,
+    CONF_INSTRUMENTATION,
+    CONF_CURRENT_TEMPERATURE_MIN_INTERVAL,
+    CONF_CURRENT_TEMPERATURE_DEADBAND,
+    CONF_STALE_TIMEOUT,
+    CONF_RESPONSE_TIME,
+    CONF_MIN_RISE,
+    CONF_JUMP_LIMIT,
     DEFAULT_MIN_TEMP,
     DEFAULT_MAX_TEMP,
     DEFAULT_TEMP_STEP,
     DEFAULT_PRECISION,
+    DEFAULT_COMMAND_DEBOUNCE,
+    DEFAULT_COMMAND_MAX_LATENCY,
+    DEFAULT_STATE_WRITE_WINDOW,
+    DEFAULT_INSTRUMENTATION,
+    DEFAULT_CURRENT_TEMPERATURE_MIN_INTERVAL,
+    DEFAULT_CURRENT_TEMPERATURE_DEADBAND,
+    DEFAULT_STALE_TIMEOUT,
+    DEFAULT_RESPONSE_TIME,
+    DEFAULT_MIN_RISE,
+    DEFAULT_JUMP_LIMIT,
     CONF_MODE_COMMAND_TOPIC,
     CONF_MODE_STATE_TOPIC,
     CONF_TEMPERATURE_COMMAND_TOPIC,
@@ -30,12 +51,73 @@ from .const import (
     CONF_POWER_STATE_TOPIC,
     CONF_FAN_MODE_COMMAND_TOPIC,
     CONF_FAN_MODE_STATE_TOPIC,
+    CONF_STATE_TOPIC,
+    CONF_MODE_STATE_DECODER,
+    CONF_TEMPERATURE_STATE_DECODER,
+    CONF_CURRENT_TEMPERATURE_DECODER,
+    DEFAULT_DECODER,
+    CONF_TEMPERATURE_COMMAND_TEMPLATE,
+    DEFAULT_TEMPERATURE_COMMAND_TEMPLATE,
+    CONF_ZONES,
+    CONF_ENTRY_TYPE,
+    ENTRY_TYPE_HEAT_SOURCE,
+    CONF_CLIMATE_ENTITIES,
+    CONF_SWITCH_COMMAND_TOPIC,
+    CONF_SWITCH_STATE_TOPIC,
+    CONF_DEMAND_ON_THRESHOLD,
+    CONF_DEMAND_OFF_THRESHOLD,
+    CONF_MIN_ON_TIME,
+    CONF_MIN_OFF_TIME,
+    CONF_EXCLUDE_ANOMALOUS_ZONES,
+    DEFAULT_DEMAND_ON_THRESHOLD,
+    DEFAULT_DEMAND_OFF_THRESHOLD,
+    DEFAULT_MIN_ON_TIME,
+    DEFAULT_MIN_OFF_TIME,
+    TOPIC_KEYS,
+    ZONE_PLACEHOLDER,
     ERROR_MQTT_UNAVAILABLE,
     ERROR_INVALID_TOPIC,
     ERROR_TOPIC_NOT_EXIST,
     HVAC_MODES,
     FAN_MODES,
 )
+from .decoder import is_valid_decoder
+from .formatter import is_valid_template
+from .heat_source import is_heat_source_entry
+from .zones import (
+    is_topic_template,
+    is_valid_topic_template,
+    is_valid_zone,
+    template_filter,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.components.mqtt import ReceiveMessage
+
+# Seconds to wait for a message confirming that a state topic exists
+TOPIC_VALIDATION_TIMEOUT = 2.0
+
+VALIDATED_COMMAND_TOPIC_KEYS = (
+    CONF_MODE_COMMAND_TOPIC,
+    CONF_TEMPERATURE_COMMAND_TOPIC,
+)
+VALIDATED_STATE_TOPIC_KEYS = (
+    CONF_MODE_STATE_TOPIC,
+    CONF_TEMPERATURE_STATE_TOPIC,
+    CONF_CURRENT_TEMPERATURE_TOPIC,
+    CONF_STATE_TOPIC,
+)
+ATTRIBUTE_STATE_TOPIC_KEYS = (
+    CONF_MODE_STATE_TOPIC,
+    CONF_TEMPERATURE_STATE_TOPIC,
+    CONF_CURRENT_TEMPERATURE_TOPIC,
+)
+DECODER_KEYS = (
+    CONF_MODE_STATE_DECODER,
+    CONF_TEMPERATURE_STATE_DECODER,
+    CONF_CURRENT_TEMPERATURE_DECODER,
+)
+
 
 class ClimateControlConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Climate Control."""
@@ -45,21 +127,80 @@ class ClimateControlConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     def __init__(self) -> None:
         """Initialize the config flow."""
         self._data: dict[str, Any] = {}
+        self._confirmed_topics: set[str] = set()
+
+    async def validate_mqtt_topics(
+        self, state_topics: list[str], command_topics: list[str]
+    ) -> str | None:
+        """Validate the MQTT topics and return an error, if any.
+
+        All state topics are checked concurrently by listening briefly for a
+        retained or live message. Confirmed topics are cached for the flow,
+        topics that were not confirmed are checked again on the next attempt.
+        The MQTT integration is imported here, not when the flow is loaded.
+        """
+        from homeassistant.components import mqtt
+
+        try:
+            for topic in command_topics:
+                mqtt.valid_publish_topic(topic)
+            for topic in state_topics:
+                mqtt.valid_subscribe_topic(topic)
+        except vol.Invalid:
+            return ERROR_INVALID_TOPIC
 
-    async def validate_mqtt_topics(self, topics: list[str]) -> bool:
-        """Validate that MQTT topics exist and are accessible."""
         if not await mqtt.async_wait_for_mqtt_client(self.hass):
+            return ERROR_MQTT_UNAVAILABLE
+
+        pending = [
+            topic for topic in dict.fromkeys(state_topics)
+            if topic not in self._confirmed_topics
+        ]
+        results = await asyncio.gather(
+            *(self._async_confirm_topic(topic) for topic in pending)
+        )
+        self._confirmed_topics.update(
+            topic for topic, confirmed in zip(pending, results) if confirmed
+        )
+        if not all(results):
+            return ERROR_TOPIC_NOT_EXIST
+        return None
+
+    async def _async_confirm_topic(self, topic: str) -> bool:
+        """Return True if a message arrives on a topic before the timeout."""
+        from homeassistant.components import mqtt
+
+        received = asyncio.Event()
+
+        @callback
+        def async_message_received(msg: ReceiveMessage) -> None:
+            """Confirm the topic."""
+            received.set()
+
+        unsubscribe = await mqtt.async_subscribe(
+            self.hass, topic, async_message_received
+        )
+        try:
+            async with asyncio.timeout(TOPIC_VALIDATION_TIMEOUT):
+                await received.wait()
+        except TimeoutError:
             return False
-        
-        for topic in topics:
-            if not await mqtt.async_subscribe(self.hass, topic, None):
-                return False
+        finally:
+            unsubscribe()
         return True
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
-        """Handle the initial step."""
+        """Choose between a climate device and a heat source."""
+        return self.async_show_menu(
+            step_id="user", menu_options=["device", ENTRY_TYPE_HEAT_SOURCE]
+        )
+
+    async def async_step_device(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle the topics of a climate device or zone bank."""
         errors: dict[str, str] = {}
 
         if user_input is not None:
@@ -68,42 +209,196 @@ class ClimateControlConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 await self.async_set_unique_id(user_input[CONF_NAME])
                 self._abort_if_unique_id_configured()
 
+                invalid_decoders = [
+                    key
+                    for key in DECODER_KEYS
+                    if not is_valid_decoder(user_input.get(key, DEFAULT_DECODER))
+                ]
+
                 # Check if MQTT integration is configured
-                if not self.hass.config.components.get("mqtt"):
+                if "mqtt" not in self.hass.config.components:
                     errors["base"] = ERROR_MQTT_UNAVAILABLE
-                else:
-                    # Validate MQTT topics
-                    required_topics = [
-                        user_input[CONF_MODE_COMMAND_TOPIC],
-                        user_input[CONF_TEMPERATURE_COMMAND_TOPIC],
-                        user_input[CONF_TEMPERATURE_STATE_TOPIC],
-                        user_input[CONF_CURRENT_TEMPERATURE_TOPIC],
-                    ]
-                    if not await self.validate_mqtt_topics(required_topics):
-                        errors["base"] = ERROR_TOPIC_NOT_EXIST
+                elif not user_input.get(CONF_STATE_TOPIC) and not all(
+                    user_input.get(key) for key in ATTRIBUTE_STATE_TOPIC_KEYS
+                ):
+                    errors["base"] = "missing_state_topic"
+                elif invalid_decoders:
+                    for key in invalid_decoders:
+                        errors[key] = "invalid_decoder"
+                elif not is_valid_template(
+                    user_input.get(
+                        CONF_TEMPERATURE_COMMAND_TEMPLATE,
+                        DEFAULT_TEMPERATURE_COMMAND_TEMPLATE,
+                    )
+                ):
+                    errors[CONF_TEMPERATURE_COMMAND_TEMPLATE] = "invalid_template"
+                elif any(
+                    is_topic_template(user_input[key])
+                    for key in TOPIC_KEYS
+                    if user_input.get(key)
+                ):
+                    # Topic templates describe a zone bank
+                    if not all(
+                        is_valid_topic_template(user_input[key])
+                        for key in TOPIC_KEYS
+                        if user_input.get(key)
+                    ):
+                        errors["base"] = ERROR_INVALID_TOPIC
                     else:
                         self._data.update(user_input)
-                        return await self.async_step_climate()
+                        return await self.async_step_zones()
+                elif error := await self.validate_mqtt_topics(
+                    [
+                        user_input[key]
+                        for key in VALIDATED_STATE_TOPIC_KEYS
+                        if user_input.get(key)
+                    ],
+                    [user_input[key] for key in VALIDATED_COMMAND_TOPIC_KEYS],
+                ):
+                    errors["base"] = error
+                else:
+                    self._data.update(user_input)
+                    return await self.async_step_climate()
             except Exception:
                 errors["base"] = "unknown"
 
         return self.async_show_form(
-            step_id="user",
+            step_id="device",
             data_schema=vol.Schema(
                 {
                     vol.Required(CONF_NAME): str,
                     vol.Required(CONF_MODE_COMMAND_TOPIC): str,
-                    vol.Required(CONF_MODE_STATE_TOPIC): str,
+                    vol.Optional(CONF_MODE_STATE_TOPIC): str,
                     vol.Required(CONF_TEMPERATURE_COMMAND_TOPIC): str,
-                    vol.Required(CONF_TEMPERATURE_STATE_TOPIC): str,
-                    vol.Required(CONF_CURRENT_TEMPERATURE_TOPIC): str,
+                    vol.Optional(CONF_TEMPERATURE_STATE_TOPIC): str,
+                    vol.Optional(CONF_CURRENT_TEMPERATURE_TOPIC): str,
+                    vol.Optional(CONF_STATE_TOPIC): str,
                     vol.Optional(CONF_POWER_COMMAND_TOPIC): str,
                     vol.Optional(CONF_POWER_STATE_TOPIC): str,
                     vol.Optional(CONF_FAN_MODE_COMMAND_TOPIC): str,
                     vol.Optional(CONF_FAN_MODE_STATE_TOPIC): str,
+                    vol.Optional(CONF_MODE_STATE_DECODER, default=DEFAULT_DECODER): str,
+                    vol.Optional(CONF_TEMPERATURE_STATE_DECODER, default=DEFAULT_DECODER): str,
+                    vol.Optional(CONF_CURRENT_TEMPERATURE_DECODER, default=DEFAULT_DECODER): str,
+                    vol.Optional(CONF_TEMPERATURE_COMMAND_TEMPLATE, default=DEFAULT_TEMPERATURE_COMMAND_TEMPLATE): str,
                 }
             ),
             errors=errors,
+            description_placeholders={"zone": ZONE_PLACEHOLDER},
+        )
+
+    async def async_step_heat_source(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle a heat source switched by the demand of its zones."""
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            try:
+                # One entry per switch
+                await self.async_set_unique_id(
+                    f"{ENTRY_TYPE_HEAT_SOURCE}_{user_input[CONF_SWITCH_COMMAND_TOPIC]}"
+                )
+                self._abort_if_unique_id_configured()
+
+                if not user_input[CONF_CLIMATE_ENTITIES]:
+                    errors[CONF_CLIMATE_ENTITIES] = "no_climate_entities"
+                elif (
+                    user_input[CONF_DEMAND_OFF_THRESHOLD]
+                    > user_input[CONF_DEMAND_ON_THRESHOLD]
+                ):
+                    errors[CONF_DEMAND_OFF_THRESHOLD] = "invalid_demand_thresholds"
+                elif (
+                    min(user_input[CONF_MIN_ON_TIME], user_input[CONF_MIN_OFF_TIME])
+                    < 0
+                ):
+                    errors["base"] = "invalid_min_times"
+                elif error := await self.validate_mqtt_topics(
+                    [user_input[CONF_SWITCH_STATE_TOPIC]],
+                    [user_input[CONF_SWITCH_COMMAND_TOPIC]],
+                ):
+                    errors["base"] = error
+                else:
+                    return self.async_create_entry(
+                        title=user_input[CONF_NAME],
+                        data={CONF_ENTRY_TYPE: ENTRY_TYPE_HEAT_SOURCE, **user_input},
+                    )
+            except Exception:
+                errors["base"] = "unknown"
+
+        return self.async_show_form(
+            step_id=ENTRY_TYPE_HEAT_SOURCE,
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_NAME): str,
+                    vol.Required(CONF_SWITCH_COMMAND_TOPIC): str,
+                    vol.Required(CONF_SWITCH_STATE_TOPIC): str,
+                    vol.Required(CONF_CLIMATE_ENTITIES): selector.EntitySelector(
+                        selector.EntitySelectorConfig(domain="climate", multiple=True)
+                    ),
+                    vol.Optional(CONF_DEMAND_ON_THRESHOLD, default=DEFAULT_DEMAND_ON_THRESHOLD): vol.Coerce(float),
+                    vol.Optional(CONF_DEMAND_OFF_THRESHOLD, default=DEFAULT_DEMAND_OFF_THRESHOLD): vol.Coerce(float),
+                    vol.Optional(CONF_MIN_ON_TIME, default=DEFAULT_MIN_ON_TIME): vol.Coerce(float),
+                    vol.Optional(CONF_MIN_OFF_TIME, default=DEFAULT_MIN_OFF_TIME): vol.Coerce(float),
+                    vol.Optional(CONF_EXCLUDE_ANOMALOUS_ZONES, default=False): bool,
+                    vol.Optional(CONF_INSTRUMENTATION, default=DEFAULT_INSTRUMENTATION): bool,
+                }
+            ),
+            errors=errors,
+        )
+
+    async def async_step_import(self, import_data: dict[str, Any]) -> FlowResult:
+        """Create or update an entry from a validated zone manifest."""
+        await self.async_set_unique_id(import_data[CONF_NAME])
+        # Importing the manifest again replaces the zones of the entry
+        self._abort_if_unique_id_configured(updates=import_data)
+        return self.async_create_entry(
+            title=import_data[CONF_NAME],
+            data=import_data,
+        )
+
+    async def async_step_zones(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle the zones of a zone bank."""
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            try:
+                zones = [
+                    zone.strip()
+                    for zone in user_input[CONF_ZONES].split(",")
+                    if zone.strip()
+                ]
+                if (
+                    not zones
+                    or len(set(zones)) != len(zones)
+                    or not all(is_valid_zone(zone) for zone in zones)
+                ):
+                    errors[CONF_ZONES] = "invalid_zones"
+                elif error := await self.validate_mqtt_topics(
+                    [
+                        template_filter(self._data[key])
+                        for key in VALIDATED_STATE_TOPIC_KEYS
+                        if self._data.get(key)
+                    ],
+                    [
+                        self._data[key].replace(ZONE_PLACEHOLDER, zones[0])
+                        for key in VALIDATED_COMMAND_TOPIC_KEYS
+                    ],
+                ):
+                    errors["base"] = error
+                else:
+                    self._data[CONF_ZONES] = zones
+                    return await self.async_step_climate()
+            except Exception:
+                errors["base"] = "unknown"
+
+        return self.async_show_form(
+            step_id="zones",
+            data_schema=vol.Schema({vol.Required(CONF_ZONES): str}),
+            errors=errors,
+            description_placeholders={"zone": ZONE_PLACEHOLDER},
         )
 
     async def async_step_climate(
@@ -121,6 +416,17 @@ class ClimateControlConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     errors[CONF_TEMP_STEP] = "invalid_temp_step"
                 elif user_input[CONF_PRECISION] <= 0:
                     errors[CONF_PRECISION] = "invalid_precision"
+                elif not (
+                    0 <= user_input[CONF_COMMAND_DEBOUNCE]
+                    <= user_input[CONF_COMMAND_MAX_LATENCY]
+                ):
+                    errors[CONF_COMMAND_DEBOUNCE] = "invalid_command_timing"
+                elif user_input[CONF_STATE_WRITE_WINDOW] < 0:
+                    errors[CONF_STATE_WRITE_WINDOW] = "invalid_state_write_window"
+                elif user_input[CONF_CURRENT_TEMPERATURE_MIN_INTERVAL] < 0:
+                    errors[CONF_CURRENT_TEMPERATURE_MIN_INTERVAL] = "invalid_gate"
+                elif user_input[CONF_CURRENT_TEMPERATURE_DEADBAND] < 0:
+                    errors[CONF_CURRENT_TEMPERATURE_DEADBAND] = "invalid_gate"
                 else:
                     self._data.update(user_input)
                     return self.async_create_entry(
@@ -138,11 +444,24 @@ class ClimateControlConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     vol.Required(CONF_MAX_TEMP, default=DEFAULT_MAX_TEMP): vol.Coerce(float),
                     vol.Required(CONF_TEMP_STEP, default=DEFAULT_TEMP_STEP): vol.Coerce(float),
                     vol.Required(CONF_PRECISION, default=DEFAULT_PRECISION): vol.Coerce(float),
+                    vol.Optional(CONF_COMMAND_DEBOUNCE, default=DEFAULT_COMMAND_DEBOUNCE): vol.Coerce(float),
+                    vol.Optional(CONF_COMMAND_MAX_LATENCY, default=DEFAULT_COMMAND_MAX_LATENCY): vol.Coerce(float),
+                    vol.Optional(CONF_STATE_WRITE_WINDOW, default=DEFAULT_STATE_WRITE_WINDOW): vol.Coerce(float),
+                    vol.Optional(CONF_CURRENT_TEMPERATURE_MIN_INTERVAL, default=DEFAULT_CURRENT_TEMPERATURE_MIN_INTERVAL): vol.Coerce(float),
+                    vol.Optional(CONF_CURRENT_TEMPERATURE_DEADBAND, default=DEFAULT_CURRENT_TEMPERATURE_DEADBAND): vol.Coerce(float),
                 }
             ),
             errors=errors,
         )
 
+    @classmethod
+    @callback
+    def async_supports_options_flow(
+        cls, config_entry: config_entries.ConfigEntry
+    ) -> bool:
+        """Return True for climate devices, heat sources have no options."""
+        return not is_heat_source_entry(config_entry)
+
     @staticmethod
     @callback
     def async_get_options_flow(
@@ -174,6 +493,13 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                     errors[CONF_TEMP_STEP] = "invalid_temp_step"
                 elif user_input[CONF_PRECISION] <= 0:
                     errors[CONF_PRECISION] = "invalid_precision"
+                elif any(
+                    user_input[key] < 0
+                    for key in (CONF_STALE_TIMEOUT, CONF_RESPONSE_TIME, CONF_JUMP_LIMIT)
+                ):
+                    errors["base"] = "invalid_anomaly"
+                elif user_input[CONF_MIN_RISE] <= 0:
+                    errors[CONF_MIN_RISE] = "invalid_min_rise"
                 else:
                     return self.async_create_entry(title="", data=user_input)
             except Exception:
@@ -183,27 +509,55 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             vol.Required(
                 CONF_MIN_TEMP,
                 default=self.config_entry.options.get(
-                    CONF_MIN_TEMP, DEFAULT_MIN_TEMP
+                    CONF_MIN_TEMP, self.config_entry.data.get(CONF_MIN_TEMP, DEFAULT_MIN_TEMP)
                 ),
             ): vol.Coerce(float),
             vol.Required(
                 CONF_MAX_TEMP,
                 default=self.config_entry.options.get(
-                    CONF_MAX_TEMP, DEFAULT_MAX_TEMP
+                    CONF_MAX_TEMP, self.config_entry.data.get(CONF_MAX_TEMP, DEFAULT_MAX_TEMP)
                 ),
             ): vol.Coerce(float),
             vol.Required(
                 CONF_TEMP_STEP,
                 default=self.config_entry.options.get(
-                    CONF_TEMP_STEP, DEFAULT_TEMP_STEP
+                    CONF_TEMP_STEP, self.config_entry.data.get(CONF_TEMP_STEP, DEFAULT_TEMP_STEP)
                 ),
             ): vol.Coerce(float),
             vol.Required(
                 CONF_PRECISION,
                 default=self.config_entry.options.get(
-                    CONF_PRECISION, DEFAULT_PRECISION
+                    CONF_PRECISION, self.config_entry.data.get(CONF_PRECISION, DEFAULT_PRECISION)
                 ),
             ): vol.Coerce(float),
+            vol.Required(
+                CONF_STALE_TIMEOUT,
+                default=self.config_entry.options.get(
+                    CONF_STALE_TIMEOUT, DEFAULT_STALE_TIMEOUT
+                ),
+            ): vol.Coerce(float),
+            vol.Required(
+                CONF_RESPONSE_TIME,
+                default=self.config_entry.options.get(
+                    CONF_RESPONSE_TIME, DEFAULT_RESPONSE_TIME
+                ),
+            ): vol.Coerce(float),
+            vol.Required(
+                CONF_MIN_RISE,
+                default=self.config_entry.options.get(CONF_MIN_RISE, DEFAULT_MIN_RISE),
+            ): vol.Coerce(float),
+            vol.Required(
+                CONF_JUMP_LIMIT,
+                default=self.config_entry.options.get(
+                    CONF_JUMP_LIMIT, DEFAULT_JUMP_LIMIT
+                ),
+            ): vol.Coerce(float),
+            vol.Required(
+                CONF_INSTRUMENTATION,
+                default=self.config_entry.options.get(
+                    CONF_INSTRUMENTATION, DEFAULT_INSTRUMENTATION
+                ),
+            ): bool,
         }
 
         return self.async_show_form(
@@ -9,12 +9,49 @@ CONF_MIN_TEMP: Final = "min_temp"
 CONF_MAX_TEMP: Final = "max_temp"
 CONF_TEMP_STEP: Final = "temp_step"
 CONF_PRECISION: Final = "precision"
+CONF_COMMAND_DEBOUNCE: Final = "command_debounce"
+CONF_COMMAND_MAX_LATENCY: Final = "command_max_latency"
+CONF_STATE_WRITE_WINDOW: Final = "state_write_window"
+CONF_INSTRUMENTATION: Final = "instrumentation"
+CONF_CURRENT_TEMPERATURE_MIN_INTERVAL: Final = "current_temperature_min_interval"
+CONF_CURRENT_TEMPERATURE_DEADBAND: Final = "current_temperature_deadband"
+CONF_STALE_TIMEOUT: Final = "stale_timeout"
+CONF_RESPONSE_TIME: Final = "response_time"
+CONF_MIN_RISE: Final = "min_rise"
+CONF_JUMP_LIMIT: Final = "jump_limit"
+
+# Options applied to running entities without a reload
+LIVE_OPTION_KEYS: Final = (CONF_MIN_TEMP, CONF_MAX_TEMP, CONF_TEMP_STEP, CONF_PRECISION)
+SIGNAL_OPTIONS_UPDATED: Final = f"{DOMAIN}_options_updated_{{}}"
 
 # Default Values
 DEFAULT_MIN_TEMP: Final = 7
 DEFAULT_MAX_TEMP: Final = 35
 DEFAULT_TEMP_STEP: Final = 0.5
 DEFAULT_PRECISION: Final = 0.1
+DEFAULT_COMMAND_DEBOUNCE: Final = 0.3
+DEFAULT_COMMAND_MAX_LATENCY: Final = 1.0
+DEFAULT_STATE_WRITE_WINDOW: Final = 0
+DEFAULT_INSTRUMENTATION: Final = False
+DEFAULT_CURRENT_TEMPERATURE_MIN_INTERVAL: Final = 0
+DEFAULT_CURRENT_TEMPERATURE_DEADBAND: Final = 0
+DEFAULT_STALE_TIMEOUT: Final = 7200
+DEFAULT_RESPONSE_TIME: Final = 7200
+DEFAULT_MIN_RISE: Final = 0.3
+DEFAULT_JUMP_LIMIT: Final = 5.0
+
+# Values of the options form fields that are not set in an entry
+OPTION_DEFAULTS: Final = {
+    CONF_MIN_TEMP: DEFAULT_MIN_TEMP,
+    CONF_MAX_TEMP: DEFAULT_MAX_TEMP,
+    CONF_TEMP_STEP: DEFAULT_TEMP_STEP,
+    CONF_PRECISION: DEFAULT_PRECISION,
+    CONF_STALE_TIMEOUT: DEFAULT_STALE_TIMEOUT,
+    CONF_RESPONSE_TIME: DEFAULT_RESPONSE_TIME,
+    CONF_MIN_RISE: DEFAULT_MIN_RISE,
+    CONF_JUMP_LIMIT: DEFAULT_JUMP_LIMIT,
+    CONF_INSTRUMENTATION: DEFAULT_INSTRUMENTATION,
+}
 
 # MQTT Topics
 CONF_MODE_COMMAND_TOPIC: Final = "mode_command_topic"
@@ -26,6 +63,91 @@ CONF_POWER_COMMAND_TOPIC: Final = "power_command_topic"
 CONF_POWER_STATE_TOPIC: Final = "power_state_topic"
 CONF_FAN_MODE_COMMAND_TOPIC: Final = "fan_mode_command_topic"
 CONF_FAN_MODE_STATE_TOPIC: Final = "fan_mode_state_topic"
+CONF_STATE_TOPIC: Final = "state_topic"
+
+TOPIC_KEYS: Final = (
+    CONF_MODE_COMMAND_TOPIC,
+    CONF_MODE_STATE_TOPIC,
+    CONF_TEMPERATURE_COMMAND_TOPIC,
+    CONF_TEMPERATURE_STATE_TOPIC,
+    CONF_CURRENT_TEMPERATURE_TOPIC,
+    CONF_POWER_COMMAND_TOPIC,
+    CONF_POWER_STATE_TOPIC,
+    CONF_FAN_MODE_COMMAND_TOPIC,
+    CONF_FAN_MODE_STATE_TOPIC,
+    CONF_STATE_TOPIC,
+)
+
+# Payload decoders
+CONF_MODE_STATE_DECODER: Final = "mode_state_decoder"
+CONF_TEMPERATURE_STATE_DECODER: Final = "temperature_state_decoder"
+CONF_CURRENT_TEMPERATURE_DECODER: Final = "current_temperature_decoder"
+DEFAULT_DECODER: Final = "raw"
+
+# Payload template of the temperature command topic
+CONF_TEMPERATURE_COMMAND_TEMPLATE: Final = "temperature_command_template"
+DEFAULT_TEMPERATURE_COMMAND_TEMPLATE: Final = "plain"
+
+# JSON paths of the combined state topic unless set by a JSON decoder
+DEFAULT_STATE_MODE_PATH: Final = "mode"
+DEFAULT_STATE_TEMPERATURE_PATH: Final = "temperature"
+DEFAULT_STATE_CURRENT_TEMPERATURE_PATH: Final = "current_temperature"
+
+# Zone banks
+CONF_ZONES: Final = "zones"
+CONF_ZONE: Final = "zone"
+CONF_ZONE_MANIFEST: Final = "zone_manifest"
+ZONE_PLACEHOLDER: Final = "{zone}"
+
+# Heat source demand
+CONF_ZONE_WEIGHTS: Final = "zone_weights"
+CONF_DEMAND_ON_THRESHOLD: Final = "demand_on_threshold"
+CONF_DEMAND_OFF_THRESHOLD: Final = "demand_off_threshold"
+CONF_MIN_ON_TIME: Final = "min_on_time"
+CONF_MIN_OFF_TIME: Final = "min_off_time"
+DEFAULT_DEMAND_ON_THRESHOLD: Final = 1.0
+DEFAULT_DEMAND_OFF_THRESHOLD: Final = 0.0
+DEFAULT_MIN_ON_TIME: Final = 180
+DEFAULT_MIN_OFF_TIME: Final = 180
+
+ATTR_ACTIVE_ZONES: Final = "active_zones"
+
+# Heat sources
+CONF_ENTRY_TYPE: Final = "entry_type"
+ENTRY_TYPE_HEAT_SOURCE: Final = "heat_source"
+CONF_CLIMATE_ENTITIES: Final = "climate_entities"
+CONF_CLIMATE_GROUP: Final = "climate_group"
+CONF_SWITCH_COMMAND_TOPIC: Final = "switch_command_topic"
+CONF_SWITCH_STATE_TOPIC: Final = "switch_state_topic"
+
+# Anomaly detection
+CONF_EXCLUDE_ANOMALOUS_ZONES: Final = "exclude_anomalous_zones"
+ATTR_ANOMALIES: Final = "anomalies"
+
+# Heat source accounting
+CONF_HEAT_SOURCE_POWER: Final = "heat_source_power"
+CONF_ACCOUNTING_SAVE_INTERVAL: Final = "accounting_save_interval"
+DEFAULT_ACCOUNTING_SAVE_INTERVAL: Final = 900
+ATTR_TODAY: Final = "today"
+ATTR_UNATTRIBUTED: Final = "unattributed"
+
+# Pre-heat scheduling
+SERVICE_SCHEDULE_PREHEAT: Final = "schedule_preheat"
+ATTR_PREHEAT_AT: Final = "at"
+ATTR_PREHEAT_TEMPERATURE: Final = "preheat_temperature"
+ATTR_PREHEAT_START: Final = "preheat_start"
+PREHEAT_MAX_LEAD_TIME: Final = 4 * 3600
+
+# Zone import
+SERVICE_IMPORT_ZONES: Final = "import_zones"
+ATTR_DRY_RUN: Final = "dry_run"
+
+# Temperature history
+SERVICE_GET_TEMPERATURE_HISTORY: Final = "get_temperature_history"
+ATTR_TEMPERATURE_MEAN: Final = "temperature_mean"
+ATTR_TEMPERATURE_MIN: Final = "temperature_min"
+ATTR_TEMPERATURE_MAX: Final = "temperature_max"
+ATTR_TEMPERATURE_RATE: Final = "temperature_rate"
 
 # MQTT Payloads
 DEFAULT_PAYLOAD_ON: Final = "ON"
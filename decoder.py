@@ -0,0 +1,75 @@
+"""Payload decoding for the Climate Control integration.
+
+A decoder is described by a spec string and compiled once at setup:
+
+- ``raw``: the payload itself
+- ``json:<path>``: a value of a JSON payload, e.g. ``json:state.setpoint``
+- ``regex:<pattern>``: the first group, or the whole match, of a pattern
+"""
+from __future__ import annotations
+
+import re
+from typing import Any
+
+from homeassistant.util.json import json_loads
+
+DECODER_RAW = "raw"
+DECODER_JSON = "json"
+DECODER_REGEX = "regex"
+
+
+class PayloadDecoder:
+    """Decode a value from an MQTT payload."""
+
+    __slots__ = ("spec", "path", "_pattern")
+
+    def __init__(self, spec: str = DECODER_RAW) -> None:
+        """Compile the decoder, raising ValueError for an invalid spec."""
+        kind, _, argument = spec.partition(":")
+        self.spec = spec
+        self.path: tuple[str, ...] | None = None
+        self._pattern: re.Pattern[str] | None = None
+
+        if kind == DECODER_RAW and not argument:
+            pass
+        elif kind == DECODER_JSON and argument:
+            self.path = tuple(argument.split("."))
+        elif kind == DECODER_REGEX and argument:
+            try:
+                self._pattern = re.compile(argument)
+            except re.error as err:
+                raise ValueError(f"Invalid pattern in decoder {spec}") from err
+        else:
+            raise ValueError(f"Invalid decoder {spec}")
+
+    def __call__(self, payload: str | bytes) -> Any:
+        """Decode a payload, returning None if it holds no value."""
+        if self.path is not None:
+            return self.extract(json_loads(payload))
+        if isinstance(payload, bytes):
+            payload = payload.decode()
+        if self._pattern is None:
+            return payload
+        if (match := self._pattern.search(payload)) is None:
+            return None
+        return match.group(1) if self._pattern.groups else match.group(0)
+
+    def extract(self, value: Any) -> Any:
+        """Return the value at the JSON path of an already parsed payload."""
+        for key in self.path or ():
+            if isinstance(value, dict):
+                value = value.get(key)
+            elif isinstance(value, list) and key.isdigit() and int(key) < len(value):
+                value = value[int(key)]
+            else:
+                return None
+        return value
+
+
+def is_valid_decoder(spec: str) -> bool:
+    """Return True if a decoder spec compiles."""
+    try:
+        PayloadDecoder(spec)
+    except ValueError:
+        return False
+    return True
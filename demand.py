@@ -0,0 +1,120 @@
+"""Demand aggregation for the Climate Control heat source switch."""
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+import math
+
+
+class DemandEngine:
+    """Decide the heat source state from the weighted zone demand.
+
+    The switch is turned on once the demand reaches ``on_threshold`` and off
+    once it drops to ``off_threshold``. It stays on for at least
+    ``min_on_time`` and off for at least ``min_off_time`` seconds.
+    """
+
+    def __init__(
+        self,
+        weights: Mapping[str, float] | None = None,
+        on_threshold: float = 1.0,
+        off_threshold: float = 0.0,
+        min_on_time: float = 0.0,
+        min_off_time: float = 0.0,
+        is_on: bool = False,
+    ) -> None:
+        """Initialize the engine."""
+        self._weights = dict(weights or {})
+        self._on_threshold = on_threshold
+        self._off_threshold = min(off_threshold, on_threshold)
+        self._min_on_time = min_on_time
+        self._min_off_time = min_off_time
+        self.demand = 0.0
+        self.is_on = is_on
+        self.last_change = -math.inf
+
+    def update_demand(self, active_zones: Iterable[str]) -> None:
+        """Set the demand from the active zones."""
+        weights = self._weights
+        self.demand = sum(weights.get(zone, 1.0) for zone in active_zones)
+
+    def set_switch_state(self, is_on: bool, now: float) -> None:
+        """Record the switch state, either commanded or reported."""
+        if is_on != self.is_on:
+            self.is_on = is_on
+            self.last_change = now
+
+    @property
+    def wanted(self) -> bool:
+        """Return the state the demand asks for."""
+        if self.is_on:
+            return self.demand > self._off_threshold
+        return self.demand >= self._on_threshold
+
+    def evaluate(self, now: float) -> tuple[bool | None, float | None]:
+        """Return the state to command now and the delay of a re-evaluation.
+
+        The state is None if the switch should not change, the delay is set
+        when a change is held back by the minimum on or off time.
+        """
+        wanted = self.wanted
+        if wanted == self.is_on:
+            return None, None
+
+        hold = self._min_on_time if self.is_on else self._min_off_time
+        if (remaining := self.last_change + hold - now) > 0:
+            return None, remaining
+        return wanted, None
+
+
+@dataclass
+class DemandReplayResult:
+    """Result of replaying a demand trace."""
+
+    cycles: int = 0
+    commands: int = 0
+    on_time: float = 0.0
+    duration: float = 0.0
+
+
+def replay_demand_trace(
+    trace: Iterable[tuple[float, float]], engine: DemandEngine
+) -> DemandReplayResult:
+    """Replay (timestamp, demand) samples through an engine.
+
+    Commands are assumed to take effect immediately. Re-evaluations held back
+    by a minimum on or off time run at their due time between samples.
+    """
+    result = DemandReplayResult()
+    start: float | None = None
+    last = 0.0
+    retry_at: float | None = None
+
+    def apply(now: float) -> float | None:
+        state, delay = engine.evaluate(now)
+        if state is not None:
+            engine.set_switch_state(state, now)
+            result.commands += 1
+            if state:
+                result.cycles += 1
+        return None if delay is None else now + delay
+
+    for timestamp, demand in trace:
+        if start is None:
+            start = last = timestamp
+        while retry_at is not None and retry_at <= timestamp:
+            if engine.is_on:
+                result.on_time += retry_at - last
+            last = retry_at
+            retry_at = apply(retry_at)
+
+        if engine.is_on:
+            result.on_time += timestamp - last
+        last = timestamp
+
+        engine.demand = demand
+        retry_at = apply(timestamp)
+
+    if start is not None:
+        result.duration = last - start
+    return result
@@ -0,0 +1,67 @@
+"""Diagnostics support for Climate Control."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+
+from .const import DOMAIN
+from .heat_source import async_get_heat_source_router
+from .listeners import async_listener_counts
+from .models import ClimateControlData, HeatSourceData
+from .reconcile import async_get_retry_limiter
+
+
+@callback
+def async_entry_listener_count(
+    hass: HomeAssistant, entry: ConfigEntry, counts: dict[str, int]
+) -> int:
+    """Return the live listeners owned by the entities of an entry."""
+    return sum(
+        counts.get(entity.entity_id, 0)
+        for entity in er.async_entries_for_config_entry(
+            er.async_get(hass), entry.entry_id
+        )
+    )
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    data: ClimateControlData | HeatSourceData = hass.data[DOMAIN][entry.entry_id]
+    listener_counts = async_listener_counts(hass)
+    if isinstance(data, HeatSourceData):
+        return {
+            "data": dict(entry.data),
+            "switch": data.switch_entity_id,
+            "zone_sources": async_get_heat_source_router(hass).as_dict(),
+            "state_listeners": async_entry_listener_count(
+                hass, entry, listener_counts
+            ),
+            "instrumentation": data.instrumentation.as_dict(),
+            "state_listeners_by_owner": listener_counts,
+        }
+
+    retry_limiter = async_get_retry_limiter(hass)
+
+    return {
+        "data": dict(entry.data),
+        "options": dict(entry.options),
+        "listeners": {
+            "state_listeners": async_entry_listener_count(
+                hass, entry, listener_counts
+            ),
+            "mqtt_subscriptions": data.router.subscription_count,
+            "mqtt_handlers": data.router.handler_count,
+        },
+        "state_listeners_by_owner": listener_counts,
+        "instrumentation": data.router.instrumentation.as_dict(),
+        "command_retries": {
+            "outstanding": retry_limiter.outstanding,
+            "limit": retry_limiter.limit,
+            "rejected": retry_limiter.rejected,
+        },
+    }
@@ -0,0 +1,125 @@
+"""Setpoint formatting for the Climate Control command topics.
+
+A setpoint is rounded to the temperature step, clamped to the limits and
+formatted by a template, described by a spec string and compiled once:
+
+- ``plain``: the number with the decimals of the step, e.g. ``21.5``
+- ``json:<path>``: a JSON object with the value at a path, e.g.
+  ``json:setpoint`` gives ``{"setpoint": 21.5}``
+- ``scaled:<factor>``: the value times the factor as an integer, e.g.
+  ``scaled:10`` gives ``215``
+
+The inbound decoder of the temperature state topic returns the value again,
+with ``raw`` for ``plain`` and ``scaled`` and the same path for ``json``.
+"""
+from __future__ import annotations
+
+from decimal import Decimal
+import json
+import math
+from typing import Any
+
+TEMPLATE_PLAIN = "plain"
+TEMPLATE_JSON = "json"
+TEMPLATE_SCALED = "scaled"
+
+
+class SetpointFormatter:
+    """Quantize setpoints and format them as command payloads."""
+
+    __slots__ = (
+        "spec",
+        "step",
+        "min_temp",
+        "max_temp",
+        "_decimals",
+        "_path",
+        "_scale",
+    )
+
+    def __init__(
+        self,
+        spec: str = TEMPLATE_PLAIN,
+        step: float = 0.5,
+        min_temp: float = -math.inf,
+        max_temp: float = math.inf,
+    ) -> None:
+        """Compile the template, raising ValueError for an invalid spec."""
+        kind, _, argument = spec.partition(":")
+        self.spec = spec
+        self.step = step
+        self.min_temp = min_temp
+        self.max_temp = max_temp
+        self._path: tuple[str, ...] | None = None
+        self._scale: float | None = None
+
+        if kind == TEMPLATE_PLAIN and not argument:
+            pass
+        elif kind == TEMPLATE_JSON and argument:
+            self._path = tuple(argument.split("."))
+        elif kind == TEMPLATE_SCALED and argument:
+            try:
+                self._scale = float(argument)
+            except ValueError as err:
+                raise ValueError(f"Invalid factor in template {spec}") from err
+            if not self._scale > 0:
+                raise ValueError(f"Invalid factor in template {spec}")
+        else:
+            raise ValueError(f"Invalid template {spec}")
+
+        # Decimals of the step, so 0.1 steps are not sent as 21.299999
+        exponent = Decimal(str(step)).normalize().as_tuple().exponent
+        self._decimals = max(0, -exponent) if isinstance(exponent, int) else 0
+
+        # Keep the limits on the grid of the step, so clamped values are too
+        if step > 0 and math.isfinite(min_temp) and math.isfinite(max_temp):
+            low = round(math.ceil(round(min_temp / step, 9)) * step, self._decimals)
+            high = round(math.floor(round(max_temp / step, 9)) * step, self._decimals)
+            if low <= high:
+                self.min_temp, self.max_temp = low, high
+
+    def quantize(self, value: float) -> float:
+        """Round a setpoint to the nearest step, halves up, within the limits."""
+        if self.step > 0:
+            value = math.floor(value / self.step + 0.5) * self.step
+        value = min(max(value, self.min_temp), self.max_temp)
+        return round(float(value), self._decimals)
+
+    def format(self, value: float) -> str:
+        """Return the payload of a quantized setpoint."""
+        if self._scale is not None:
+            return str(round(value * self._scale))
+        if self._path is not None:
+            payload: Any = value
+            for key in reversed(self._path):
+                payload = {key: payload}
+            return json.dumps(payload)
+        return f"{value:.{self._decimals}f}"
+
+    def parse(self, value: Any) -> float:
+        """Return the setpoint of a decoded state value."""
+        if self._scale is not None:
+            # Rounded only to drop the float error of the division
+            return round(float(value) / self._scale, 9)
+        return float(value)
+
+    def confirmed_payload(self, value: Any) -> str:
+        """Return the command payload a decoded state value confirms.
+
+        A setpoint on the grid confirms the payload it is commanded with. Any
+        other value is kept as reported, so a command moving it onto the grid
+        is not taken for the current state.
+        """
+        setpoint = self.parse(value)
+        if self.quantize(setpoint) == setpoint:
+            return self.format(setpoint)
+        return str(value)
+
+
+def is_valid_template(spec: str) -> bool:
+    """Return True if a template spec compiles."""
+    try:
+        SetpointFormatter(spec)
+    except ValueError:
+        return False
+    return True
@@ -0,0 +1,96 @@
+"""Inbound message gating for the Climate Control entities."""
+from __future__ import annotations
+
+from asyncio import TimerHandle
+from collections.abc import Callable
+import math
+
+from homeassistant.core import HomeAssistant, callback
+
+
+class InboundGate:
+    """Rate limit and deduplicate the values of a noisy topic.
+
+    A value within ``deadband`` of the last forwarded value is dropped. Other
+    values are forwarded at most once per ``min_interval`` seconds; a value
+    arriving sooner is held and forwarded at the end of the interval unless a
+    newer value replaces it, so the last value always gets through.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        forward: Callable[[float], None],
+        min_interval: float = 0,
+        deadband: float = 0,
+    ) -> None:
+        """Initialize the gate."""
+        self.hass = hass
+        self._forward = forward
+        self.min_interval = min_interval
+        self.deadband = deadband
+        self._last_value: float | None = None
+        self._last_forwarded = -math.inf
+        self._pending: float | None = None
+        self._handle: TimerHandle | None = None
+
+        self.forwarded = 0
+        self.dropped = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Return True if the gate holds back any values."""
+        return self.min_interval > 0 or self.deadband > 0
+
+    @callback
+    def async_offer(self, value: float) -> None:
+        """Forward a value now, later or not at all."""
+        last = self._last_value
+        if last is not None and abs(value - last) < self.deadband:
+            if self._pending is not None:
+                # Back within the deadband, the held value is obsolete
+                self._async_cancel()
+                self.dropped += 1
+            self.dropped += 1
+            return
+
+        now = self.hass.loop.time()
+        due = self._last_forwarded + self.min_interval
+        if now >= due:
+            self._async_forward(value, now)
+            return
+
+        if self._pending is not None:
+            self.dropped += 1
+        self._pending = value
+        if self._handle is None:
+            self._handle = self.hass.loop.call_at(due, self._async_flush)
+
+    @callback
+    def _async_flush(self) -> None:
+        """Forward the held value at the end of the interval."""
+        self._handle = None
+        if (value := self._pending) is not None:
+            self._async_forward(value, self.hass.loop.time())
+
+    @callback
+    def _async_forward(self, value: float, now: float) -> None:
+        """Forward a value."""
+        self._pending = None
+        self._last_value = value
+        self._last_forwarded = now
+        self.forwarded += 1
+        self._forward(value)
+
+    @callback
+    def _async_cancel(self) -> None:
+        """Drop the held value."""
+        self._pending = None
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Drop the held value."""
+        self._async_cancel()
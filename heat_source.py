@@ -0,0 +1,98 @@
+"""Routing of zone demand to the heat sources of Climate Control."""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+
+from .const import CONF_ENTRY_TYPE, DOMAIN, ENTRY_TYPE_HEAT_SOURCE
+from .listeners import ListenerTracker, async_get_listener_tracker
+
+DATA_HEAT_SOURCE_ROUTER = f"{DOMAIN}_heat_source_router"
+
+
+def is_heat_source_entry(entry: ConfigEntry) -> bool:
+    """Return True if a config entry describes a heat source."""
+    return entry.data.get(CONF_ENTRY_TYPE) == ENTRY_TYPE_HEAT_SOURCE
+
+
+class HeatSourceRouter:
+    """Pass zone state changes to the heat sources the zones are assigned to.
+
+    An index from each zone to its heat sources is kept, and one state change
+    listener covers all assigned zones. A change is passed to the sources of
+    its zone only, so the other sources are not evaluated. The listener is
+    only replaced when a source is added or removed.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the router."""
+        self.hass = hass
+        self._listeners: ListenerTracker = async_get_listener_tracker(
+            hass, DATA_HEAT_SOURCE_ROUTER
+        )
+        self._index: dict[str, dict[str, Callable[[Event[Any]], None]]] = {}
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_add_source(
+        self,
+        source: str,
+        zones: Iterable[str],
+        handler: Callable[[Event[Any]], None],
+    ) -> CALLBACK_TYPE:
+        """Route the state changes of zones to a source until removed."""
+        zones = frozenset(zones)
+        for zone in zones:
+            self._index.setdefault(zone, {})[source] = handler
+        self._async_subscribe()
+
+        @callback
+        def async_remove() -> None:
+            """Remove the source."""
+            for zone in zones:
+                if (handlers := self._index.get(zone)) is None:
+                    continue
+                handlers.pop(source, None)
+                if not handlers:
+                    del self._index[zone]
+            self._async_subscribe()
+
+        return async_remove
+
+    @callback
+    def _async_subscribe(self) -> None:
+        """Listen to the state changes of all routed zones."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+        if self._index:
+            self._unsub = self._listeners.async_track_state_change_event(
+                list(self._index), self._handle_state_change
+            )
+
+    @callback
+    def _handle_state_change(self, event: Event[Any]) -> None:
+        """Pass a zone state change to the sources of the zone."""
+        if (handlers := self._index.get(event.data["entity_id"])) is None:
+            return
+        for handler in handlers.values():
+            handler(event)
+
+    def sources(self, zone: str) -> list[str]:
+        """Return the sources a zone is routed to."""
+        return sorted(self._index.get(zone, ()))
+
+    def as_dict(self) -> dict[str, list[str]]:
+        """Return the sources of each routed zone."""
+        return {zone: sorted(handlers) for zone, handlers in self._index.items()}
+
+
+@callback
+def async_get_heat_source_router(hass: HomeAssistant) -> HeatSourceRouter:
+    """Return the heat source router shared by all entries."""
+    if (router := hass.data.get(DATA_HEAT_SOURCE_ROUTER)) is None:
+        router = hass.data[DATA_HEAT_SOURCE_ROUTER] = HeatSourceRouter(hass)
+    return router
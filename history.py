@@ -0,0 +1,171 @@
+"""In-memory temperature history of a Climate Control zone."""
+from __future__ import annotations
+
+from array import array
+import math
+from typing import Any
+
+# 720 samples at most once a minute cover the last 12 hours. Each sample is
+# three doubles, so a zone holds 720 * 3 * 8 bytes, about 17 KiB, of history.
+DEFAULT_HISTORY_SIZE = 720
+DEFAULT_HISTORY_INTERVAL = 60.0
+
+SECONDS_PER_HOUR = 3600
+
+
+class TemperatureHistory:
+    """Fixed-size ring buffer of (timestamp, current, target) samples.
+
+    The samples are stored in preallocated ``array('d')`` columns, so the
+    memory use is bounded by the size. The sums behind the means are updated
+    with every sample, the minimum and maximum are only rescanned when the
+    evicted sample held them.
+    """
+
+    __slots__ = (
+        "size",
+        "interval",
+        "_timestamps",
+        "_current",
+        "_target",
+        "_index",
+        "count",
+        "_current_sum",
+        "_target_sum",
+        "_target_count",
+        "_min",
+        "_max",
+    )
+
+    def __init__(
+        self,
+        size: int = DEFAULT_HISTORY_SIZE,
+        interval: float = DEFAULT_HISTORY_INTERVAL,
+    ) -> None:
+        """Initialize the buffer."""
+        self.size = size
+        self.interval = interval
+        self._timestamps = array("d", bytes(8 * size))
+        self._current = array("d", bytes(8 * size))
+        self._target = array("d", bytes(8 * size))
+        self._index = 0
+        self.count = 0
+        self._current_sum = 0.0
+        self._target_sum = 0.0
+        self._target_count = 0
+        self._min = math.inf
+        self._max = -math.inf
+
+    @property
+    def nbytes(self) -> int:
+        """Return the bytes held by the sample columns."""
+        return 3 * self._timestamps.itemsize * self.size
+
+    def add(self, timestamp: float, current: float, target: float | None) -> bool:
+        """Add a sample, returning False if it is within the sample interval.
+
+        A missing target is stored as NaN and left out of the target mean.
+        """
+        if self.count and timestamp - self._last(self._timestamps) < self.interval:
+            return False
+
+        index = self._index
+        evicted: float | None = None
+        if self.count == self.size:
+            evicted = self._current[index]
+            self._current_sum -= evicted
+            if not math.isnan(old_target := self._target[index]):
+                self._target_sum -= old_target
+                self._target_count -= 1
+        else:
+            self.count += 1
+
+        target = math.nan if target is None else target
+        self._timestamps[index] = timestamp
+        self._current[index] = current
+        self._target[index] = target
+        self._current_sum += current
+        if not math.isnan(target):
+            self._target_sum += target
+            self._target_count += 1
+
+        self._index = index = (index + 1) % self.size
+        if index == 0:
+            # Resum once per lap so rounding errors do not accumulate
+            self._current_sum = math.fsum(self._current)
+            self._target_sum = math.fsum(
+                value for value in self._target if not math.isnan(value)
+            )
+
+        if evicted is not None and evicted in (self._min, self._max):
+            self._rescan()
+        else:
+            self._min = min(self._min, current)
+            self._max = max(self._max, current)
+        return True
+
+    def _last(self, column: array) -> float:
+        """Return the newest value of a column."""
+        return column[self._index - 1]
+
+    def _rescan(self) -> None:
+        """Recompute the minimum and maximum of the current temperature."""
+        values = self._current
+        if self.count < self.size:
+            values = values[: self.count]
+        self._min = min(values)
+        self._max = max(values)
+
+    def _ordered(self, column: array) -> array:
+        """Return a column from the oldest to the newest sample."""
+        if self.count < self.size:
+            return column[: self.count]
+        return column[self._index :] + column[: self._index]
+
+    @property
+    def rate(self) -> float | None:
+        """Return the change of the current temperature in degrees per hour."""
+        if self.count < 2:
+            return None
+        oldest = 0 if self.count < self.size else self._index
+        elapsed = self._last(self._timestamps) - self._timestamps[oldest]
+        if elapsed <= 0:
+            return None
+        change = self._last(self._current) - self._current[oldest]
+        return change / elapsed * SECONDS_PER_HOUR
+
+    def statistics(self) -> dict[str, float | int | None]:
+        """Return the statistics of the buffered samples."""
+        if not self.count:
+            return {
+                "samples": 0,
+                "current_mean": None,
+                "current_min": None,
+                "current_max": None,
+                "target_mean": None,
+                "rate": None,
+            }
+        targets = self._target_count
+        return {
+            "samples": self.count,
+            "current_mean": self._current_sum / self.count,
+            "current_min": self._min,
+            "current_max": self._max,
+            "target_mean": self._target_sum / targets if targets else None,
+            "rate": self.rate,
+        }
+
+    def samples(self) -> list[dict[str, Any]]:
+        """Return the samples from the oldest to the newest."""
+        return [
+            {
+                "timestamp": timestamp,
+                "current": current,
+                "target": None if math.isnan(target) else target,
+            }
+            for timestamp, current, target in zip(
+                self._ordered(self._timestamps),
+                self._ordered(self._current),
+                self._ordered(self._target),
+            )
+        ]
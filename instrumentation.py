@@ -0,0 +1,118 @@
+"""Hot path instrumentation for the Climate Control integration.
+
+The router, the command coalescers and the MQTT handlers of a config entry
+share one ``Instrumentation``. The timers only run while it is enabled, so
+a disabled instance costs a single attribute check per message or publish.
+"""
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from time import monotonic, perf_counter
+from typing import Any
+
+# Upper bounds of the histogram buckets in seconds, the last bucket is open
+HANDLER_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1)
+PUBLISH_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0)
+ECHO_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Commands not echoed within this many seconds are not waited for anymore
+ECHO_TIMEOUT = 60.0
+
+MAX_PAYLOAD_SAMPLE = 200
+
+
+class LatencyHistogram:
+    """Fixed bucket histogram of durations in seconds."""
+
+    __slots__ = ("bounds", "counts", "count", "total", "max")
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        """Initialize the histogram."""
+        self.bounds = bounds
+        self.counts = array("L", bytes(array("L").itemsize * (len(bounds) + 1)))
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Add a duration."""
+        self.counts[bisect_left(self.bounds, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    @property
+    def mean(self) -> float | None:
+        """Return the mean duration."""
+        return self.total / self.count if self.count else None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram, with the bucket bounds in milliseconds."""
+        keys = [f"le_{bound * 1000:g}ms" for bound in self.bounds] + ["inf"]
+        return {
+            "count": self.count,
+            "mean_ms": None if self.mean is None else round(self.mean * 1000, 3),
+            "max_ms": round(self.max * 1000, 3),
+            "buckets": dict(zip(keys, self.counts)),
+        }
+
+
+class Instrumentation:
+    """Message, parse failure and latency statistics of a config entry."""
+
+    def __init__(self, enabled: bool = False) -> None:
+        """Initialize the statistics."""
+        self.enabled = enabled
+        self.messages = 0
+        self.parse_failures = 0
+        self.last_parse_failure: dict[str, Any] | None = None
+        self.handler = LatencyHistogram(HANDLER_BUCKETS)
+        self.publish = LatencyHistogram(PUBLISH_BUCKETS)
+        self.echo = LatencyHistogram(ECHO_BUCKETS)
+        self._sent: dict[str, tuple[str, float]] = {}
+
+    def record_message(self, started: float) -> None:
+        """Record a routed message and its handlers, started at perf_counter."""
+        self.messages += 1
+        self.handler.record(perf_counter() - started)
+
+    def record_publish(self, topic: str, payload: str, started: float) -> None:
+        """Record a publish and wait for the device to echo the command."""
+        self.publish.record(perf_counter() - started)
+        self._sent[topic] = (payload, monotonic())
+
+    def record_echo(self, topic: str, payload: str) -> None:
+        """Record the time from a command to the matching state."""
+        if (sent := self._sent.get(topic)) is None or sent[0] != payload:
+            return
+        del self._sent[topic]
+        if (elapsed := monotonic() - sent[1]) <= ECHO_TIMEOUT:
+            self.echo.record(elapsed)
+
+    def record_parse_failure(self, topic: str, payload: str | bytes) -> None:
+        """Record a payload a handler could not parse.
+
+        Failures are counted while disabled too, they are off the hot path.
+        """
+        self.parse_failures += 1
+        if isinstance(payload, bytes):
+            payload = payload.decode(errors="replace")
+        self.last_parse_failure = {
+            "topic": topic,
+            "payload": payload[:MAX_PAYLOAD_SAMPLE],
+        }
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics for the diagnostics."""
+        return {
+            "enabled": self.enabled,
+            "messages": self.messages,
+            "parse_failures": self.parse_failures,
+            "last_parse_failure": self.last_parse_failure,
+            "handler_time": self.handler.as_dict(),
+            "publish_time": self.publish.as_dict(),
+            "echo_time": self.echo.as_dict(),
+            "awaiting_echo": len(self._sent),
+        }
@@ -0,0 +1,70 @@
+"""State listener bookkeeping for the Climate Control integration."""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_state_change_event
+
+from .const import DOMAIN
+
+DATA_LISTENERS = f"{DOMAIN}_listeners"
+
+
+class ListenerTracker:
+    """Track state change listeners and count the live ones."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the tracker."""
+        self.hass = hass
+        self.count = 0
+
+    @callback
+    def async_track_state_change_event(
+        self,
+        entity_ids: str | Iterable[str],
+        action: Callable[[Event[Any]], Any],
+    ) -> CALLBACK_TYPE:
+        """Track state change events of entities, see the event helper."""
+        unsub = async_track_state_change_event(self.hass, entity_ids, action)
+        self.count += 1
+        removed = False
+
+        @callback
+        def async_remove() -> None:
+            """Remove the listener."""
+            nonlocal removed
+            if removed:
+                return
+            removed = True
+            self.count -= 1
+            unsub()
+
+        return async_remove
+
+
+@callback
+def async_get_listener_tracker(hass: HomeAssistant, owner: str) -> ListenerTracker:
+    """Return the listener tracker of an owner, e.g. a config entry or entity."""
+    trackers: dict[str, ListenerTracker] = hass.data.setdefault(DATA_LISTENERS, {})
+    if (tracker := trackers.get(owner)) is None:
+        tracker = trackers[owner] = ListenerTracker(hass)
+    return tracker
+
+
+@callback
+def async_remove_listener_tracker(hass: HomeAssistant, owner: str) -> None:
+    """Forget the tracker of a removed owner once its listeners are gone."""
+    trackers: dict[str, ListenerTracker] = hass.data.get(DATA_LISTENERS, {})
+    if (tracker := trackers.get(owner)) is not None and not tracker.count:
+        del trackers[owner]
+
+
+@callback
+def async_listener_counts(hass: HomeAssistant) -> dict[str, int]:
+    """Return the live listener count of each owner."""
+    return {
+        owner: tracker.count
+        for owner, tracker in hass.data.get(DATA_LISTENERS, {}).items()
+    }
@@ -0,0 +1,31 @@
+"""Runtime data models for the Climate Control integration."""
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from .instrumentation import Instrumentation
+
+if TYPE_CHECKING:
+    from .climate import ClimateController
+    from .router import TopicRouter
+
+
+@dataclass
+class ClimateControlData:
+    """Runtime data of a Climate Control config entry."""
+
+    config: Mapping[str, Any]
+    router: TopicRouter
+    controllers: dict[str, ClimateController] = field(default_factory=dict)
+
+
+@dataclass
+class HeatSourceData:
+    """Runtime data of a heat source config entry."""
+
+    config: Mapping[str, Any]
+    switch_entity_id: str
+    demand_entity_id: str
+    instrumentation: Instrumentation
@@ -0,0 +1,193 @@
+"""Command reconciliation for the Climate Control integration.
+
+A published command is pending until the state topic of the device reports
+the commanded value. Unconfirmed commands are published again with an
+exponential back-off and jitter, and given up after a number of attempts.
+The retries outstanding across all entities are capped, so a broker or
+bridge outage does not turn into a retry storm.
+"""
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable, Collection
+from dataclasses import dataclass
+from datetime import datetime
+import logging
+import random
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_RETRY_LIMITER = f"{DOMAIN}_retry_limiter"
+
+RETRY_BASE_DELAY = 2.0
+RETRY_MAX_DELAY = 30.0
+RETRY_MAX_ATTEMPTS = 4
+MAX_OUTSTANDING_RETRIES = 16
+
+ATTR_UNCONFIRMED = "unconfirmed"
+
+
+class RetryLimiter:
+    """Cap the number of commands being retried at the same time."""
+
+    def __init__(self, limit: int = MAX_OUTSTANDING_RETRIES) -> None:
+        """Initialize the limiter."""
+        self.limit = limit
+        self.outstanding = 0
+        self.rejected = 0
+
+    def acquire(self) -> bool:
+        """Take a retry slot, returning False if none is free."""
+        if self.outstanding >= self.limit:
+            self.rejected += 1
+            return False
+        self.outstanding += 1
+        return True
+
+    def release(self) -> None:
+        """Return a retry slot."""
+        self.outstanding -= 1
+
+
+@callback
+def async_get_retry_limiter(hass: HomeAssistant) -> RetryLimiter:
+    """Return the retry limiter shared by all entities."""
+    if (limiter := hass.data.get(DATA_RETRY_LIMITER)) is None:
+        limiter = hass.data[DATA_RETRY_LIMITER] = RetryLimiter()
+    return limiter
+
+
+@dataclass
+class PendingCommand:
+    """A command waiting for the device to report its value."""
+
+    payload: str
+    attempts: int = 0
+    has_slot: bool = False
+    unsub_retry: CALLBACK_TYPE | None = None
+
+
+def retry_delay(attempt: int) -> float:
+    """Return the delay before a retry, with equal jitter."""
+    delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2**attempt)
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+class CommandReconciler:
+    """Track the published commands of an entity until they are confirmed.
+
+    Only commands on ``topics`` are tracked, the command topics that have a
+    state topic to confirm them. ``on_change`` is called when the set of
+    unconfirmed topics changes and ``on_give_up`` when a command is given up.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        publish: Callable[[str, str], Awaitable[None]],
+        topics: Collection[str],
+        on_change: Callable[[], None],
+        on_give_up: Callable[[str, str], None] | None = None,
+    ) -> None:
+        """Initialize the reconciler."""
+        self.hass = hass
+        self._publish = publish
+        self._topics = frozenset(topics)
+        self._on_change = on_change
+        self._on_give_up = on_give_up
+        self._limiter = async_get_retry_limiter(hass)
+        self._pending: dict[str, PendingCommand] = {}
+
+        self.retries = 0
+        self.given_up = 0
+
+    @property
+    def unconfirmed(self) -> list[str]:
+        """Return the command topics waiting for confirmation."""
+        return sorted(self._pending)
+
+    def pending_payload(self, topic: str) -> str | None:
+        """Return the payload waiting for confirmation on a topic."""
+        if (command := self._pending.get(topic)) is None:
+            return None
+        return command.payload
+
+    @callback
+    def async_track(self, topic: str, payload: str) -> None:
+        """Wait for the state of a published command."""
+        if topic not in self._topics:
+            return
+        was_pending = topic in self._pending
+        self._async_drop(topic)
+        command = self._pending[topic] = PendingCommand(payload)
+        self._async_schedule(topic, command)
+        if not was_pending:
+            self._on_change()
+
+    @callback
+    def async_resolve(self, topic: str, payload: str) -> None:
+        """Confirm the pending command of a topic if the payload matches."""
+        if (command := self._pending.get(topic)) is None or command.payload != payload:
+            return
+        self._async_drop(topic)
+        self._on_change()
+
+
+    @callback
+    def _async_schedule(self, topic: str, command: PendingCommand) -> None:
+        """Schedule the next retry of a command."""
+
+        async def async_retry(_now: datetime) -> None:
+            command.unsub_retry = None
+            await self._async_retry(topic, command)
+
+        command.unsub_retry = async_call_later(
+            self.hass, retry_delay(command.attempts), async_retry
+        )
+
+    async def _async_retry(self, topic: str, command: PendingCommand) -> None:
+        """Publish a command again, or give it up."""
+        if command.attempts >= RETRY_MAX_ATTEMPTS:
+            self._async_drop(topic)
+            self.given_up += 1
+            _LOGGER.warning(
+                "Command %s on %s was not confirmed after %s retries",
+                command.payload,
+                topic,
+                command.attempts,
+            )
+            if self._on_give_up is not None:
+                self._on_give_up(topic, command.payload)
+            self._on_change()
+            return
+
+        command.attempts += 1
+        if not command.has_slot:
+            command.has_slot = self._limiter.acquire()
+        if command.has_slot:
+            self.retries += 1
+            _LOGGER.debug("Retrying %s on %s", command.payload, topic)
+            await self._publish(topic, command.payload)
+        # The command may have been confirmed or replaced during the publish
+        if self._pending.get(topic) is command:
+            self._async_schedule(topic, command)
+
+    @callback
+    def _async_drop(self, topic: str) -> None:
+        """Stop tracking the command of a topic."""
+        if (command := self._pending.pop(topic, None)) is None:
+            return
+        if command.unsub_retry is not None:
+            command.unsub_retry()
+        if command.has_slot:
+            self._limiter.release()
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Stop tracking all commands."""
+        for topic in list(self._pending):
+            self._async_drop(topic)
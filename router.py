@@ -0,0 +1,129 @@
+"""MQTT topic routing for the Climate Control integration."""
+from __future__ import annotations
+
+from collections.abc import Iterable
+import logging
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .instrumentation import Instrumentation
+
+if TYPE_CHECKING:
+    from homeassistant.components.mqtt.models import (
+        MessageCallbackType,
+        ReceiveMessage,
+    )
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TopicRouter:
+    """Route the MQTT messages of a config entry to the entity handlers.
+
+    The router subscribes once per topic filter, which may contain wildcards,
+    and dispatches each message through an index of concrete topics. The last
+    message of each retained topic is replayed to handlers registering later,
+    so entities of several platforms can share a topic.
+
+    The MQTT integration is only imported once the router subscribes, so
+    importing the integration does not load the MQTT client.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        qos: int = 1,
+        instrumentation: Instrumentation | None = None,
+    ) -> None:
+        """Initialize the router."""
+        self.hass = hass
+        self._qos = qos
+        self.instrumentation = instrumentation or Instrumentation()
+        self._handlers: dict[str, list[MessageCallbackType]] = {}
+        self._subscriptions: dict[str, CALLBACK_TYPE] = {}
+        self._retained: dict[str, ReceiveMessage] = {}
+
+    @property
+    def subscription_count(self) -> int:
+        """Return the number of broker subscriptions."""
+        return len(self._subscriptions)
+
+    @property
+    def handler_count(self) -> int:
+        """Return the number of registered handlers."""
+        return sum(len(handlers) for handlers in self._handlers.values())
+
+    @callback
+    def async_register(
+        self, topic: str, handler: MessageCallbackType
+    ) -> CALLBACK_TYPE:
+        """Register a handler for a concrete topic."""
+        self._handlers.setdefault(topic, []).append(handler)
+        if (msg := self._retained.get(topic)) is not None:
+            handler(msg)
+
+        @callback
+        def async_unregister() -> None:
+            """Remove the handler."""
+            handlers = self._handlers.get(topic, [])
+            if handler in handlers:
+                handlers.remove(handler)
+            if not handlers:
+                self._handlers.pop(topic, None)
+
+        return async_unregister
+
+    async def async_subscribe(self, topic_filter: str) -> None:
+        """Subscribe to a topic filter unless already subscribed."""
+        if topic_filter in self._subscriptions:
+            return
+        from homeassistant.components import mqtt
+
+        self._subscriptions[topic_filter] = await mqtt.async_subscribe(
+            self.hass, topic_filter, self._async_route, self._qos
+        )
+
+    async def async_subscribe_when_ready(self, topic_filters: Iterable[str]) -> None:
+        """Subscribe to topic filters once the MQTT client is available.
+
+        Run as a background task, so the entities are added with their
+        restored state while the client is still connecting.
+        """
+        from homeassistant.components import mqtt
+
+        topic_filters = list(topic_filters)
+        if not await mqtt.async_wait_for_mqtt_client(self.hass):
+            _LOGGER.error(
+                "MQTT is not available, not subscribing to %s",
+                ", ".join(topic_filters),
+            )
+            return
+        for topic_filter in topic_filters:
+            await self.async_subscribe(topic_filter)
+
+    @callback
+    def _async_route(self, msg: ReceiveMessage) -> None:
+        """Dispatch a message to the handlers of its topic."""
+        if msg.retain or msg.topic in self._retained:
+            self._retained[msg.topic] = msg
+
+        handlers = self._handlers.get(msg.topic, ())
+        if not self.instrumentation.enabled:
+            for handler in handlers:
+                handler(msg)
+            return
+
+        started = perf_counter()
+        for handler in handlers:
+            handler(msg)
+        self.instrumentation.record_message(started)
+
+    @callback
+    def async_unsubscribe(self) -> None:
+        """Remove all broker subscriptions."""
+        for unsubscribe in self._subscriptions.values():
+            unsubscribe()
+        self._subscriptions.clear()
+        self._retained.clear()
@@ -0,0 +1,378 @@
+"""Sensor platform for Climate Control."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import (
+    CONF_NAME,
+    EVENT_HOMEASSISTANT_STOP,
+    EntityCategory,
+    UnitOfEnergy,
+    UnitOfTime,
+)
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
+
+from .accounting import HeatSourceAccounting, accounting_storage_key
+from .const import (
+    ATTR_TODAY,
+    ATTR_UNATTRIBUTED,
+    CONF_ACCOUNTING_SAVE_INTERVAL,
+    CONF_HEAT_SOURCE_POWER,
+    CONF_ZONE_WEIGHTS,
+    DEFAULT_ACCOUNTING_SAVE_INTERVAL,
+    DOMAIN,
+)
+from .instrumentation import Instrumentation, LatencyHistogram
+from .models import ClimateControlData, HeatSourceData
+
+SCAN_INTERVAL = timedelta(seconds=30)
+
+
+@dataclass(frozen=True, kw_only=True)
+class InstrumentationSensorDescription(SensorEntityDescription):
+    """Description of an instrumentation sensor."""
+
+    value_fn: Callable[[Instrumentation], float | int | None]
+    histogram_fn: Callable[[Instrumentation], LatencyHistogram] | None = None
+
+
+def _mean_ms(histogram: LatencyHistogram) -> float | None:
+    """Return the mean of a histogram in milliseconds."""
+    return None if histogram.mean is None else round(histogram.mean * 1000, 3)
+
+
+INSTRUMENTATION_SENSORS = (
+    InstrumentationSensorDescription(
+        key="messages",
+        name="MQTT messages",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda instrumentation: instrumentation.messages,
+    ),
+    InstrumentationSensorDescription(
+        key="parse_failures",
+        name="Parse failures",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda instrumentation: instrumentation.parse_failures,
+    ),
+    InstrumentationSensorDescription(
+        key="handler_time",
+        name="Handler time",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda instrumentation: _mean_ms(instrumentation.handler),
+        histogram_fn=lambda instrumentation: instrumentation.handler,
+    ),
+    InstrumentationSensorDescription(
+        key="publish_time",
+        name="Publish time",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda instrumentation: _mean_ms(instrumentation.publish),
+        histogram_fn=lambda instrumentation: instrumentation.publish,
+    ),
+    InstrumentationSensorDescription(
+        key="echo_time",
+        name="Command echo time",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda instrumentation: _mean_ms(instrumentation.echo),
+        histogram_fn=lambda instrumentation: instrumentation.echo,
+    ),
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class AccountingSensorDescription(SensorEntityDescription):
+    """Description of a heat source accounting sensor."""
+
+    value_fn: Callable[[HeatSourceAccounting, str | None, bool], float | int | None]
+    source_name: str
+    zone_name: str | None = None
+    attributes_fn: Callable[[HeatSourceAccounting], dict[str, Any]] | None = None
+    requires_power: bool = False
+
+
+def _hours(seconds: float) -> float:
+    """Return seconds in hours."""
+    return round(seconds / 3600, 3)
+
+
+def _kwh(energy: float | None) -> float | None:
+    """Return an energy rounded to Wh."""
+    return None if energy is None else round(energy, 3)
+
+
+ACCOUNTING_SENSORS = (
+    AccountingSensorDescription(
+        key="on_time",
+        name="Heat source on time",
+        source_name="on time",
+        zone_name="heating time",
+        native_unit_of_measurement=UnitOfTime.HOURS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda accounting, zone, today: _hours(
+            accounting.on_time(zone, today)
+        ),
+        attributes_fn=lambda accounting: {
+            ATTR_UNATTRIBUTED: _hours(accounting.unattributed())
+        },
+    ),
+    AccountingSensorDescription(
+        key="cycles",
+        name="Heat source cycles",
+        source_name="cycles",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda accounting, zone, today: accounting.cycles(today),
+    ),
+    AccountingSensorDescription(
+        key="energy",
+        name="Heat source energy",
+        source_name="energy",
+        zone_name="heating energy",
+        native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda accounting, zone, today: _kwh(
+            accounting.energy(zone, today)
+        ),
+        requires_power=True,
+    ),
+)
+
+
+async def async_setup_platform(
+    hass: HomeAssistant,
+    config: ConfigType,
+    add_entities: AddEntitiesCallback,
+    discovery_info: DiscoveryInfoType | None = None,
+) -> None:
+    """Set up the accounting sensors of switch.climate."""
+    accounting = HeatSourceAccounting(
+        hass,
+        config.get(CONF_ZONE_WEIGHTS),
+        config.get(CONF_HEAT_SOURCE_POWER),
+        config.get(CONF_ACCOUNTING_SAVE_INTERVAL, DEFAULT_ACCOUNTING_SAVE_INTERVAL),
+    )
+    await accounting.async_load()
+    async_stop = _async_add_accounting_sensors(hass, accounting, add_entities)
+
+    @callback
+    def async_handle_stop(event: Event) -> None:
+        """Save the totals on shutdown."""
+        async_stop()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, async_handle_stop)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the sensors of a config entry.
+
+    A heat source gets its accounting sensors, a zone entry its
+    instrumentation sensors if the option is enabled.
+    """
+    data: ClimateControlData | HeatSourceData = hass.data[DOMAIN][
+        config_entry.entry_id
+    ]
+    if isinstance(data, HeatSourceData):
+        await _async_setup_heat_source_accounting(
+            hass, config_entry, data, async_add_entities
+        )
+        return
+
+    instrumentation = data.router.instrumentation
+    if not instrumentation.enabled:
+        return
+
+    async_add_entities(
+        (
+            InstrumentationSensor(instrumentation, config_entry.entry_id, description)
+            for description in INSTRUMENTATION_SENSORS
+        ),
+        True,
+    )
+
+
+async def _async_setup_heat_source_accounting(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    data: HeatSourceData,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Account the switch of a heat source and the zones of its demand sensor."""
+    config = data.config
+    accounting = HeatSourceAccounting(
+        hass,
+        config.get(CONF_ZONE_WEIGHTS),
+        config.get(CONF_HEAT_SOURCE_POWER),
+        config.get(CONF_ACCOUNTING_SAVE_INTERVAL, DEFAULT_ACCOUNTING_SAVE_INTERVAL),
+        data.switch_entity_id,
+        data.demand_entity_id,
+        accounting_storage_key(config_entry.entry_id),
+    )
+    await accounting.async_load()
+    async_stop = _async_add_accounting_sensors(
+        hass,
+        accounting,
+        async_add_entities,
+        f"{config_entry.entry_id}_accounting",
+        config[CONF_NAME],
+    )
+
+    @callback
+    def async_handle_stop(event: Event) -> None:
+        """Save the totals on shutdown."""
+        async_stop()
+
+    config_entry.async_on_unload(async_stop)
+    config_entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, async_handle_stop)
+    )
+
+
+@callback
+def _async_add_accounting_sensors(
+    hass: HomeAssistant,
+    accounting: HeatSourceAccounting,
+    add_entities: AddEntitiesCallback,
+    unique_id_prefix: str = "climate_accounting",
+    source: str | None = None,
+) -> CALLBACK_TYPE:
+    """Add the sensors of an accounting and start it.
+
+    A zone gets its sensors once it was active while the totals are kept.
+    Returns a callback that stops the accounting and saves the totals.
+    """
+    descriptions = [
+        description
+        for description in ACCOUNTING_SENSORS
+        if accounting.power is not None or not description.requires_power
+    ]
+
+    @callback
+    def async_add_zone(zone: str) -> None:
+        """Add the sensors of a zone."""
+        state = hass.states.get(zone)
+        add_entities(
+            (
+                AccountingSensor(
+                    accounting,
+                    description,
+                    unique_id_prefix,
+                    source,
+                    zone,
+                    state.name if state is not None else zone,
+                )
+                for description in descriptions
+                if description.zone_name is not None
+            ),
+            True,
+        )
+
+    add_entities(
+        (
+            AccountingSensor(accounting, description, unique_id_prefix, source)
+            for description in descriptions
+        ),
+        True,
+    )
+    for zone in sorted(accounting.account.zones):
+        async_add_zone(zone)
+    accounting.async_add_zone_listener(async_add_zone)
+    return accounting.async_start()
+
+
+class InstrumentationSensor(SensorEntity):
+    """Statistic of the instrumentation of a config entry.
+
+    The statistics change with every message, so they are polled instead
+    of adding a state write to the hot path.
+    """
+
+    entity_description: InstrumentationSensorDescription
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(
+        self,
+        instrumentation: Instrumentation,
+        entry_id: str,
+        description: InstrumentationSensorDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        self.entity_description = description
+        self._instrumentation = instrumentation
+        self._attr_unique_id = f"{entry_id}_{description.key}"
+
+    async def async_update(self) -> None:
+        """Read the statistic."""
+        description = self.entity_description
+        self._attr_native_value = description.value_fn(self._instrumentation)
+        if description.histogram_fn is not None:
+            self._attr_extra_state_attributes = description.histogram_fn(
+                self._instrumentation
+            ).as_dict()
+
+
+class AccountingSensor(SensorEntity):
+    """Total of the heat source accounting, of the heat source or a zone.
+
+    The totals grow while the heat source is on, so they are polled. The
+    total of the current day is kept in the ``today`` attribute.
+    """
+
+    entity_description: AccountingSensorDescription
+
+    def __init__(
+        self,
+        accounting: HeatSourceAccounting,
+        description: AccountingSensorDescription,
+        unique_id_prefix: str,
+        source: str | None = None,
+        zone: str | None = None,
+        zone_name: str | None = None,
+    ) -> None:
+        """Initialize the sensor, named after the heat source if given."""
+        self.entity_description = description
+        self._accounting = accounting
+        self._zone = zone
+        if zone is None:
+            self._attr_name = (
+                description.name
+                if source is None
+                else f"{source} {description.source_name}"
+            )
+            self._attr_unique_id = f"{unique_id_prefix}_{description.key}"
+        else:
+            self._attr_name = (
+                f"{zone_name} {description.zone_name}"
+                if source is None
+                else f"{zone_name} {source} {description.zone_name}"
+            )
+            self._attr_unique_id = f"{unique_id_prefix}_{zone}_{description.key}"
+
+    async def async_update(self) -> None:
+        """Read the totals."""
+        description = self.entity_description
+        accounting = self._accounting
+        self._attr_native_value = description.value_fn(accounting, self._zone, False)
+        attributes = {ATTR_TODAY: description.value_fn(accounting, self._zone, True)}
+        if self._zone is None and description.attributes_fn is not None:
+            attributes.update(description.attributes_fn(accounting))
+        self._attr_extra_state_attributes = attributes
@@ -0,0 +1,98 @@
+"""Services of the Climate Control integration."""
+from __future__ import annotations
+
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+import voluptuous as vol
+from homeassistant.config_entries import SOURCE_IMPORT
+from homeassistant.const import CONF_NAME, CONF_PATH
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+import homeassistant.helpers.config_validation as cv
+
+from .const import (
+    ATTR_DRY_RUN,
+    CONF_ZONE_MANIFEST,
+    CONF_ZONES,
+    DOMAIN,
+    SERVICE_IMPORT_ZONES,
+)
+
+IMPORT_ZONES_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Required(CONF_NAME): cv.string,
+            vol.Exclusive(CONF_PATH, "manifest"): cv.string,
+            vol.Exclusive(CONF_ZONES, "manifest"): [dict],
+            vol.Optional(ATTR_DRY_RUN, default=False): cv.boolean,
+        }
+    ),
+    cv.has_at_least_one_key(CONF_PATH, CONF_ZONES),
+)
+
+
+async def async_import_zones(
+    hass: HomeAssistant, call: ServiceCall
+) -> ServiceResponse:
+    """Validate a zone manifest and import it as one config entry.
+
+    Nothing is imported unless every row is valid. The response summarizes
+    the validation per row.
+    """
+    # Loads the MQTT topic validation, so only once the service is called
+    from .zone_import import load_manifest, validate_manifest
+
+    if (rows := call.data.get(CONF_ZONES)) is None:
+        path = Path(hass.config.path(call.data[CONF_PATH]))
+        if not hass.config.is_allowed_path(str(path)):
+            raise ServiceValidationError(
+                f"The zone manifest {path} is not in an allowed directory, add "
+                "it to allowlist_external_dirs"
+            )
+        try:
+            rows = await hass.async_add_executor_job(load_manifest, path)
+        except (OSError, HomeAssistantError, vol.Invalid) as err:
+            raise ServiceValidationError(
+                f"Could not read the zone manifest {path}: {err}"
+            ) from err
+
+    valid, errors = validate_manifest(rows)
+    imported = not errors and bool(valid) and not call.data[ATTR_DRY_RUN]
+    if imported:
+        await hass.config_entries.flow.async_init(
+            DOMAIN,
+            context={"source": SOURCE_IMPORT},
+            data={CONF_NAME: call.data[CONF_NAME], CONF_ZONE_MANIFEST: valid},
+        )
+
+    summary: dict[str, Any] = {
+        "rows": len(valid) + len(errors),
+        "valid": len(valid),
+        "invalid": len(errors),
+        "errors": errors,
+        "imported": imported,
+    }
+    if errors and not call.return_response:
+        raise ServiceValidationError(
+            f"{len(errors)} of {summary['rows']} zones are invalid, the first "
+            f"in row {errors[0]['row']}: {errors[0]['error']}"
+        )
+    return summary if call.return_response else None
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration services."""
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_IMPORT_ZONES,
+        partial(async_import_zones, hass),
+        schema=IMPORT_ZONES_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
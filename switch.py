@@ -1,14 +1,32 @@
 """Switch platform for Climate Control."""
+from __future__ import annotations
+
+from collections.abc import Mapping
 import logging
-from typing import Any
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.switch import SwitchEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_NAME
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 from homeassistant.components import mqtt
 
-from . import DOMAIN
+from .const import (
+    DOMAIN,
+    CONF_INSTRUMENTATION,
+    CONF_SWITCH_COMMAND_TOPIC,
+    CONF_SWITCH_STATE_TOPIC,
+    DEFAULT_INSTRUMENTATION,
+)
+from .instrumentation import Instrumentation
+from .models import ClimateControlData, HeatSourceData
+from .reconcile import ATTR_UNCONFIRMED, CommandReconciler
+
+if TYPE_CHECKING:
+    from .climate import ClimateController
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -22,45 +40,223 @@ async def async_setup_platform(
     discovery_info: DiscoveryInfoType | None = None,
 ) -> None:
     """Set up the Climate switch."""
-    add_entities([ClimateSwitch(hass)])
+    add_entities(
+        [
+            ClimateSwitch(
+                hass,
+                config.get(CONF_SWITCH_COMMAND_TOPIC, MQTT_COMMAND_TOPIC),
+                config.get(CONF_SWITCH_STATE_TOPIC, MQTT_STATE_TOPIC),
+                Instrumentation(
+                    config.get(CONF_INSTRUMENTATION, DEFAULT_INSTRUMENTATION)
+                ),
+            )
+        ]
+    )
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the switch of a heat source or the power switches of the zones."""
+    data: ClimateControlData | HeatSourceData = hass.data[DOMAIN][
+        config_entry.entry_id
+    ]
+    if isinstance(data, HeatSourceData):
+        async_add_entities(
+            [
+                HeatSourceSwitch(
+                    hass, data.config, config_entry.entry_id, data.instrumentation
+                )
+            ]
+        )
+        return
+
+    async_add_entities(
+        ZonePowerSwitch(controller)
+        for controller in data.controllers.values()
+        if controller.has_power_channel
+    )
 
 class ClimateSwitch(SwitchEntity):
     """Representation of a Climate switch."""
 
     _attr_name = "Climate"
     _attr_unique_id = "climate_switch"
+    _attr_available = False
 
-    def __init__(self, hass: HomeAssistant) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        command_topic: str = MQTT_COMMAND_TOPIC,
+        state_topic: str = MQTT_STATE_TOPIC,
+        instrumentation: Instrumentation | None = None,
+    ) -> None:
         """Initialize the switch."""
         self.hass = hass
+        self._command_topic = command_topic
+        self._state_topic = state_topic
+        self._instrumentation = instrumentation or Instrumentation()
         self._attr_is_on = False
+        self._reported_is_on = False
+        self._reconciler = CommandReconciler(
+            hass,
+            self._async_publish,
+            (command_topic,),
+            self.async_write_ha_state,
+            self._async_give_up,
+        )
 
     async def async_added_to_hass(self) -> None:
-        """Subscribe to MQTT events."""
-        await mqtt.async_subscribe(
-            self.hass,
-            MQTT_STATE_TOPIC,
-            self._mqtt_message_received,
-            1
+        """Subscribe to MQTT events in the background until the switch is removed.
+
+        The setup does not wait for the MQTT client, the switch is unavailable
+        until its state topic is subscribed.
+        """
+        task = self.hass.async_create_background_task(
+            self._async_subscribe_when_ready(),
+            f"{DOMAIN} subscribe {self.entity_id}",
         )
+        self.async_on_remove(task.cancel)
+
+    async def _async_subscribe_when_ready(self) -> None:
+        """Subscribe to the state topic once the MQTT client is available."""
+        if not await mqtt.async_wait_for_mqtt_client(self.hass):
+            _LOGGER.error(
+                "MQTT is not available, not subscribing to %s", self._state_topic
+            )
+            return
+        self.async_on_remove(
+            await mqtt.async_subscribe(
+                self.hass,
+                self._state_topic,
+                self._mqtt_message_received,
+                1,
+            )
+        )
+        self._attr_available = True
+        self.async_write_ha_state()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Stop retrying unconfirmed commands."""
+        self._reconciler.async_shutdown()
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return whether a command waits for confirmation."""
+        return {ATTR_UNCONFIRMED: bool(self._reconciler.unconfirmed)}
 
     @callback
     def _mqtt_message_received(self, message):
-        """Handle new MQTT messages."""
-        payload = message.payload
-        self._attr_is_on = payload == "ON"
+        """Handle new MQTT messages, timing them while instrumented."""
+        if not self._instrumentation.enabled:
+            self._async_handle_state(message.payload)
+            return
+        started = perf_counter()
+        self._instrumentation.record_echo(self._command_topic, message.payload)
+        self._async_handle_state(message.payload)
+        self._instrumentation.record_message(started)
+
+    @callback
+    def _async_handle_state(self, payload: str) -> None:
+        """Take the reported state of the switch."""
+        self._reconciler.async_resolve(self._command_topic, payload)
+        self._attr_is_on = self._reported_is_on = payload == "ON"
         self.async_write_ha_state()
 
+    @callback
+    def _async_give_up(self, topic: str, payload: str) -> None:
+        """Return to the reported state when a command was not confirmed."""
+        self._attr_is_on = self._reported_is_on
+
+    async def _async_publish(self, topic: str, payload: str) -> None:
+        """Publish a command to the switch, timing it while instrumented."""
+        if not self._instrumentation.enabled:
+            await mqtt.async_publish(self.hass, topic, payload)
+            return
+        started = perf_counter()
+        await mqtt.async_publish(self.hass, topic, payload)
+        self._instrumentation.record_publish(topic, payload, started)
+
     async def async_turn_on(self, **kwargs: Any) -> None:
-        """Turn the switch on."""
-        await mqtt.async_publish(
-            self.hass, MQTT_COMMAND_TOPIC, "ON"
-        )
+        """Turn the switch on, optimistically until the state confirms it."""
+        await self._async_publish(self._command_topic, "ON")
         self._attr_is_on = True
+        self._reconciler.async_track(self._command_topic, "ON")
 
     async def async_turn_off(self, **kwargs: Any) -> None:
-        """Turn the switch off."""
-        await mqtt.async_publish(
-            self.hass, MQTT_COMMAND_TOPIC, "OFF"
+        """Turn the switch off, optimistically until the state confirms it."""
+        await self._async_publish(self._command_topic, "OFF")
+        self._attr_is_on = False
+        self._reconciler.async_track(self._command_topic, "OFF")
+
+
+class HeatSourceSwitch(ClimateSwitch):
+    """Switch of a heat source config entry."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config: Mapping[str, Any],
+        entry_id: str,
+        instrumentation: Instrumentation,
+    ) -> None:
+        """Initialize the switch."""
+        super().__init__(
+            hass,
+            config[CONF_SWITCH_COMMAND_TOPIC],
+            config[CONF_SWITCH_STATE_TOPIC],
+            instrumentation,
         )
-        self._attr_is_on = False 
\ No newline at end of file
+        self._attr_name = config[CONF_NAME]
+        self._attr_unique_id = f"{entry_id}_switch"
+
+
+class ZonePowerSwitch(SwitchEntity):
+    """Power channel of a Climate Control zone.
+
+    The switch belongs to the device of the climate entity of its zone and
+    drives the same power channel: its commands go through the command
+    coalescer and reconciler of the climate entity, and it shows the power
+    state the climate entity received.
+    """
+
+    _attr_has_entity_name = True
+    _attr_name = "Power"
+
+    def __init__(self, controller: ClimateController) -> None:
+        """Initialize the switch."""
+        self._controller = controller
+        self._attr_unique_id = f"{controller.unique_id}_power"
+        self._attr_device_info = controller.device_info
+        self._attr_is_on = controller.power
+        self._unconfirmed = controller.power_unconfirmed
+
+    async def async_added_to_hass(self) -> None:
+        """Follow the power channel of the climate entity."""
+        self.async_on_remove(
+            self._controller.async_add_listener(self._async_controller_updated)
+        )
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return whether a command waits for confirmation."""
+        return {ATTR_UNCONFIRMED: self._unconfirmed}
+
+    @callback
+    def _async_controller_updated(self, controller: ClimateController) -> None:
+        """Write the state if the power channel changed."""
+        is_on, unconfirmed = controller.power, controller.power_unconfirmed
+        if is_on != self._attr_is_on or unconfirmed != self._unconfirmed:
+            self._attr_is_on = is_on
+            self._unconfirmed = unconfirmed
+            self.async_write_ha_state()
+
+    async def async_turn_on(self, **kwargs: Any) -> None:
+        """Turn the zone on."""
+        await self._controller.async_turn_on()
+
+    async def async_turn_off(self, **kwargs: Any) -> None:
+        """Turn the zone off."""
+        await self._controller.async_turn_off()
@@ -0,0 +1,38 @@
+"""Fixtures for the Climate Control tests.
+
+The repository root is the integration folder itself, so it is linked into
+a temporary ``custom_components`` package on the path, where Home Assistant
+looks for custom integrations.
+"""
+from __future__ import annotations
+
+import atexit
+from pathlib import Path
+import shutil
+import sys
+import tempfile
+
+import pytest
+
+INTEGRATION_DIR = Path(__file__).resolve().parent.parent
+DOMAIN = "climate_control"
+
+
+def _link_custom_components() -> None:
+    """Make the integration importable as custom_components.climate_control."""
+    root = Path(tempfile.mkdtemp(prefix=f"{DOMAIN}_tests_"))
+    atexit.register(shutil.rmtree, root, True)
+    custom_components = root / "custom_components"
+    custom_components.mkdir()
+    (custom_components / "__init__.py").touch()
+    (custom_components / DOMAIN).symlink_to(INTEGRATION_DIR, True)
+    sys.path.insert(0, str(root))
+
+
+_link_custom_components()
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Let Home Assistant load the integration in every test."""
+    yield
@@ -0,0 +1,92 @@
+"""Tests of the heat source accounting."""
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+from homeassistant.const import CONF_NAME, STATE_OFF, STATE_ON
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity_component import async_update_entity
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.climate_control.const import (
+    ATTR_ACTIVE_ZONES,
+    CONF_CLIMATE_ENTITIES,
+    CONF_DEMAND_OFF_THRESHOLD,
+    CONF_DEMAND_ON_THRESHOLD,
+    CONF_ENTRY_TYPE,
+    CONF_MIN_OFF_TIME,
+    CONF_MIN_ON_TIME,
+    CONF_SWITCH_COMMAND_TOPIC,
+    CONF_SWITCH_STATE_TOPIC,
+    DOMAIN,
+    ENTRY_TYPE_HEAT_SOURCE,
+)
+from custom_components.climate_control.models import HeatSourceData
+
+KITCHEN = "climate.kitchen"
+
+
+def _heat_source_entry(name: str) -> MockConfigEntry:
+    """Return a heat source entry switched by the kitchen."""
+    slug = name.lower()
+    return MockConfigEntry(
+        domain=DOMAIN,
+        title=name,
+        data={
+            CONF_ENTRY_TYPE: ENTRY_TYPE_HEAT_SOURCE,
+            CONF_NAME: name,
+            CONF_SWITCH_COMMAND_TOPIC: f"{slug}/set",
+            CONF_SWITCH_STATE_TOPIC: f"{slug}/state",
+            CONF_CLIMATE_ENTITIES: [KITCHEN],
+            CONF_DEMAND_ON_THRESHOLD: 1,
+            CONF_DEMAND_OFF_THRESHOLD: 0,
+            CONF_MIN_ON_TIME: 0,
+            CONF_MIN_OFF_TIME: 0,
+        },
+    )
+
+
+async def test_heat_sources_are_accounted_separately(hass: HomeAssistant) -> None:
+    """Each heat source entry counts the cycles of its own switch."""
+    boiler = _heat_source_entry("Boiler")
+    heat_pump = _heat_source_entry("Heat pump")
+    with patch(
+        "homeassistant.components.mqtt.async_wait_for_mqtt_client",
+        AsyncMock(return_value=False),
+    ):
+        for entry in (boiler, heat_pump):
+            entry.add_to_hass(hass)
+            assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    registry = er.async_get(hass)
+    data: HeatSourceData = hass.data[DOMAIN][boiler.entry_id]
+    hass.states.async_set(data.switch_entity_id, STATE_ON)
+    hass.states.async_set(data.switch_entity_id, STATE_OFF)
+    hass.states.async_set(data.switch_entity_id, STATE_ON)
+    hass.states.async_set(
+        data.demand_entity_id, STATE_ON, {ATTR_ACTIVE_ZONES: [KITCHEN]}
+    )
+    await hass.async_block_till_done()
+
+    cycles = {}
+    for entry in (boiler, heat_pump):
+        entity_id = registry.async_get_entity_id(
+            "sensor", DOMAIN, f"{entry.entry_id}_accounting_cycles"
+        )
+        await async_update_entity(hass, entity_id)
+        cycles[entry.title] = hass.states.get(entity_id).state
+    assert cycles == {"Boiler": "2", "Heat pump": "0"}
+
+    zone_sensors = {
+        entry.title: registry.async_get_entity_id(
+            "sensor", DOMAIN, f"{entry.entry_id}_accounting_{KITCHEN}_on_time"
+        )
+        for entry in (boiler, heat_pump)
+    }
+    assert zone_sensors["Boiler"] is not None
+    assert zone_sensors["Heat pump"] is None
+
+    for entry in (boiler, heat_pump):
+        assert await hass.config_entries.async_unload(entry.entry_id)
@@ -0,0 +1,133 @@
+"""Tests of the command coalescer."""
+from __future__ import annotations
+
+from datetime import timedelta
+from unittest.mock import AsyncMock, Mock
+
+from homeassistant.core import HomeAssistant
+import homeassistant.util.dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.climate_control.coalescer import CommandCoalescer
+from custom_components.climate_control.reconcile import CommandReconciler
+
+MODE = "zone/mode/set"
+TEMPERATURE = "zone/temperature/set"
+
+
+async def _async_expire(hass: HomeAssistant, seconds: float) -> None:
+    """Run the timers due within the given seconds."""
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=seconds))
+    await hass.async_block_till_done()
+
+
+async def test_debounce_publishes_last_value(hass: HomeAssistant) -> None:
+    """Commands queued within the debounce are merged per topic."""
+    publish = AsyncMock()
+    coalescer = CommandCoalescer(hass, publish, 0.5, 2.0)
+
+    coalescer.async_queue(TEMPERATURE, "20")
+    coalescer.async_queue(TEMPERATURE, "21")
+    coalescer.async_queue(MODE, "heat")
+    publish.assert_not_called()
+
+    await _async_expire(hass, 1)
+    assert publish.await_args_list == [
+        ((TEMPERATURE, "21"),),
+        ((MODE, "heat"),),
+    ]
+    assert coalescer.published == 2
+    assert coalescer.coalesced == 1
+
+
+async def test_acknowledged_state_is_not_published(hass: HomeAssistant) -> None:
+    """A command matching the reported state is dropped."""
+    publish = AsyncMock()
+    coalescer = CommandCoalescer(hass, publish, 0.5, 2.0)
+
+    coalescer.async_acknowledge(MODE, "heat")
+    coalescer.async_queue(MODE, "heat")
+    await coalescer.async_flush()
+    await coalescer.async_publish_now(MODE, "heat")
+
+    publish.assert_not_called()
+    assert coalescer.deduplicated == 2
+    assert coalescer.suppressed == 2
+
+
+async def test_publish_now_replaces_pending(hass: HomeAssistant) -> None:
+    """Publishing immediately supersedes a queued command of the topic."""
+    publish = AsyncMock()
+    coalescer = CommandCoalescer(hass, publish, 0.5, 2.0)
+
+    coalescer.async_queue(MODE, "cool")
+    await coalescer.async_publish_now(MODE, "heat")
+    await _async_expire(hass, 1)
+
+    publish.assert_awaited_once_with(MODE, "heat")
+    assert coalescer.coalesced == 1
+
+
+async def test_shutdown_drops_pending(hass: HomeAssistant) -> None:
+    """Pending commands are not published after a shutdown."""
+    publish = AsyncMock()
+    coalescer = CommandCoalescer(hass, publish, 0.5, 2.0)
+
+    coalescer.async_queue(MODE, "heat")
+    coalescer.async_shutdown()
+    await _async_expire(hass, 1)
+
+    publish.assert_not_called()
+
+
+async def test_published_commands_are_tracked(hass: HomeAssistant) -> None:
+    """Published commands wait in the reconciler until acknowledged."""
+    publish = AsyncMock()
+    reconciler = CommandReconciler(hass, publish, [MODE], Mock())
+    coalescer = CommandCoalescer(hass, publish, 0.5, 2.0, reconciler=reconciler)
+
+    await coalescer.async_publish_now(MODE, "heat")
+    assert reconciler.unconfirmed == [MODE]
+
+    coalescer.async_acknowledge(MODE, "heat")
+    assert reconciler.unconfirmed == []
+    reconciler.async_shutdown()
+
+
+async def test_command_back_to_acknowledged_state(hass: HomeAssistant) -> None:
+    """A command back to the reported state is sent while another is unconfirmed.
+
+    The device is still in 22 but heading to 21, so 22 has to be sent again.
+    """
+    publish = AsyncMock()
+    reconciler = CommandReconciler(hass, publish, [TEMPERATURE], Mock())
+    coalescer = CommandCoalescer(hass, publish, 0.5, 2.0, reconciler=reconciler)
+
+    coalescer.async_acknowledge(TEMPERATURE, "22")
+    await coalescer.async_publish_now(TEMPERATURE, "21")
+    await coalescer.async_publish_now(TEMPERATURE, "22")
+
+    assert publish.await_args_list == [
+        ((TEMPERATURE, "21"),),
+        ((TEMPERATURE, "22"),),
+    ]
+    assert reconciler.pending_payload(TEMPERATURE) == "22"
+    assert coalescer.deduplicated == 0
+    reconciler.async_shutdown()
+
+
+async def test_unconfirmed_command_is_not_repeated(hass: HomeAssistant) -> None:
+    """Repeating a command waiting for confirmation keeps its retries."""
+    publish = AsyncMock()
+    reconciler = CommandReconciler(hass, publish, [TEMPERATURE], Mock())
+    coalescer = CommandCoalescer(hass, publish, 0.5, 2.0, reconciler=reconciler)
+
+    coalescer.async_acknowledge(TEMPERATURE, "22")
+    await coalescer.async_publish_now(TEMPERATURE, "21")
+    coalescer.async_queue(TEMPERATURE, "21")
+    await coalescer.async_flush()
+
+    publish.assert_awaited_once_with(TEMPERATURE, "21")
+    assert coalescer.deduplicated == 1
+    assert reconciler.unconfirmed == [TEMPERATURE]
+    reconciler.async_shutdown()
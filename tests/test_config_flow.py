@@ -0,0 +1,137 @@
+"""Tests of the Climate Control config flow."""
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant import config_entries
+from homeassistant.const import CONF_NAME
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+
+from custom_components.climate_control.const import (
+    CONF_CURRENT_TEMPERATURE_TOPIC,
+    CONF_MODE_COMMAND_TOPIC,
+    CONF_MODE_STATE_TOPIC,
+    CONF_TEMPERATURE_COMMAND_TOPIC,
+    CONF_TEMPERATURE_STATE_TOPIC,
+    DOMAIN,
+    ERROR_MQTT_UNAVAILABLE,
+    ERROR_TOPIC_NOT_EXIST,
+)
+
+DEVICE_INPUT = {
+    CONF_NAME: "Kitchen",
+    CONF_MODE_COMMAND_TOPIC: "kitchen/mode/set",
+    CONF_MODE_STATE_TOPIC: "kitchen/mode/state",
+    CONF_TEMPERATURE_COMMAND_TOPIC: "kitchen/temperature/set",
+    CONF_TEMPERATURE_STATE_TOPIC: "kitchen/temperature/state",
+    CONF_CURRENT_TEMPERATURE_TOPIC: "kitchen/current_temperature",
+}
+STATE_TOPICS = {
+    DEVICE_INPUT[CONF_MODE_STATE_TOPIC],
+    DEVICE_INPUT[CONF_TEMPERATURE_STATE_TOPIC],
+    DEVICE_INPUT[CONF_CURRENT_TEMPERATURE_TOPIC],
+}
+
+
+class FakeBroker:
+    """Answer subscriptions to retained topics after a delay."""
+
+    def __init__(self, retained: set[str]) -> None:
+        """Initialize the broker."""
+        self.retained = retained
+        self.subscribed: list[str] = []
+        self.active = 0
+        self.max_active = 0
+
+    async def async_wait_for_mqtt_client(self, hass: HomeAssistant) -> bool:
+        """Report the client as connected."""
+        return True
+
+    async def async_subscribe(self, hass, topic, msg_callback, qos=0):
+        """Deliver the retained message of a topic shortly after subscribing."""
+        self.subscribed.append(topic)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        if topic in self.retained:
+            hass.loop.call_later(
+                0.01, msg_callback, SimpleNamespace(topic=topic, payload="1")
+            )
+
+        def unsubscribe() -> None:
+            self.active -= 1
+
+        return unsubscribe
+
+
+@pytest.fixture
+def broker(hass: HomeAssistant):
+    """Patch the MQTT client with a fake broker."""
+    hass.config.components.add("mqtt")
+    broker = FakeBroker(set(STATE_TOPICS))
+    with patch(
+        "homeassistant.components.mqtt.async_wait_for_mqtt_client",
+        broker.async_wait_for_mqtt_client,
+    ), patch(
+        "homeassistant.components.mqtt.async_subscribe", broker.async_subscribe
+    ), patch(
+        "custom_components.climate_control.config_flow.TOPIC_VALIDATION_TIMEOUT",
+        0.1,
+    ):
+        yield broker
+
+
+async def _async_device_step(hass: HomeAssistant) -> str:
+    """Start a flow and open the device step."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    assert result["type"] == FlowResultType.MENU
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {"next_step_id": "device"}
+    )
+    assert result["step_id"] == "device"
+    return result["flow_id"]
+
+
+async def test_device_topics_are_validated(
+    hass: HomeAssistant, broker: FakeBroker
+) -> None:
+    """The state topics of a device are confirmed concurrently."""
+    flow_id = await _async_device_step(hass)
+    result = await hass.config_entries.flow.async_configure(flow_id, DEVICE_INPUT)
+
+    assert result["type"] == FlowResultType.FORM
+    assert result["step_id"] == "climate"
+    assert set(broker.subscribed) == STATE_TOPICS
+    assert broker.max_active == len(STATE_TOPICS)
+    assert broker.active == 0
+
+
+async def test_missing_topic_is_checked_again(
+    hass: HomeAssistant, broker: FakeBroker
+) -> None:
+    """Only the topics that were not confirmed are checked on a retry."""
+    missing = DEVICE_INPUT[CONF_CURRENT_TEMPERATURE_TOPIC]
+    broker.retained.discard(missing)
+    flow_id = await _async_device_step(hass)
+
+    result = await hass.config_entries.flow.async_configure(flow_id, DEVICE_INPUT)
+    assert result["errors"] == {"base": ERROR_TOPIC_NOT_EXIST}
+
+    broker.subscribed.clear()
+    broker.retained.add(missing)
+    result = await hass.config_entries.flow.async_configure(flow_id, DEVICE_INPUT)
+    assert result["step_id"] == "climate"
+    assert broker.subscribed == [missing]
+
+
+async def test_mqtt_not_loaded(hass: HomeAssistant) -> None:
+    """The device step needs the MQTT integration."""
+    flow_id = await _async_device_step(hass)
+    result = await hass.config_entries.flow.async_configure(flow_id, DEVICE_INPUT)
+
+    assert result["errors"] == {"base": ERROR_MQTT_UNAVAILABLE}
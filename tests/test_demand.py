@@ -0,0 +1,70 @@
+"""Tests of the demand engine."""
+from __future__ import annotations
+
+import pytest
+
+from custom_components.climate_control.demand import (
+    DemandEngine,
+    replay_demand_trace,
+)
+
+
+def test_weighted_demand() -> None:
+    """Zones add their weight to the demand, 1 by default."""
+    engine = DemandEngine({"kitchen": 0.5, "office": 2})
+    engine.update_demand(["kitchen", "office", "hall"])
+    assert engine.demand == 3.5
+
+
+@pytest.mark.parametrize(
+    ("is_on", "demand", "wanted"),
+    [
+        (False, 1.0, False),
+        (False, 2.0, True),
+        (True, 1.0, True),
+        (True, 0.5, False),
+    ],
+)
+def test_hysteresis(is_on: bool, demand: float, wanted: bool) -> None:
+    """The switch turns on at the on and off at the off threshold."""
+    engine = DemandEngine(on_threshold=2, off_threshold=0.5, is_on=is_on)
+    engine.demand = demand
+    assert engine.wanted is wanted
+
+
+def test_minimum_times_hold_changes() -> None:
+    """Changes wait for the minimum on and off time."""
+    engine = DemandEngine(min_on_time=300, min_off_time=120)
+    engine.demand = 1
+    assert engine.evaluate(0) == (True, None)
+    engine.set_switch_state(True, 0)
+
+    engine.demand = 0
+    assert engine.evaluate(100) == (None, 200)
+    assert engine.evaluate(300) == (False, None)
+    engine.set_switch_state(False, 300)
+
+    engine.demand = 1
+    assert engine.evaluate(400) == (None, 20)
+    assert engine.evaluate(420) == (True, None)
+
+
+def test_no_command_in_requested_state() -> None:
+    """Nothing is commanded while the switch is already as wanted."""
+    engine = DemandEngine(is_on=True)
+    engine.demand = 1
+    assert engine.evaluate(0) == (None, None)
+
+
+def test_replay_counts_cycles() -> None:
+    """Short dips are held back by the minimum off time of the replay."""
+    trace = [(0, 1), (60, 0), (90, 1), (400, 0), (1000, 0)]
+
+    free = replay_demand_trace(trace, DemandEngine())
+    assert (free.cycles, free.commands) == (2, 4)
+    assert free.on_time == 60 + 310
+    assert free.duration == 1000
+
+    held = replay_demand_trace(trace, DemandEngine(min_on_time=180))
+    assert (held.cycles, held.commands) == (1, 2)
+    assert held.on_time == 400
@@ -0,0 +1,104 @@
+"""Round trip tests of the setpoint formatter against the payload decoder."""
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from custom_components.climate_control import decoder, formatter
+
+SEED = 20240601
+SAMPLES = 2000
+
+STEPS = (0.1, 0.2, 0.25, 0.5, 1.0)
+LIMITS = ((5, 30), (7, 35), (7.5, 35.5), (10.3, 25.7))
+TEMPLATES = (
+    ("plain", "raw"),
+    ("json:setpoint", "json:setpoint"),
+    ("json:state.target", "json:state.target"),
+    ("scaled:10", "raw"),
+    ("scaled:100", "raw"),
+)
+
+
+def _cases(rng: random.Random):
+    """Yield formatters and setpoints, including values beyond the limits."""
+    for _ in range(SAMPLES):
+        template, decoder = rng.choice(TEMPLATES)
+        step = rng.choice(STEPS)
+        min_temp, max_temp = rng.choice(LIMITS)
+        setpoint = formatter.SetpointFormatter(template, step, min_temp, max_temp)
+        yield setpoint, decoder, rng.uniform(min_temp - 10, max_temp + 10)
+
+
+def _represents(setpoint: formatter.SetpointFormatter) -> bool:
+    """Return True if the scale factor can represent every step."""
+    factor = float(setpoint.spec.partition(":")[2])
+    return abs(setpoint.step * factor - round(setpoint.step * factor)) < 1e-9
+
+
+def test_quantize_is_idempotent() -> None:
+    """Quantizing a quantized setpoint keeps it."""
+    for setpoint, _, value in _cases(random.Random(SEED)):
+        quantized = setpoint.quantize(value)
+        assert setpoint.quantize(quantized) == quantized
+
+
+def test_quantize_within_limits() -> None:
+    """Quantized setpoints stay within the limits on the step grid."""
+    for setpoint, _, value in _cases(random.Random(SEED)):
+        quantized = setpoint.quantize(value)
+        assert setpoint.min_temp <= quantized <= setpoint.max_temp
+        steps = quantized / setpoint.step
+        assert abs(steps - round(steps)) < 1e-6
+
+
+def test_round_trip_through_decoder() -> None:
+    """A formatted setpoint decodes and parses to the same setpoint.
+
+    Scale factors too coarse for the step lose the step on the device.
+    """
+    for setpoint, spec, value in _cases(random.Random(SEED)):
+        if setpoint.spec.startswith("scaled:") and not _represents(setpoint):
+            continue
+        quantized = setpoint.quantize(value)
+        payload = setpoint.format(quantized)
+        reported = decoder.PayloadDecoder(spec)(payload)
+        assert setpoint.parse(reported) == quantized
+        assert setpoint.confirmed_payload(reported) == payload
+
+
+@pytest.mark.parametrize(
+    ("template", "reported", "payload"),
+    [
+        ("plain", "21.0", "21"),
+        ("plain", "20.6", "20.6"),
+        ("scaled:10", "210", "210"),
+        ("scaled:10", "206", "206"),
+    ],
+)
+def test_confirmed_payload(template: str, reported: str, payload: str) -> None:
+    """Only setpoints on the grid confirm the payload of a command."""
+    setpoint = formatter.SetpointFormatter(template, 1.0, 5, 30)
+    assert setpoint.confirmed_payload(reported) == payload
+
+
+@pytest.mark.parametrize(
+    ("template", "payload"),
+    [
+        ("plain", "21.5"),
+        ("json:setpoint", '{"setpoint": 21.5}'),
+        ("json:a.b", '{"a": {"b": 21.5}}'),
+        ("scaled:10", "215"),
+    ],
+)
+def test_format(template: str, payload: str) -> None:
+    """Setpoints are formatted by the template."""
+    setpoint = formatter.SetpointFormatter(template, 0.5, 5, 30)
+    assert setpoint.format(setpoint.quantize(21.4999)) == payload
+
+
+@pytest.mark.parametrize("template", ["", "plain:1", "json", "scaled:0", "scaled:x"])
+def test_invalid_template(template: str) -> None:
+    """Invalid templates are rejected."""
+    assert not formatter.is_valid_template(template)
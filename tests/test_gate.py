@@ -0,0 +1,119 @@
+"""Tests of the inbound gate."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from types import SimpleNamespace
+
+from custom_components.climate_control.gate import InboundGate
+
+
+class FakeHandle:
+    """A timer handle of the fake loop."""
+
+    def __init__(self, when: float, callback: Callable[[], None]) -> None:
+        """Initialize the handle."""
+        self.when = when
+        self.callback = callback
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        """Cancel the timer."""
+        self.cancelled = True
+
+
+class FakeLoop:
+    """An event loop clock that only moves when advanced."""
+
+    def __init__(self) -> None:
+        """Initialize the loop at time 0."""
+        self.now = 0.0
+        self.handles: list[FakeHandle] = []
+
+    def time(self) -> float:
+        """Return the loop time."""
+        return self.now
+
+    def call_at(self, when: float, callback: Callable[[], None]) -> FakeHandle:
+        """Schedule a callback."""
+        handle = FakeHandle(when, callback)
+        self.handles.append(handle)
+        return handle
+
+    def advance(self, seconds: float) -> None:
+        """Move the clock and run the callbacks that became due."""
+        self.now += seconds
+        due = [handle for handle in self.handles if handle.when <= self.now]
+        self.handles = [handle for handle in self.handles if handle not in due]
+        for handle in due:
+            if not handle.cancelled:
+                handle.callback()
+
+
+def _gate(min_interval: float = 0, deadband: float = 0):
+    """Return a gate on a fake loop, the loop and the forwarded values."""
+    loop = FakeLoop()
+    forwarded: list[float] = []
+    gate = InboundGate(
+        SimpleNamespace(loop=loop), forwarded.append, min_interval, deadband
+    )
+    return gate, loop, forwarded
+
+
+def test_disabled_gate_forwards_everything() -> None:
+    """Without an interval or deadband every value is forwarded."""
+    gate, _, forwarded = _gate()
+    for value in (20.0, 20.0, 20.1):
+        gate.async_offer(value)
+    assert not gate.enabled
+    assert forwarded == [20.0, 20.0, 20.1]
+
+
+def test_deadband_drops_small_changes() -> None:
+    """Values within the deadband of the last forwarded value are dropped."""
+    gate, _, forwarded = _gate(deadband=0.5)
+    for value in (20.0, 20.2, 20.4, 20.5, 20.1):
+        gate.async_offer(value)
+    assert forwarded == [20.0, 20.5]
+    assert gate.forwarded == 2
+    assert gate.dropped == 3
+
+
+def test_interval_forwards_last_value() -> None:
+    """Values within the interval are held and the last one forwarded."""
+    gate, loop, forwarded = _gate(min_interval=10)
+    gate.async_offer(20.0)
+    loop.advance(1)
+    gate.async_offer(20.1)
+    gate.async_offer(20.2)
+    assert forwarded == [20.0]
+
+    loop.advance(9)
+    assert forwarded == [20.0, 20.2]
+    assert gate.dropped == 1
+
+    loop.advance(10)
+    gate.async_offer(20.3)
+    assert forwarded == [20.0, 20.2, 20.3]
+
+
+def test_return_within_deadband_drops_held_value() -> None:
+    """A held value is dropped once the value returns within the deadband."""
+    gate, loop, forwarded = _gate(min_interval=10, deadband=0.5)
+    gate.async_offer(20.0)
+    gate.async_offer(21.0)
+    gate.async_offer(20.1)
+    loop.advance(10)
+
+    assert forwarded == [20.0]
+    assert gate.dropped == 2
+
+
+def test_shutdown_drops_held_value() -> None:
+    """A held value is not forwarded after a shutdown."""
+    gate, loop, forwarded = _gate(min_interval=10)
+    gate.async_offer(20.0)
+    gate.async_offer(21.0)
+    gate.async_shutdown()
+    loop.advance(10)
+
+    assert forwarded == [20.0]
@@ -0,0 +1,127 @@
+"""Tests of the command reconciler."""
+from __future__ import annotations
+
+from datetime import timedelta
+from unittest.mock import AsyncMock, Mock
+
+from homeassistant.core import HomeAssistant
+import homeassistant.util.dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.climate_control.reconcile import (
+    DATA_RETRY_LIMITER,
+    RETRY_MAX_ATTEMPTS,
+    RETRY_MAX_DELAY,
+    CommandReconciler,
+    RetryLimiter,
+    retry_delay,
+)
+
+MODE = "zone/mode/set"
+POWER = "zone/power/set"
+
+
+async def _async_retry_all(hass: HomeAssistant, retries: int) -> None:
+    """Run the given number of retry timers."""
+    now = dt_util.utcnow()
+    for retry in range(1, retries + 1):
+        async_fire_time_changed(hass, now + timedelta(seconds=RETRY_MAX_DELAY * retry))
+        await hass.async_block_till_done()
+
+
+def test_retry_delay_backs_off() -> None:
+    """The delay doubles per attempt, with jitter and a maximum."""
+    for attempt in range(8):
+        delay = min(RETRY_MAX_DELAY, 2.0 * 2**attempt)
+        assert delay / 2 <= retry_delay(attempt) <= delay
+
+
+async def test_resolve_confirms_matching_payload(hass: HomeAssistant) -> None:
+    """Only the commanded value confirms a command."""
+    on_change = Mock()
+    reconciler = CommandReconciler(hass, AsyncMock(), [MODE], on_change)
+
+    reconciler.async_track(MODE, "heat")
+    assert reconciler.unconfirmed == [MODE]
+    on_change.assert_called_once()
+
+    reconciler.async_resolve(MODE, "cool")
+    assert reconciler.unconfirmed == [MODE]
+
+    reconciler.async_resolve(MODE, "heat")
+    assert reconciler.unconfirmed == []
+    assert on_change.call_count == 2
+
+
+async def test_untracked_topic_is_ignored(hass: HomeAssistant) -> None:
+    """Commands without a state topic are not tracked."""
+    on_change = Mock()
+    reconciler = CommandReconciler(hass, AsyncMock(), [MODE], on_change)
+
+    reconciler.async_track(POWER, "ON")
+    assert reconciler.unconfirmed == []
+    on_change.assert_not_called()
+
+
+async def test_retries_then_gives_up(hass: HomeAssistant) -> None:
+    """An unconfirmed command is retried and then given up."""
+    publish = AsyncMock()
+    on_give_up = Mock()
+    reconciler = CommandReconciler(hass, publish, [MODE], Mock(), on_give_up)
+
+    reconciler.async_track(MODE, "heat")
+    await _async_retry_all(hass, RETRY_MAX_ATTEMPTS + 1)
+
+    assert publish.await_count == RETRY_MAX_ATTEMPTS
+    publish.assert_awaited_with(MODE, "heat")
+    assert reconciler.retries == RETRY_MAX_ATTEMPTS
+    assert reconciler.given_up == 1
+    on_give_up.assert_called_once_with(MODE, "heat")
+    assert reconciler.unconfirmed == []
+    assert hass.data[DATA_RETRY_LIMITER].outstanding == 0
+
+
+async def test_confirmed_command_is_not_retried(hass: HomeAssistant) -> None:
+    """A command confirmed before its retry is not published again."""
+    publish = AsyncMock()
+    reconciler = CommandReconciler(hass, publish, [MODE], Mock())
+
+    reconciler.async_track(MODE, "heat")
+    reconciler.async_resolve(MODE, "heat")
+    await _async_retry_all(hass, 1)
+
+    publish.assert_not_called()
+
+
+async def test_new_command_replaces_pending(hass: HomeAssistant) -> None:
+    """Only the latest command of a topic is retried."""
+    publish = AsyncMock()
+    reconciler = CommandReconciler(hass, publish, [MODE], Mock())
+
+    reconciler.async_track(MODE, "heat")
+    reconciler.async_track(MODE, "cool")
+    assert reconciler.pending_payload(MODE) == "cool"
+    await _async_retry_all(hass, 1)
+
+    publish.assert_awaited_once_with(MODE, "cool")
+    reconciler.async_shutdown()
+
+
+async def test_retries_are_capped(hass: HomeAssistant) -> None:
+    """Retries across reconcilers are limited by the shared limiter."""
+    limiter = hass.data[DATA_RETRY_LIMITER] = RetryLimiter(1)
+    publish = AsyncMock()
+    first = CommandReconciler(hass, publish, [MODE], Mock())
+    second = CommandReconciler(hass, publish, [MODE], Mock())
+
+    first.async_track(MODE, "heat")
+    second.async_track(MODE, "cool")
+    await _async_retry_all(hass, 1)
+
+    assert publish.await_count == 1
+    assert limiter.rejected == 1
+    assert limiter.outstanding == 1
+
+    first.async_shutdown()
+    second.async_shutdown()
+    assert limiter.outstanding == 0
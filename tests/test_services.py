@@ -0,0 +1,57 @@
+"""Tests of the Climate Control services."""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from homeassistant.const import CONF_NAME, CONF_PATH
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.setup import async_setup_component
+
+from custom_components.climate_control.const import DOMAIN, SERVICE_IMPORT_ZONES
+
+MANIFEST = """zone,mode_command_topic,temperature_command_topic,state_topic
+kitchen,kitchen/trv/mode/set,kitchen/trv/setpoint/set,kitchen/trv/state
+"""
+
+
+@pytest.fixture
+async def manifest(hass: HomeAssistant, tmp_path: Path) -> Path:
+    """Write a zone manifest and set up the integration."""
+    path = tmp_path / "zones.csv"
+    path.write_text(MANIFEST)
+    assert await async_setup_component(hass, DOMAIN, {})
+    return path
+
+
+async def test_import_outside_allowed_dirs(
+    hass: HomeAssistant, manifest: Path
+) -> None:
+    """Manifests outside the allowed directories are not read."""
+    hass.config.allowlist_external_dirs = set()
+    with pytest.raises(ServiceValidationError, match="allowlist_external_dirs"):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_IMPORT_ZONES,
+            {CONF_NAME: "Ground floor", CONF_PATH: str(manifest)},
+            blocking=True,
+            return_response=True,
+        )
+
+
+async def test_dry_run_of_allowed_manifest(
+    hass: HomeAssistant, manifest: Path
+) -> None:
+    """Manifests in an allowed directory are validated."""
+    hass.config.allowlist_external_dirs = {str(manifest.parent)}
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_IMPORT_ZONES,
+        {CONF_NAME: "Ground floor", CONF_PATH: str(manifest), "dry_run": True},
+        blocking=True,
+        return_response=True,
+    )
+    assert response["valid"] == 1
+    assert response["imported"] is False
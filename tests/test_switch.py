@@ -0,0 +1,141 @@
+"""Tests of the Climate Control switches."""
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from homeassistant.const import CONF_NAME, STATE_OFF, STATE_ON, STATE_UNAVAILABLE
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.climate_control.const import (
+    CONF_MODE_COMMAND_TOPIC,
+    CONF_MODE_STATE_TOPIC,
+    CONF_POWER_COMMAND_TOPIC,
+    CONF_POWER_STATE_TOPIC,
+    CONF_TEMPERATURE_COMMAND_TOPIC,
+    DEFAULT_PAYLOAD_ON,
+    DOMAIN,
+)
+from custom_components.climate_control.reconcile import ATTR_UNCONFIRMED
+from custom_components.climate_control.switch import MQTT_STATE_TOPIC
+
+ENTITY_ID = "switch.climate"
+POWER_COMMAND_TOPIC = "kitchen/power/set"
+POWER_STATE_TOPIC = "kitchen/power/state"
+
+
+async def test_subscribes_once_mqtt_is_available(hass: HomeAssistant) -> None:
+    """The setup does not wait for the MQTT client to connect."""
+    connected = asyncio.Event()
+    handlers = {}
+
+    async def async_wait_for_mqtt_client(hass: HomeAssistant) -> bool:
+        await connected.wait()
+        return True
+
+    async def async_subscribe(hass, topic, msg_callback, qos):
+        handlers[topic] = msg_callback
+        return lambda: None
+
+    with patch(
+        "homeassistant.components.mqtt.async_wait_for_mqtt_client",
+        async_wait_for_mqtt_client,
+    ), patch(
+        "homeassistant.components.mqtt.async_subscribe", async_subscribe
+    ), patch(
+        "homeassistant.components.mqtt.async_publish", AsyncMock()
+    ):
+        assert await async_setup_component(
+            hass, "switch", {"switch": {"platform": DOMAIN}}
+        )
+        await hass.async_block_till_done()
+        assert hass.states.get(ENTITY_ID).state == STATE_UNAVAILABLE
+        assert not handlers
+
+        connected.set()
+        await hass.async_block_till_done()
+        assert hass.states.get(ENTITY_ID).state == STATE_OFF
+
+        handlers[MQTT_STATE_TOPIC](SimpleNamespace(payload="ON"))
+        await hass.async_block_till_done()
+        assert hass.states.get(ENTITY_ID).state == STATE_ON
+
+
+async def test_power_switch_drives_the_zone(hass: HomeAssistant) -> None:
+    """The power switch shares the device and commands of its climate entity."""
+    handlers = {}
+    publish = AsyncMock()
+
+    async def async_subscribe(hass, topic, msg_callback, qos=0):
+        handlers[topic] = msg_callback
+        return lambda: None
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Kitchen",
+        data={
+            CONF_NAME: "Kitchen",
+            CONF_MODE_COMMAND_TOPIC: "kitchen/mode/set",
+            CONF_MODE_STATE_TOPIC: "kitchen/mode/state",
+            CONF_TEMPERATURE_COMMAND_TOPIC: "kitchen/temperature/set",
+            CONF_POWER_COMMAND_TOPIC: POWER_COMMAND_TOPIC,
+            CONF_POWER_STATE_TOPIC: POWER_STATE_TOPIC,
+        },
+    )
+    entry.add_to_hass(hass)
+    with patch(
+        "homeassistant.components.mqtt.async_wait_for_mqtt_client",
+        AsyncMock(return_value=True),
+    ), patch(
+        "homeassistant.components.mqtt.async_subscribe", async_subscribe
+    ), patch(
+        "homeassistant.components.mqtt.async_publish", publish
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+        registry = er.async_get(hass)
+        switch_id = registry.async_get_entity_id(
+            "switch", DOMAIN, f"{entry.entry_id}_power"
+        )
+        climate_id = registry.async_get_entity_id("climate", DOMAIN, entry.entry_id)
+        assert (
+            registry.async_get(switch_id).device_id
+            == registry.async_get(climate_id).device_id
+        )
+        assert hass.states.get(switch_id).name == "Kitchen Power"
+
+        await hass.services.async_call(
+            "switch", "turn_on", {"entity_id": switch_id}, blocking=True
+        )
+        await hass.services.async_call(
+            "climate", "turn_on", {"entity_id": climate_id}, blocking=True
+        )
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=5))
+        await hass.async_block_till_done()
+        publish.assert_awaited_once_with(
+            hass, POWER_COMMAND_TOPIC, DEFAULT_PAYLOAD_ON, 0, False
+        )
+        assert hass.states.get(switch_id).attributes[ATTR_UNCONFIRMED] is True
+
+        handlers[POWER_STATE_TOPIC](
+            SimpleNamespace(
+                topic=POWER_STATE_TOPIC, payload=DEFAULT_PAYLOAD_ON, retain=False
+            )
+        )
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=10))
+        await hass.async_block_till_done()
+        state = hass.states.get(switch_id)
+        assert state.state == STATE_ON
+        assert state.attributes[ATTR_UNCONFIRMED] is False
+
+        assert await hass.config_entries.async_unload(entry.entry_id)
@@ -0,0 +1,50 @@
+"""Tests of the zone group climate entity."""
+from __future__ import annotations
+
+import random
+from types import SimpleNamespace
+
+from homeassistant.components.climate import HVACMode
+from homeassistant.core import HomeAssistant
+
+from custom_components.climate_control.climate import ZoneGroupClimate
+from custom_components.climate_control.const import (
+    ATTR_TEMPERATURE_MAX,
+    ATTR_TEMPERATURE_MIN,
+)
+
+ZONES = 12
+UPDATES = 5000
+
+
+def _member(zone: str) -> SimpleNamespace:
+    """Return a zone with the attributes the group reads."""
+    return SimpleNamespace(
+        zone=zone,
+        current_temperature=None,
+        target_temperature=20.0,
+        hvac_mode=HVACMode.HEAT,
+    )
+
+
+async def test_spread_follows_the_zones(hass: HomeAssistant) -> None:
+    """The cached spread matches the current temperatures after each update."""
+    rng = random.Random(20240601)
+    members = [_member(f"zone_{index}") for index in range(ZONES)]
+    group = ZoneGroupClimate(hass, "group", members)
+
+    for _ in range(UPDATES):
+        member = rng.choice(members)
+        member.current_temperature = rng.choice(
+            [None, *(round(rng.uniform(15, 25) * 2) / 2 for _ in range(3))]
+        )
+        group._async_update_member(member)
+
+        currents = [
+            zone.current_temperature
+            for zone in members
+            if zone.current_temperature is not None
+        ]
+        attributes = group.extra_state_attributes
+        assert attributes.get(ATTR_TEMPERATURE_MIN) == min(currents, default=None)
+        assert attributes.get(ATTR_TEMPERATURE_MAX) == max(currents, default=None)
@@ -0,0 +1,93 @@
+"""Thermal model of a Climate Control zone."""
+from __future__ import annotations
+
+SECONDS_PER_HOUR = 3600
+
+# Samples are taken over at least this many seconds to keep sensor
+# quantization out of the rate, and gaps longer than the maximum are skipped
+MIN_SAMPLE_INTERVAL = 300.0
+MAX_SAMPLE_INTERVAL = 1800.0
+MIN_SAMPLES = 3
+
+
+class ThermalModel:
+    """Learn the heating and cooling rate of a zone online.
+
+    The rate of change of the current temperature, in degrees per hour, is
+    fitted as ``rate = a * heating + b`` by recursive least squares with
+    exponential forgetting. Each sample costs O(1) time and memory, so the
+    heating rate is ``a + b`` and the cooling rate is ``b``.
+    """
+
+    __slots__ = ("_forgetting", "_a", "_b", "_p00", "_p01", "_p11", "_anchor", "samples")
+
+    def __init__(self, forgetting: float = 0.995) -> None:
+        """Initialize the model."""
+        self._forgetting = forgetting
+        self._a = 0.0
+        self._b = 0.0
+        self._p00 = self._p11 = 100.0
+        self._p01 = 0.0
+        self._anchor: tuple[float, float, bool] | None = None
+        self.samples = 0
+
+    @property
+    def heating_rate(self) -> float | None:
+        """Return the learned rate while heating in degrees per hour."""
+        return self._a + self._b if self.samples >= MIN_SAMPLES else None
+
+    @property
+    def cooling_rate(self) -> float | None:
+        """Return the learned rate while not heating in degrees per hour."""
+        return self._b if self.samples >= MIN_SAMPLES else None
+
+    def add_sample(self, timestamp: float, temperature: float, heating: bool) -> None:
+        """Add a temperature sample, timestamp in seconds."""
+        anchor = self._anchor
+        if anchor is None or anchor[2] != heating or timestamp < anchor[0]:
+            self._anchor = (timestamp, temperature, heating)
+            return
+
+        elapsed = timestamp - anchor[0]
+        if elapsed < MIN_SAMPLE_INTERVAL:
+            return
+        self._anchor = (timestamp, temperature, heating)
+        if elapsed > MAX_SAMPLE_INTERVAL:
+            return
+
+        self._update(
+            1.0 if heating else 0.0,
+            (temperature - anchor[1]) / elapsed * SECONDS_PER_HOUR,
+        )
+
+    def _update(self, heating: float, rate: float) -> None:
+        """Update the fit with the regressor (heating, 1)."""
+        forgetting = self._forgetting
+        p00, p01, p11 = self._p00, self._p01, self._p11
+
+        px0 = p00 * heating + p01
+        px1 = p01 * heating + p11
+        denominator = forgetting + heating * px0 + px1
+        k0 = px0 / denominator
+        k1 = px1 / denominator
+
+        error = rate - (self._a * heating + self._b)
+        self._a += k0 * error
+        self._b += k1 * error
+
+        self._p00 = (p00 - k0 * px0) / forgetting
+        self._p01 = (p01 - k0 * px1) / forgetting
+        self._p11 = (p11 - k1 * px1) / forgetting
+        self.samples += 1
+
+    def lead_time(
+        self, current: float | None, target: float, max_lead: float
+    ) -> float:
+        """Return the seconds needed to heat from current to target.
+
+        Without a learned heating rate no lead time is used.
+        """
+        rate = self.heating_rate
+        if current is None or target <= current or rate is None or rate <= 0:
+            return 0.0
+        return min(max_lead, (target - current) / rate * SECONDS_PER_HOUR)
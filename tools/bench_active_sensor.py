@@ -0,0 +1,98 @@
+"""Benchmark the ClimateActiveSensor update path.
+
+Replays synthetic climate state changes through the original full group
+rescan and through the incremental active set of ``ClimateActiveSensor``.
+
+    python -m tools.bench_active_sensor --events 100000 --zones 80
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from types import SimpleNamespace
+
+from homeassistant.const import ATTR_ENTITY_ID, EVENT_STATE_CHANGED
+from homeassistant.core import Event, State
+
+from .common import load_integration
+
+STATES = ("heat", "cool", "auto", "off", "idle")
+
+
+def _rescan(states: dict[str, State], group: str) -> bool:
+    """Original ClimateActiveSensor.async_update algorithm."""
+    group_state = states.get(group)
+    if not group_state:
+        return False
+
+    active_climates = []
+    for entity_id in group_state.attributes.get(ATTR_ENTITY_ID, []):
+        state = states.get(entity_id)
+        if state and state.state not in ["off", "idle"]:
+            active_climates.append(entity_id)
+    return len(active_climates) > 0
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=100_000)
+    parser.add_argument("--zones", type=int, default=80)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    binary_sensor = load_integration("binary_sensor")
+    group = binary_sensor.CLIMATE_GROUP
+
+    rng = random.Random(args.seed)
+    zones = [f"climate.zone_{i}" for i in range(args.zones)]
+    events = [
+        State(entity_id, rng.choice(STATES))
+        for entity_id in (rng.choice(zones) for _ in range(args.events))
+    ]
+
+    def fresh_states() -> dict[str, State]:
+        states = {entity_id: State(entity_id, "off") for entity_id in zones}
+        states[group] = State(group, "on", {ATTR_ENTITY_ID: zones})
+        return states
+
+    # Original path: full rescan of the group on every event
+    states = fresh_states()
+    start = time.perf_counter()
+    for new_state in events:
+        states[new_state.entity_id] = new_state
+        old_result = _rescan(states, group)
+    old_elapsed = time.perf_counter() - start
+
+    # Incremental path
+    states = fresh_states()
+    state_events = [
+        Event(
+            EVENT_STATE_CHANGED,
+            {"entity_id": new_state.entity_id, "old_state": None, "new_state": new_state},
+        )
+        for new_state in events
+    ]
+    sensor = binary_sensor.ClimateActiveSensor(SimpleNamespace(states=states))
+    sensor.async_write_ha_state = lambda: None
+    sensor._members = frozenset(zones)
+    start = time.perf_counter()
+    for event in state_events:
+        new_state = event.data["new_state"]
+        states[new_state.entity_id] = new_state
+        sensor._handle_climate_state_change(event)
+    new_elapsed = time.perf_counter() - start
+
+    assert sensor.is_on == old_result
+
+    for label, elapsed in (("rescan", old_elapsed), ("incremental", new_elapsed)):
+        print(
+            f"{label:>12}: {elapsed * 1000:9.1f} ms total, "
+            f"{elapsed / args.events * 1e6:7.3f} us/event"
+        )
+    print(f"{'speedup':>12}: {old_elapsed / new_elapsed:9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Benchmark the payload decoders.
+
+Reports the decode throughput per message of each decoder type, and of the
+combined JSON state topic compared with decoding three attributes
+separately.
+
+    python -m tools.bench_decoders --messages 200000
+"""
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable
+import time
+
+from .common import load_integration
+
+JSON_PAYLOAD = '{"mode": "heat", "temperature": 21.5, "current_temperature": 20.3}'
+RAW_PAYLOAD = "21.5"
+REGEX_PAYLOAD = "M=heat;T=21.5;C=20.3"
+
+
+def _measure(label: str, func: Callable[[], object], messages: int) -> None:
+    """Run func once per message and print the time per message."""
+    start = time.perf_counter()
+    for _ in range(messages):
+        func()
+    elapsed = time.perf_counter() - start
+    print(
+        f"{label:>28}: {elapsed / messages * 1e9:8.0f} ns/msg "
+        f"{messages / elapsed:12.0f} msg/s"
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=200_000)
+    args = parser.parse_args()
+
+    decoder = load_integration("decoder")
+    const = load_integration("const")
+    json_loads = decoder.json_loads
+
+    raw = decoder.PayloadDecoder("raw")
+    json_path = decoder.PayloadDecoder("json:temperature")
+    regex = decoder.PayloadDecoder(r"regex:T=([\d.]+)")
+    paths = [
+        decoder.PayloadDecoder(f"json:{key}")
+        for key in ("mode", "temperature", "current_temperature")
+    ]
+    mode_list = list(const.HVAC_MODES)
+    mode_lookup = {mode: mode for mode in const.HVAC_MODES}
+
+    _measure("raw + float", lambda: float(raw(RAW_PAYLOAD)), args.messages)
+    _measure("json path + float", lambda: float(json_path(JSON_PAYLOAD)), args.messages)
+    _measure("regex + float", lambda: float(regex(REGEX_PAYLOAD)), args.messages)
+    _measure(
+        "3 attributes, 3 topics",
+        lambda: [path(JSON_PAYLOAD) for path in paths],
+        args.messages,
+    )
+    _measure(
+        "3 attributes, state topic",
+        lambda: [path.extract(state) for state in (json_loads(JSON_PAYLOAD),) for path in paths],
+        args.messages,
+    )
+    _measure("mode in list", lambda: "fan_only" in mode_list, args.messages)
+    _measure("mode dict lookup", lambda: mode_lookup.get("fan_only"), args.messages)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+"""Load test of the Climate Control entities against a fake MQTT hub.
+
+Drives N zones with M device messages per second through ClimateController,
+ClimateActiveSensor, the heat source automation and ClimateSwitch, and
+writes the event loop latency distribution, state writes, publishes and
+memory per entity as JSON.
+
+    python -m tools.bench_load --zones 120 --rate 500 --duration 30 \\
+        --output bench.json
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+from pathlib import Path
+import random
+import sys
+import tempfile
+import tracemalloc
+from typing import Any
+
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    EVENT_STATE_CHANGED,
+    SERVICE_TURN_OFF,
+    SERVICE_TURN_ON,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_component import EntityComponent
+
+from .common import async_create_hass, load_integration
+from .fake_mqtt import FakeMqttHub
+
+_LOGGER = logging.getLogger(__name__)
+
+TOPIC = "bench/{zone}/{channel}"
+PROBE_INTERVAL = 0.005
+TICK = 0.01
+
+
+def _percentile(samples: list[float], percent: float) -> float:
+    """Return a percentile of the samples."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+
+def _echo(topic: str, payload: str) -> tuple[str, str] | None:
+    """Echo commands back as device state."""
+    if topic.endswith("/set"):
+        return f"{topic[:-4]}/state", payload
+    return None
+
+
+def _zone_config(const: Any, zone: str) -> dict[str, Any]:
+    """Return the config of a zone, or of a zone bank with the placeholder."""
+    return {
+        const.CONF_MODE_COMMAND_TOPIC: TOPIC.format(zone=zone, channel="mode/set"),
+        const.CONF_MODE_STATE_TOPIC: TOPIC.format(zone=zone, channel="mode/state"),
+        const.CONF_TEMPERATURE_COMMAND_TOPIC: TOPIC.format(
+            zone=zone, channel="temperature/set"
+        ),
+        const.CONF_TEMPERATURE_STATE_TOPIC: TOPIC.format(
+            zone=zone, channel="temperature/state"
+        ),
+        const.CONF_CURRENT_TEMPERATURE_TOPIC: TOPIC.format(
+            zone=zone, channel="current"
+        ),
+    }
+
+
+async def _async_probe(samples: list[float], stop: asyncio.Event) -> None:
+    """Measure how late the event loop wakes up a sleeping task."""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + PROBE_INTERVAL
+        await asyncio.sleep(PROBE_INTERVAL)
+        samples.append(loop.time() - expected)
+
+
+async def async_load_test(
+    hass: HomeAssistant, hub: FakeMqttHub, args: argparse.Namespace
+) -> dict[str, Any]:
+    """Run the load test and return the results."""
+    const = load_integration("const")
+    climate = load_integration("climate")
+    binary_sensor = load_integration("binary_sensor")
+    switch = load_integration("switch")
+    router_module = load_integration("router")
+    zones_module = load_integration("zones")
+
+    rng = random.Random(args.seed)
+    zones = [f"zone_{index}" for index in range(args.zones)]
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+
+    # Zones, either as one zone bank or as one entry per zone
+    routers = []
+    entities = []
+    if args.bank:
+        config = {**_zone_config(const, const.ZONE_PLACEHOLDER), const.CONF_ZONES: zones}
+        router = router_module.TopicRouter(hass)
+        routers.append((router, config))
+        entities = [
+            climate.ClimateController(hass, zone_config, f"bench_{zone}", router, zone)
+            for zone, zone_config in zones_module.expand_zones(config)
+        ]
+    else:
+        for zone in zones:
+            config = _zone_config(const, zone)
+            router = router_module.TopicRouter(hass)
+            routers.append((router, config))
+            entities.append(
+                climate.ClimateController(hass, config, f"bench_{zone}", router, zone)
+            )
+
+    climate_component = EntityComponent(_LOGGER, "climate", hass)
+    await climate_component.async_add_entities(entities)
+    for router, config in routers:
+        for topic_filter in zones_module.subscription_filters(config):
+            await router.async_subscribe(topic_filter)
+
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # Heat source chain
+    hass.states.async_set(
+        binary_sensor.CLIMATE_GROUP,
+        "on",
+        {ATTR_ENTITY_ID: [entity.entity_id for entity in entities]},
+    )
+    switch_component = EntityComponent(_LOGGER, "switch", hass)
+    switch_component.async_register_entity_service(SERVICE_TURN_ON, {}, "async_turn_on")
+    switch_component.async_register_entity_service(SERVICE_TURN_OFF, {}, "async_turn_off")
+    await switch_component.async_add_entities([switch.ClimateSwitch(hass)])
+    sensor_component = EntityComponent(_LOGGER, "binary_sensor", hass)
+    await sensor_component.async_add_entities(
+        [binary_sensor.ClimateActiveSensor(hass, {})]
+    )
+    await hass.async_block_till_done()
+
+    state_changes = 0
+
+    def count_state_change(event: Any) -> None:
+        nonlocal state_changes
+        state_changes += 1
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, count_state_change)
+    hub.echo = _echo
+    hub.published.clear()
+
+    # Drive the load
+    loop = asyncio.get_running_loop()
+    samples: list[float] = []
+    stop = asyncio.Event()
+    probe = asyncio.create_task(_async_probe(samples, stop))
+    temperatures = {zone: 20.0 for zone in zones}
+    messages = commands = 0
+    budget = 0.0
+    end = loop.time() + args.duration
+
+    while loop.time() < end:
+        budget += args.rate * TICK
+        while budget >= 1:
+            budget -= 1
+            index = rng.randrange(len(zones))
+            zone = zones[index]
+            roll = rng.random()
+            if roll < 0.8:
+                temperatures[zone] += rng.choice((-0.1, 0.0, 0.1))
+                hub.async_fire(
+                    TOPIC.format(zone=zone, channel="current"),
+                    f"{temperatures[zone]:.2f}",
+                )
+                messages += 1
+            elif roll < 0.9:
+                hub.async_fire(
+                    TOPIC.format(zone=zone, channel="mode/state"),
+                    rng.choice(("heat", "off")),
+                )
+                messages += 1
+            else:
+                await entities[index].async_set_temperature(
+                    temperature=rng.choice((19.0, 20.0, 21.0, 22.0))
+                )
+                commands += 1
+        await asyncio.sleep(TICK)
+
+    stop.set()
+    await probe
+    await hass.async_block_till_done()
+
+    return {
+        "zones": args.zones,
+        "bank": args.bank,
+        "rate": args.rate,
+        "duration": args.duration,
+        "messages": messages,
+        "commands": commands,
+        "loop_latency_ms": {
+            "p50": _percentile(samples, 50) * 1000,
+            "p99": _percentile(samples, 99) * 1000,
+            "max": max(samples, default=0.0) * 1000,
+        },
+        "state_writes": sum(entity._state_writes.written for entity in entities),
+        "state_changes": state_changes,
+        "publishes": len(hub.published),
+        "broker_subscriptions": hub.subscription_count,
+        "memory_per_entity_bytes": (after - before) / max(args.zones, 1),
+    }
+
+
+async def async_main(args: argparse.Namespace) -> dict[str, Any]:
+    """Set up a core with the fake hub and run the load test."""
+    hub = FakeMqttHub()
+    hub.install()
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = await async_create_hass(config_dir)
+        try:
+            return await async_load_test(hass, hub, args)
+        finally:
+            await hass.async_stop(force=True)
+            hub.uninstall()
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--zones", type=int, default=50)
+    parser.add_argument("--rate", type=float, default=200, help="messages per second")
+    parser.add_argument("--duration", type=float, default=10, help="seconds")
+    parser.add_argument("--bank", action="store_true", help="use one zone bank entry")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args()
+
+    results = asyncio.run(async_main(args))
+    text = json.dumps(results, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n")
+    else:
+        sys.stdout.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
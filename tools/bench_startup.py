@@ -0,0 +1,217 @@
+"""Startup benchmark of the Climate Control integration.
+
+Measures the cold import of the integration and of its platforms in a fresh
+interpreter, with Home Assistant core already imported, and whether the
+import loads the MQTT integration. Then adds 1, 50 and 200 zone config
+entries through ``hass.config_entries`` against the fake MQTT hub while the
+client is still connecting, and reports the milliseconds each entry setup
+takes and the time from the client becoming available until every entry is
+subscribed, as JSON. The integration is loaded from a ``custom_components``
+link in a temporary configuration directory.
+
+    python -m tools.bench_startup --entries 1 50 200 --mqtt-delay 0.5 \\
+        --output startup.json
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import importlib
+import inspect
+import json
+from pathlib import Path
+import subprocess
+import sys
+import tempfile
+import time
+from types import MappingProxyType
+from typing import Any
+
+from homeassistant import config_entries
+from homeassistant.const import CONF_NAME
+from homeassistant.core import HomeAssistant
+
+from .common import (
+    INTEGRATION_DIR,
+    PACKAGE,
+    async_block_till_done,
+    async_create_hass,
+    load_integration,
+)
+
+MQTT_MODULE = "homeassistant.components.mqtt"
+# Imported by Home Assistant before any integration is loaded
+CORE_MODULES = (
+    "homeassistant.config_entries",
+    "homeassistant.helpers.config_validation",
+    "homeassistant.helpers.entity_platform",
+)
+PLATFORM_MODULES = ("climate", "sensor", "switch", "binary_sensor", "config_flow")
+
+
+def measure_imports() -> dict[str, Any]:
+    """Import the integration and its platforms, timing each import.
+
+    Only meaningful in a fresh interpreter, see ``--imports-only``.
+    """
+    for module in CORE_MODULES:
+        importlib.import_module(module)
+
+    started = time.perf_counter()
+    load_integration()
+    results: dict[str, Any] = {
+        "integration_ms": (time.perf_counter() - started) * 1000,
+        "integration_loads_mqtt": MQTT_MODULE in sys.modules,
+        "platform_ms": {},
+    }
+    for module in PLATFORM_MODULES:
+        started = time.perf_counter()
+        load_integration(module)
+        results["platform_ms"][module] = (time.perf_counter() - started) * 1000
+    return results
+
+
+def run_import_benchmark() -> dict[str, Any]:
+    """Measure the imports in a child interpreter, so they are cold."""
+    output = subprocess.run(
+        [sys.executable, "-m", "tools.bench_startup", "--imports-only"],
+        cwd=INTEGRATION_DIR,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output)
+
+
+def _config_entry(title: str, data: dict[str, Any]) -> config_entries.ConfigEntry:
+    """Create a zone config entry with the arguments the core version takes."""
+    arguments = {
+        "version": 1,
+        "minor_version": 1,
+        "domain": PACKAGE,
+        "title": title,
+        "data": data,
+        "options": {},
+        "source": config_entries.SOURCE_USER,
+        "unique_id": title,
+        "discovery_keys": MappingProxyType({}),
+        "subentries_data": None,
+    }
+    accepted = inspect.signature(config_entries.ConfigEntry).parameters
+    return config_entries.ConfigEntry(
+        **{key: value for key, value in arguments.items() if key in accepted}
+    )
+
+
+async def async_create_entry_hass(config_dir: str) -> HomeAssistant:
+    """Create a core that loads the integration from custom_components."""
+    custom_components = Path(config_dir, "custom_components")
+    custom_components.mkdir()
+    (custom_components / PACKAGE).symlink_to(INTEGRATION_DIR, True)
+
+    return await async_create_hass(config_dir)
+
+
+async def async_setup_entries(
+    hass: HomeAssistant, hub: Any, count: int, mqtt_delay: float
+) -> dict[str, Any]:
+    """Add zone config entries one by one and time their setup."""
+    # The other tools load the MQTT integration, so not at module level
+    from .bench_load import _percentile, _zone_config
+
+    const = load_integration("const")
+
+    hub.available.clear()
+    setup_ms: list[float] = []
+    for index in range(count):
+        entry = _config_entry(
+            f"zone_{index}",
+            {CONF_NAME: f"zone_{index}", **_zone_config(const, f"zone_{index}")},
+        )
+        started = time.perf_counter()
+        await hass.config_entries.async_add(entry)
+        setup_ms.append((time.perf_counter() - started) * 1000)
+
+    # The client connects while the entries are already set up
+    await asyncio.sleep(mqtt_delay)
+    started = time.perf_counter()
+    hub.available.set()
+    await async_block_till_done(hass)
+    subscribed_ms = (time.perf_counter() - started) * 1000
+
+    return {
+        "entries": count,
+        "loaded": sum(
+            entry.state is config_entries.ConfigEntryState.LOADED
+            for entry in hass.config_entries.async_entries(PACKAGE)
+        ),
+        "setup_ms": sum(setup_ms),
+        "setup_ms_per_entry": {
+            "mean": sum(setup_ms) / count,
+            "p95": _percentile(setup_ms, 95),
+            "max": max(setup_ms),
+        },
+        "subscribed_after_mqtt_ms": subscribed_ms,
+        "broker_subscriptions": hub.subscription_count,
+    }
+
+
+async def async_main(args: argparse.Namespace) -> list[dict[str, Any]]:
+    """Set up a core with the fake hub for each entry count."""
+    from .fake_mqtt import FakeMqttHub
+
+    results = []
+    # The custom_components package is imported once, from the first
+    # configuration directory, so all are kept until the end
+    with tempfile.TemporaryDirectory() as root:
+        for run, count in enumerate(args.entries):
+            hub = FakeMqttHub()
+            hub.install()
+            config_dir = Path(root, f"run_{run}")
+            config_dir.mkdir()
+            hass = await async_create_entry_hass(str(config_dir))
+            try:
+                results.append(
+                    await async_setup_entries(hass, hub, count, args.mqtt_delay)
+                )
+            finally:
+                await hass.async_stop(force=True)
+                hub.uninstall()
+    return results
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--entries", type=int, nargs="+", default=[1, 50, 200])
+    parser.add_argument(
+        "--mqtt-delay",
+        type=float,
+        default=0.5,
+        help="seconds until the MQTT client becomes available",
+    )
+    parser.add_argument(
+        "--imports-only", action="store_true", help=argparse.SUPPRESS
+    )
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args()
+
+    if args.imports_only:
+        sys.stdout.write(json.dumps(measure_imports()) + "\n")
+        return
+
+    results = {
+        "imports": run_import_benchmark(),
+        "setup": asyncio.run(async_main(args)),
+    }
+    text = json.dumps(results, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n")
+    else:
+        sys.stdout.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Shared helpers for the Climate Control development tools."""
+from __future__ import annotations
+
+import asyncio
+import importlib
+import importlib.util
+import inspect
+from pathlib import Path
+import sys
+from types import ModuleType
+
+from homeassistant import bootstrap, config_entries, loader
+from homeassistant.core import DOMAIN as HA_DOMAIN, HomeAssistant
+from homeassistant.setup import async_setup_component
+
+INTEGRATION_DIR = Path(__file__).resolve().parent.parent
+PACKAGE = "climate_control"
+
+
+def load_integration(module: str | None = None) -> ModuleType:
+    """Import the integration as the ``climate_control`` package.
+
+    The repository root is the integration folder itself, so it is
+    registered under its domain name to make the relative imports work
+    outside of ``custom_components``.
+    """
+    if PACKAGE not in sys.modules:
+        spec = importlib.util.spec_from_file_location(
+            PACKAGE,
+            INTEGRATION_DIR / "__init__.py",
+            submodule_search_locations=[str(INTEGRATION_DIR)],
+        )
+        package = importlib.util.module_from_spec(spec)
+        sys.modules[PACKAGE] = package
+        spec.loader.exec_module(package)
+
+    if module is None:
+        return sys.modules[PACKAGE]
+    return importlib.import_module(f"{PACKAGE}.{module}")
+
+
+async def async_create_hass(config_dir: str) -> HomeAssistant:
+    """Create a Home Assistant core for the tools.
+
+    The core is set up like a running instance: the base functionality is
+    loaded as at startup, including the registries, the config entries and
+    the restored states, and the ``homeassistant`` integration is set up. The
+    climate entities restore their state as they do after a restart.
+    """
+    hass = HomeAssistant(config_dir)
+    loader.async_setup(hass)
+    hass.config_entries = config_entries.ConfigEntries(hass, {})
+    await bootstrap.async_load_base_functionality(hass)
+    await async_setup_component(hass, HA_DOMAIN, {})
+    return hass
+
+
+async def async_block_till_done(hass: HomeAssistant) -> None:
+    """Wait for the pending work of a core, background tasks included.
+
+    Cores before 2024.4 have no ``wait_background_tasks``, their background
+    tasks are awaited separately.
+    """
+    if "wait_background_tasks" in inspect.signature(
+        hass.async_block_till_done
+    ).parameters:
+        await hass.async_block_till_done(wait_background_tasks=True)
+        return
+    await hass.async_block_till_done()
+    if tasks := [task for task in hass._background_tasks if not task.done()]:
+        await asyncio.wait(tasks)
+    await hass.async_block_till_done()
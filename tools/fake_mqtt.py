@@ -0,0 +1,153 @@
+"""In-process MQTT hub standing in for the Home Assistant MQTT integration.
+
+Installing the hub replaces ``mqtt.async_subscribe``, ``mqtt.async_publish``
+and ``mqtt.async_wait_for_mqtt_client`` so the integration can be driven
+without a broker. Published commands are recorded and may be echoed back as
+device state. Clearing ``available`` holds back callers waiting for the
+client, like a client that is still connecting.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass, field
+import inspect
+import time
+from typing import Any
+
+from homeassistant.components import mqtt
+from homeassistant.core import HomeAssistant, callback
+
+
+@dataclass(frozen=True)
+class FakeMessage:
+    """MQTT message with the attributes of mqtt.models.ReceiveMessage."""
+
+    topic: str
+    payload: str
+    qos: int
+    retain: bool
+    subscribed_topic: str
+    timestamp: float = field(default_factory=time.monotonic)
+
+
+def topic_matches(topic_filter: str, topic: str) -> bool:
+    """Return True if a topic matches a filter with + and # wildcards."""
+    filter_levels = topic_filter.split("/")
+    topic_levels = topic.split("/")
+    for index, level in enumerate(filter_levels):
+        if level == "#":
+            return True
+        if index >= len(topic_levels):
+            return False
+        if level not in ("+", topic_levels[index]):
+            return False
+    return len(filter_levels) == len(topic_levels)
+
+
+class FakeMqttHub:
+    """Deliver published messages to the matching subscriptions."""
+
+    def __init__(self) -> None:
+        """Initialize the hub."""
+        self._subscriptions: list[tuple[str, Callable[[Any], Any], int]] = []
+        self._retained: dict[str, str] = {}
+        self._originals: tuple[Any, Any, Any] | None = None
+        self.published: list[tuple[str, str, int, bool]] = []
+        self.delivered = 0
+        self.echo: Callable[[str, str], tuple[str, str] | None] | None = None
+        self.available = asyncio.Event()
+        self.available.set()
+
+    @property
+    def subscription_count(self) -> int:
+        """Return the number of live subscriptions."""
+        return len(self._subscriptions)
+
+    def install(self) -> None:
+        """Replace the MQTT subscribe, publish and wait functions."""
+        self._originals = (
+            mqtt.async_subscribe,
+            mqtt.async_publish,
+            mqtt.async_wait_for_mqtt_client,
+        )
+        mqtt.async_subscribe = self.async_subscribe
+        mqtt.async_publish = self.async_publish
+        mqtt.async_wait_for_mqtt_client = self.async_wait_for_mqtt_client
+
+    def uninstall(self) -> None:
+        """Restore the MQTT subscribe, publish and wait functions."""
+        if self._originals is not None:
+            (
+                mqtt.async_subscribe,
+                mqtt.async_publish,
+                mqtt.async_wait_for_mqtt_client,
+            ) = self._originals
+            self._originals = None
+
+    async def async_wait_for_mqtt_client(self, hass: HomeAssistant) -> bool:
+        """Wait until the hub is available."""
+        await self.available.wait()
+        return True
+
+    async def async_subscribe(
+        self,
+        hass: HomeAssistant,
+        topic: str,
+        msg_callback: Callable[[Any], Any],
+        qos: int = 0,
+        encoding: str | None = "utf-8",
+    ) -> Callable[[], None]:
+        """Subscribe to a topic filter, delivering matching retained messages."""
+        subscription = (topic, msg_callback, qos)
+        self._subscriptions.append(subscription)
+
+        for retained_topic, payload in list(self._retained.items()):
+            if topic_matches(topic, retained_topic):
+                self._deliver(subscription, retained_topic, payload, True)
+
+        @callback
+        def async_unsubscribe() -> None:
+            """Remove the subscription."""
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+
+        return async_unsubscribe
+
+    async def async_publish(
+        self,
+        hass: HomeAssistant,
+        topic: str,
+        payload: Any,
+        qos: int = 0,
+        retain: bool = False,
+        encoding: str | None = "utf-8",
+    ) -> None:
+        """Record a publish from the integration and echo it if configured."""
+        payload = str(payload)
+        self.published.append((topic, payload, qos, retain))
+        if self.echo is not None and (echo := self.echo(topic, payload)):
+            self.async_fire(*echo)
+
+    @callback
+    def async_fire(self, topic: str, payload: str, retain: bool = False) -> None:
+        """Deliver a message from a device to the subscriptions."""
+        if retain:
+            self._retained[topic] = payload
+        for subscription in list(self._subscriptions):
+            if topic_matches(subscription[0], topic):
+                self._deliver(subscription, topic, payload, retain)
+
+    def _deliver(
+        self,
+        subscription: tuple[str, Callable[[Any], Any], int],
+        topic: str,
+        payload: str,
+        retain: bool,
+    ) -> None:
+        """Call a subscription callback, scheduling coroutine callbacks."""
+        topic_filter, msg_callback, qos = subscription
+        self.delivered += 1
+        result = msg_callback(FakeMessage(topic, payload, qos, retain, topic_filter))
+        if inspect.isawaitable(result):
+            asyncio.ensure_future(result)
@@ -0,0 +1,115 @@
+"""Replay recorded zone temperatures to compare reactive and predictive pre-heat.
+
+The CSV trace has a ``timestamp`` column, in seconds or ISO 8601, the
+``current`` and ``target`` temperatures and a ``heating`` column that is 1
+while the zone is heated. Every rise of the target is a comfort event.
+
+The thermal model is learned online from the trace. At each event the
+reactive strategy starts heating at the event, the predictive strategy
+starts early by the lead time the model had learned up to then. Both are
+played against the rates learned from the whole trace, and the lateness,
+the comfort deficit in degree hours and the heating hours are reported.
+
+    python -m tools.replay_preheat zone.csv --max-lead 14400
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+from dataclasses import dataclass
+from pathlib import Path
+
+from .common import load_integration
+from .simulate_demand import _timestamp
+
+
+@dataclass
+class PreheatResult:
+    """Totals of one pre-heat strategy."""
+
+    events: int = 0
+    lateness: float = 0.0
+    deficit: float = 0.0
+    heating: float = 0.0
+
+    def add(
+        self, early: float, heat_up: float, delta: float, duty: float
+    ) -> None:
+        """Add an event heated ``early`` seconds before it is due."""
+        self.events += 1
+        late = max(0.0, heat_up - early)
+        # The zone warms linearly, the deficit is the triangle after the event
+        self.lateness += late
+        self.deficit += 0.5 * delta * (late / heat_up) * late / 3600
+        self.heating += (heat_up + max(0.0, early - heat_up) * duty) / 3600
+
+
+def read_trace(path: Path) -> list[tuple[float, float, float, bool]]:
+    """Read a zone trace from a CSV file."""
+    with path.open(newline="") as file:
+        return sorted(
+            (
+                _timestamp(row["timestamp"]),
+                float(row["current"]),
+                float(row["target"]),
+                row["heating"].strip().lower() in ("1", "true", "on"),
+            )
+            for row in csv.DictReader(file)
+        )
+
+
+def main() -> None:
+    """Run the replay."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("trace", type=Path, nargs="+")
+    parser.add_argument("--max-lead", type=float, default=4 * 3600)
+    args = parser.parse_args()
+
+    thermal = load_integration("thermal")
+
+    for path in args.trace:
+        trace = read_trace(path)
+
+        plant = thermal.ThermalModel()
+        for timestamp, current, _, heating in trace:
+            plant.add_sample(timestamp, current, heating)
+        if plant.heating_rate is None or plant.heating_rate <= 0:
+            print(f"{path.name}: not enough heating samples to learn a model")
+            continue
+        heating_rate = plant.heating_rate
+        duty = min(1.0, max(0.0, -(plant.cooling_rate or 0.0) / heating_rate))
+
+        model = thermal.ThermalModel()
+        reactive = PreheatResult()
+        predictive = PreheatResult()
+        previous_target: float | None = None
+        for timestamp, current, target, heating in trace:
+            if previous_target is not None and target > previous_target:
+                delta = target - current
+                if delta > 0:
+                    heat_up = delta / heating_rate * 3600
+                    reactive.add(0.0, heat_up, delta, duty)
+                    predictive.add(
+                        model.lead_time(current, target, args.max_lead),
+                        heat_up,
+                        delta,
+                        duty,
+                    )
+            previous_target = target
+            model.add_sample(timestamp, current, heating)
+
+        print(
+            f"{path.name}: heating {heating_rate:.2f} °/h, "
+            f"cooling {plant.cooling_rate:.2f} °/h"
+        )
+        for label, result in (("reactive", reactive), ("predictive", predictive)):
+            events = result.events or 1
+            print(
+                f"  {label:>10}: {result.events} events, "
+                f"late {result.lateness / events / 60:.1f} min/event, "
+                f"deficit {result.deficit:.2f} °h, heating {result.heating:.2f} h"
+            )
+
+
+if __name__ == "__main__":
+    main()
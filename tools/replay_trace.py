@@ -0,0 +1,264 @@
+"""Replay a recorded MQTT trace through the whole control chain offline.
+
+The trace is fed through ClimateController, ClimateActiveSensor, the heat
+source automation and ClimateSwitch on a Home Assistant core with the fake
+MQTT hub and a virtual clock, so a year of data replays in minutes. The
+boiler on time, switch cycles, publishes and the delay from a binary sensor
+change to the switch command are written as JSON.
+
+The trace is either JSON lines with ``timestamp``, ``topic`` and ``payload``
+keys, or the output of mosquitto_sub with a leading timestamp
+(``-F "%U %t %p"`` or ``-F "%I %t %p"``) or without one (``-v``, see
+``--interval``). The recorded state of the heat source switch is ignored;
+its commands are echoed back so the replay follows the current logic.
+
+    mosquitto_sub -F "%U %t %p" -t "heating/#" > trace.txt
+    python -m tools.replay_trace trace.txt --config entry.json
+"""
+from __future__ import annotations
+
+import argparse
+from collections.abc import Iterable
+from datetime import datetime
+import json
+import logging
+from pathlib import Path
+import sys
+import tempfile
+import time
+from typing import Any
+
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    EVENT_STATE_CHANGED,
+    SERVICE_TURN_OFF,
+    SERVICE_TURN_ON,
+    STATE_ON,
+)
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.entity_component import EntityComponent
+
+from .bench_load import _percentile
+from .common import async_create_hass, load_integration
+from .fake_mqtt import FakeMqttHub
+from .virtual_clock import VirtualClockLoop
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _timestamp(value: str) -> float | None:
+    """Parse a timestamp in seconds or ISO 8601, None if it is neither."""
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        return None
+
+
+def parse_trace(lines: Iterable[str], interval: float) -> list[tuple[float, str, str]]:
+    """Return the (seconds from the start, topic, payload) messages of a trace."""
+    messages: list[tuple[float, str, str]] = []
+    for number, line in enumerate(lines):
+        if not (line := line.rstrip("\n")):
+            continue
+        if line.startswith("{"):
+            record = json.loads(line)
+            timestamp = _timestamp(str(record.get("timestamp", record.get("ts"))))
+            topic, payload = record["topic"], record["payload"]
+            if not isinstance(payload, str):
+                payload = json.dumps(payload)
+        else:
+            first, _, rest = line.partition(" ")
+            if (timestamp := _timestamp(first)) is not None and rest:
+                topic, _, payload = rest.partition(" ")
+            else:
+                topic, payload = first, rest
+        if timestamp is None:
+            timestamp = number * interval
+        messages.append((timestamp, topic, payload))
+
+    messages.sort(key=lambda message: message[0])
+    start = messages[0][0] if messages else 0.0
+    return [(timestamp - start, topic, payload) for timestamp, topic, payload in messages]
+
+
+async def async_replay(
+    hass: HomeAssistant,
+    hub: FakeMqttHub,
+    loop: VirtualClockLoop,
+    trace: list[tuple[float, str, str]],
+    config: dict[str, Any],
+    automation_config: dict[str, Any],
+) -> dict[str, Any]:
+    """Replay a trace and return the results."""
+    climate = load_integration("climate")
+    binary_sensor = load_integration("binary_sensor")
+    switch = load_integration("switch")
+    automation = load_integration("automation")
+    router_module = load_integration("router")
+    zones_module = load_integration("zones")
+
+    router = router_module.TopicRouter(hass)
+    entities = [
+        climate.ClimateController(
+            hass, zone_config, f"replay_{zone or 'device'}", router, zone
+        )
+        for zone, zone_config in zones_module.expand_zones(config)
+    ]
+    climate_component = EntityComponent(_LOGGER, "climate", hass)
+    await climate_component.async_add_entities(entities)
+    for topic_filter in zones_module.subscription_filters(config):
+        await router.async_subscribe(topic_filter)
+
+    hass.states.async_set(
+        binary_sensor.CLIMATE_GROUP,
+        "on",
+        {ATTR_ENTITY_ID: [entity.entity_id for entity in entities]},
+    )
+    switch_component = EntityComponent(_LOGGER, "switch", hass)
+    switch_component.async_register_entity_service(SERVICE_TURN_ON, {}, "async_turn_on")
+    switch_component.async_register_entity_service(SERVICE_TURN_OFF, {}, "async_turn_off")
+    await switch_component.async_add_entities([switch.ClimateSwitch(hass)])
+    sensor_component = EntityComponent(_LOGGER, "binary_sensor", hass)
+    await sensor_component.async_add_entities(
+        [binary_sensor.ClimateActiveSensor(hass, automation_config)]
+    )
+    await hass.async_block_till_done()
+
+    start = loop.time()
+    on_since: float | None = None
+    on_time = 0.0
+    cycles = 0
+    last_demand_change: float | None = None
+    latencies: list[float] = []
+    switch_commands = 0
+
+    @callback
+    def async_state_changed(event: Event[Any]) -> None:
+        """Follow the switch and the binary sensor."""
+        nonlocal on_since, on_time, cycles, last_demand_change
+        entity_id = event.data["entity_id"]
+        if entity_id == automation.CLIMATE_ACTIVE_SENSOR:
+            last_demand_change = loop.time()
+        elif entity_id == automation.CLIMATE_SWITCH:
+            new_state = event.data["new_state"]
+            is_on = new_state is not None and new_state.state == STATE_ON
+            if is_on and on_since is None:
+                on_since = loop.time()
+                cycles += 1
+            elif not is_on and on_since is not None:
+                on_time += loop.time() - on_since
+                on_since = None
+
+    def echo(topic: str, payload: str) -> tuple[str, str] | None:
+        """Echo the switch commands and time the decisions."""
+        nonlocal switch_commands
+        if topic != switch.MQTT_COMMAND_TOPIC:
+            return None
+        switch_commands += 1
+        if last_demand_change is not None:
+            latencies.append(loop.time() - last_demand_change)
+        return switch.MQTT_STATE_TOPIC, payload
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, async_state_changed)
+    hub.echo = echo
+    hub.published.clear()
+
+    started = time.perf_counter()
+    replayed = 0
+    for timestamp, topic, payload in trace:
+        if topic == switch.MQTT_STATE_TOPIC:
+            continue
+        await loop.async_sleep_until(start + timestamp)
+        hub.async_fire(topic, payload)
+        replayed += 1
+    await hass.async_block_till_done()
+    wall_time = time.perf_counter() - started
+
+    duration = loop.time() - start
+    if on_since is not None:
+        on_time += loop.time() - on_since
+
+    return {
+        "messages": replayed,
+        "zones": len(entities),
+        "duration_hours": duration / 3600,
+        "wall_time_seconds": wall_time,
+        "speedup": duration / wall_time if wall_time else None,
+        "boiler_on_hours": on_time / 3600,
+        "switch_cycles": cycles,
+        "publishes": len(hub.published),
+        "switch_commands": switch_commands,
+        "zone_commands": len(hub.published) - switch_commands,
+        "decision_latency_seconds": {
+            "p50": _percentile(latencies, 50),
+            "p95": _percentile(latencies, 95),
+            "max": max(latencies, default=0.0),
+        },
+    }
+
+
+async def async_main(
+    loop: VirtualClockLoop, args: argparse.Namespace
+) -> dict[str, Any]:
+    """Set up a core with the fake hub and replay the trace."""
+    with args.trace.open(encoding="utf-8") as file:
+        trace = parse_trace(file, args.interval)
+    config = json.loads(args.config.read_text())
+    automation_config = (
+        json.loads(args.automation.read_text()) if args.automation else {}
+    )
+
+    hub = FakeMqttHub()
+    hub.install()
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = await async_create_hass(config_dir)
+        try:
+            return await async_replay(
+                hass, hub, loop, trace, config, automation_config
+            )
+        finally:
+            await hass.async_stop(force=True)
+            hub.uninstall()
+
+
+def main() -> None:
+    """Run the replay."""
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("trace", type=Path)
+    parser.add_argument(
+        "--config", type=Path, required=True, help="JSON data of a config entry"
+    )
+    parser.add_argument(
+        "--automation",
+        type=Path,
+        help="JSON demand settings, e.g. min_on_time and zone_weights",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=1.0,
+        help="seconds between messages of a trace without timestamps",
+    )
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args()
+
+    loop = VirtualClockLoop()
+    try:
+        results = loop.run_until_complete(async_main(loop, args))
+    finally:
+        loop.close()
+    text = json.dumps(results, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n")
+    else:
+        sys.stdout.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Replay recorded demand traces through the DemandEngine.
+
+The CSV trace has a ``timestamp`` column, in seconds or ISO 8601, and a
+``demand`` column holding the weighted demand or the number of active
+zones. The switch cycle counts are reported for the given settings and
+for the plain on/off behaviour without hysteresis and minimum times.
+
+    python -m tools.simulate_demand trace.csv --min-on 300 --min-off 300
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+from datetime import datetime
+from pathlib import Path
+
+from .common import load_integration
+
+
+def _timestamp(value: str) -> float:
+    """Parse a timestamp in seconds or ISO 8601."""
+    try:
+        return float(value)
+    except ValueError:
+        return datetime.fromisoformat(value).timestamp()
+
+
+def read_trace(path: Path) -> list[tuple[float, float]]:
+    """Read a demand trace from a CSV file."""
+    with path.open(newline="") as file:
+        return sorted(
+            (_timestamp(row["timestamp"]), float(row["demand"]))
+            for row in csv.DictReader(file)
+        )
+
+
+def main() -> None:
+    """Run the simulation."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("trace", type=Path, nargs="+")
+    parser.add_argument("--on-threshold", type=float, default=1.0)
+    parser.add_argument("--off-threshold", type=float, default=0.0)
+    parser.add_argument("--min-on", type=float, default=180)
+    parser.add_argument("--min-off", type=float, default=180)
+    args = parser.parse_args()
+
+    demand = load_integration("demand")
+
+    for path in args.trace:
+        trace = read_trace(path)
+        for label, engine in (
+            ("baseline", demand.DemandEngine()),
+            (
+                "engine",
+                demand.DemandEngine(
+                    on_threshold=args.on_threshold,
+                    off_threshold=args.off_threshold,
+                    min_on_time=args.min_on,
+                    min_off_time=args.min_off,
+                ),
+            ),
+        ):
+            result = demand.replay_demand_trace(trace, engine)
+            hours = result.duration / 3600 or 1
+            print(
+                f"{path.name} {label:>8}: {result.cycles} cycles "
+                f"({result.cycles / hours:.2f}/h), {result.commands} commands, "
+                f"on {result.on_time / 3600:.2f} h of {result.duration / 3600:.2f} h"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Event loop with a virtual clock for running the integration offline.
+
+Whenever the loop would wait for its next timer, the clock jumps to it
+instead, so timers such as debounces and minimum on times fire without
+waiting in real time. Waits without a timer, e.g. for an executor job,
+still block on the real selector.
+"""
+from __future__ import annotations
+
+import asyncio
+import selectors
+
+
+class _VirtualSelector(selectors.DefaultSelector):
+    """Selector that advances the virtual clock instead of sleeping."""
+
+    def __init__(self) -> None:
+        """Initialize the selector."""
+        super().__init__()
+        self.loop: VirtualClockLoop | None = None
+
+    def select(self, timeout: float | None = None):
+        """Return ready I/O, jumping the clock over idle time."""
+        events = super().select(0)
+        if events or timeout == 0 or self.loop is None:
+            return events
+        if timeout is None:
+            return super().select(None)
+        self.loop.advance(timeout)
+        return []
+
+
+class VirtualClockLoop(asyncio.SelectorEventLoop):
+    """Selector event loop whose time() is a virtual clock in seconds."""
+
+    def __init__(self, start: float = 0.0) -> None:
+        """Initialize the loop with the clock at ``start``."""
+        selector = _VirtualSelector()
+        super().__init__(selector)
+        selector.loop = self
+        self._now = start
+        # The monotonic clock resolution is lost in the float of a virtual
+        # time far from 0, which would keep due timers from running
+        self._clock_resolution = 1e-6
+
+    def time(self) -> float:
+        """Return the virtual time."""
+        return self._now
+
+    def advance(self, seconds: float) -> None:
+        """Move the clock forward."""
+        if seconds > 0:
+            self._now += seconds
+
+    async def async_sleep_until(self, when: float) -> None:
+        """Let the loop run its timers up to a virtual time."""
+        if (delay := when - self._now) > 0:
+            await asyncio.sleep(delay)
+        else:
+            await asyncio.sleep(0)
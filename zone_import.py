@@ -0,0 +1,202 @@
+"""Bulk import of Climate Control zones from a zone manifest.
+
+A manifest lists one row per zone with its own MQTT topics, as a YAML list
+(or a mapping with a ``zones`` list) or as a CSV file with one column per
+option. The whole manifest is validated in one pass and imported as a
+single config entry, so all zones are set up by one platform setup.
+"""
+from __future__ import annotations
+
+import csv
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from typing import Any
+
+import voluptuous as vol
+from homeassistant.components import mqtt
+from homeassistant.util.yaml import load_yaml
+
+from .const import (
+    CONF_COMMAND_DEBOUNCE,
+    CONF_COMMAND_MAX_LATENCY,
+    CONF_CURRENT_TEMPERATURE_DEADBAND,
+    CONF_CURRENT_TEMPERATURE_DECODER,
+    CONF_CURRENT_TEMPERATURE_MIN_INTERVAL,
+    CONF_CURRENT_TEMPERATURE_TOPIC,
+    CONF_FAN_MODE_COMMAND_TOPIC,
+    CONF_FAN_MODE_STATE_TOPIC,
+    CONF_JUMP_LIMIT,
+    CONF_MAX_TEMP,
+    CONF_MIN_RISE,
+    CONF_MIN_TEMP,
+    CONF_MODE_COMMAND_TOPIC,
+    CONF_MODE_STATE_DECODER,
+    CONF_MODE_STATE_TOPIC,
+    CONF_POWER_COMMAND_TOPIC,
+    CONF_POWER_STATE_TOPIC,
+    CONF_PRECISION,
+    CONF_RESPONSE_TIME,
+    CONF_STALE_TIMEOUT,
+    CONF_STATE_TOPIC,
+    CONF_STATE_WRITE_WINDOW,
+    CONF_TEMP_STEP,
+    CONF_TEMPERATURE_COMMAND_TEMPLATE,
+    CONF_TEMPERATURE_COMMAND_TOPIC,
+    CONF_TEMPERATURE_STATE_DECODER,
+    CONF_TEMPERATURE_STATE_TOPIC,
+    CONF_ZONE,
+    CONF_ZONES,
+    DEFAULT_MAX_TEMP,
+    DEFAULT_MIN_TEMP,
+)
+from .decoder import is_valid_decoder
+from .formatter import is_valid_template
+from .zones import STATE_TOPIC_KEYS, is_topic_template, is_valid_zone
+
+COMMAND_TOPIC_KEYS = (
+    CONF_MODE_COMMAND_TOPIC,
+    CONF_TEMPERATURE_COMMAND_TOPIC,
+    CONF_POWER_COMMAND_TOPIC,
+    CONF_FAN_MODE_COMMAND_TOPIC,
+)
+ATTRIBUTE_STATE_TOPIC_KEYS = (
+    CONF_MODE_STATE_TOPIC,
+    CONF_TEMPERATURE_STATE_TOPIC,
+    CONF_CURRENT_TEMPERATURE_TOPIC,
+)
+
+ZONE_ROW_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_ZONE): str,
+        vol.Required(CONF_MODE_COMMAND_TOPIC): str,
+        vol.Required(CONF_TEMPERATURE_COMMAND_TOPIC): str,
+        vol.Optional(CONF_MODE_STATE_TOPIC): str,
+        vol.Optional(CONF_TEMPERATURE_STATE_TOPIC): str,
+        vol.Optional(CONF_CURRENT_TEMPERATURE_TOPIC): str,
+        vol.Optional(CONF_STATE_TOPIC): str,
+        vol.Optional(CONF_POWER_COMMAND_TOPIC): str,
+        vol.Optional(CONF_POWER_STATE_TOPIC): str,
+        vol.Optional(CONF_FAN_MODE_COMMAND_TOPIC): str,
+        vol.Optional(CONF_FAN_MODE_STATE_TOPIC): str,
+        vol.Optional(CONF_MODE_STATE_DECODER): str,
+        vol.Optional(CONF_TEMPERATURE_STATE_DECODER): str,
+        vol.Optional(CONF_CURRENT_TEMPERATURE_DECODER): str,
+        vol.Optional(CONF_TEMPERATURE_COMMAND_TEMPLATE): str,
+        vol.Optional(CONF_MIN_TEMP): vol.Coerce(float),
+        vol.Optional(CONF_MAX_TEMP): vol.Coerce(float),
+        vol.Optional(CONF_TEMP_STEP): vol.Coerce(float),
+        vol.Optional(CONF_PRECISION): vol.Coerce(float),
+        vol.Optional(CONF_COMMAND_DEBOUNCE): vol.Coerce(float),
+        vol.Optional(CONF_COMMAND_MAX_LATENCY): vol.Coerce(float),
+        vol.Optional(CONF_STATE_WRITE_WINDOW): vol.Coerce(float),
+        vol.Optional(CONF_CURRENT_TEMPERATURE_MIN_INTERVAL): vol.All(
+            vol.Coerce(float), vol.Range(min=0)
+        ),
+        vol.Optional(CONF_CURRENT_TEMPERATURE_DEADBAND): vol.All(
+            vol.Coerce(float), vol.Range(min=0)
+        ),
+        vol.Optional(CONF_STALE_TIMEOUT): vol.All(vol.Coerce(float), vol.Range(min=0)),
+        vol.Optional(CONF_RESPONSE_TIME): vol.All(vol.Coerce(float), vol.Range(min=0)),
+        vol.Optional(CONF_MIN_RISE): vol.All(
+            vol.Coerce(float), vol.Range(min=0, min_included=False)
+        ),
+        vol.Optional(CONF_JUMP_LIMIT): vol.All(vol.Coerce(float), vol.Range(min=0)),
+    }
+)
+
+
+def load_manifest(path: Path) -> list[dict[str, Any]]:
+    """Read the rows of a YAML or CSV manifest, this does blocking I/O."""
+    if path.suffix.lower() == ".csv":
+        with path.open(newline="", encoding="utf-8") as file:
+            # Empty cells are left out so the options fall back to defaults
+            return [
+                {key.strip(): value.strip() for key, value in row.items() if value}
+                for row in csv.DictReader(file)
+            ]
+
+    content = load_yaml(path)
+    if isinstance(content, Mapping):
+        content = content.get(CONF_ZONES)
+    if not isinstance(content, list):
+        raise vol.Invalid("The manifest must be a list of zones")
+    return content
+
+
+def _row_error(row: dict[str, Any]) -> str | None:
+    """Return why a validated row cannot be used, if it cannot."""
+    if not is_valid_zone(row[CONF_ZONE]):
+        return f"invalid zone name {row[CONF_ZONE]!r}"
+    for key in (*COMMAND_TOPIC_KEYS, *STATE_TOPIC_KEYS):
+        if not (topic := row.get(key)):
+            continue
+        if is_topic_template(topic):
+            return f"{key} must not contain a zone placeholder"
+        try:
+            if key in COMMAND_TOPIC_KEYS:
+                mqtt.valid_publish_topic(topic)
+            else:
+                mqtt.valid_subscribe_topic(topic)
+        except vol.Invalid:
+            return f"invalid {key} {topic!r}"
+    if not row.get(CONF_STATE_TOPIC) and not all(
+        row.get(key) for key in ATTRIBUTE_STATE_TOPIC_KEYS
+    ):
+        return "needs the combined state topic or all three state topics"
+    for key in (
+        CONF_MODE_STATE_DECODER,
+        CONF_TEMPERATURE_STATE_DECODER,
+        CONF_CURRENT_TEMPERATURE_DECODER,
+    ):
+        if key in row and not is_valid_decoder(row[key]):
+            return f"invalid {key} {row[key]!r}"
+    if CONF_TEMPERATURE_COMMAND_TEMPLATE in row and not is_valid_template(
+        row[CONF_TEMPERATURE_COMMAND_TEMPLATE]
+    ):
+        return (
+            f"invalid {CONF_TEMPERATURE_COMMAND_TEMPLATE} "
+            f"{row[CONF_TEMPERATURE_COMMAND_TEMPLATE]!r}"
+        )
+    if row.get(CONF_MIN_TEMP, DEFAULT_MIN_TEMP) >= row.get(
+        CONF_MAX_TEMP, DEFAULT_MAX_TEMP
+    ):
+        return "min_temp must be lower than max_temp"
+    return None
+
+
+def validate_manifest(
+    rows: Iterable[Any],
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Validate all rows of a manifest.
+
+    Returns the valid rows and one error per invalid row, numbered from 1.
+    Zone names and command topics must be unique across the manifest.
+    """
+    valid: list[dict[str, Any]] = []
+    errors: list[dict[str, Any]] = []
+    zones: set[str] = set()
+    command_topics: set[str] = set()
+
+    for number, raw_row in enumerate(rows, start=1):
+        zone = raw_row.get(CONF_ZONE) if isinstance(raw_row, Mapping) else None
+        try:
+            row = ZONE_ROW_SCHEMA(raw_row)
+        except vol.Invalid as err:
+            errors.append({"row": number, "zone": zone, "error": str(err)})
+            continue
+
+        topics = {row[key] for key in COMMAND_TOPIC_KEYS if row.get(key)}
+        if (error := _row_error(row)) is None:
+            if row[CONF_ZONE] in zones:
+                error = f"duplicate zone {row[CONF_ZONE]!r}"
+            elif duplicates := topics & command_topics:
+                error = f"command topic {min(duplicates)!r} is used by another zone"
+        if error is not None:
+            errors.append({"row": number, "zone": zone, "error": error})
+            continue
+
+        zones.add(row[CONF_ZONE])
+        command_topics |= topics
+        valid.append(row)
+
+    return valid, errors
@@ -0,0 +1,112 @@
+"""Zone bank helpers for the Climate Control integration.
+
+A zone bank is a config entry describing many zones through topic templates
+such as ``heating/{zone}/mode/state``. An imported entry describes many zones
+through a manifest with the own topics of each zone.
+"""
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
+from .const import (
+    CONF_CURRENT_TEMPERATURE_TOPIC,
+    CONF_FAN_MODE_STATE_TOPIC,
+    CONF_MODE_STATE_TOPIC,
+    CONF_POWER_STATE_TOPIC,
+    CONF_STATE_TOPIC,
+    CONF_TEMPERATURE_STATE_TOPIC,
+    CONF_ZONE,
+    CONF_ZONE_MANIFEST,
+    CONF_ZONES,
+    TOPIC_KEYS,
+    ZONE_PLACEHOLDER,
+)
+
+STATE_TOPIC_KEYS = (
+    CONF_MODE_STATE_TOPIC,
+    CONF_TEMPERATURE_STATE_TOPIC,
+    CONF_CURRENT_TEMPERATURE_TOPIC,
+    CONF_STATE_TOPIC,
+    CONF_POWER_STATE_TOPIC,
+    CONF_FAN_MODE_STATE_TOPIC,
+)
+
+_WILDCARDS = ("+", "#")
+
+
+def is_topic_template(topic: str) -> bool:
+    """Return True if the topic contains the zone placeholder."""
+    return ZONE_PLACEHOLDER in topic
+
+
+def is_valid_topic_template(topic: str) -> bool:
+    """Return True if the placeholder only appears as whole topic levels."""
+    levels = topic.split("/")
+    return all(
+        level == ZONE_PLACEHOLDER
+        or (ZONE_PLACEHOLDER not in level and level not in _WILDCARDS)
+        for level in levels
+    )
+
+
+def is_valid_zone(zone: str) -> bool:
+    """Return True if the zone can be used as a single topic level."""
+    return bool(zone) and not any(char in zone for char in ("/", *_WILDCARDS))
+
+
+def template_filter(topic: str) -> str:
+    """Return the wildcard subscription matching all zones of a template."""
+    return topic.replace(ZONE_PLACEHOLDER, "+")
+
+
+def expand_zones(config: Mapping[str, Any]) -> list[tuple[str | None, dict[str, Any]]]:
+    """Expand a config entry into the config of each of its zones.
+
+    Entries without zones describe a single device and are returned as is
+    with a zone of None. The rows of a manifest override the entry options.
+    """
+    if manifest := config.get(CONF_ZONE_MANIFEST):
+        base = {
+            key: value for key, value in config.items() if key != CONF_ZONE_MANIFEST
+        }
+        return [
+            (
+                row[CONF_ZONE],
+                {
+                    **base,
+                    **{key: value for key, value in row.items() if key != CONF_ZONE},
+                },
+            )
+            for row in manifest
+        ]
+
+    if not (zones := config.get(CONF_ZONES)):
+        return [(None, dict(config))]
+
+    return [
+        (
+            zone,
+            {
+                key: (
+                    value.replace(ZONE_PLACEHOLDER, zone)
+                    if key in TOPIC_KEYS and isinstance(value, str)
+                    else value
+                )
+                for key, value in config.items()
+            },
+        )
+        for zone in zones
+    ]
+
+
+def subscription_filters(config: Mapping[str, Any]) -> set[str]:
+    """Return the topic filters needed for the state topics of an entry."""
+    if manifest := config.get(CONF_ZONE_MANIFEST):
+        return {
+            row[key] for row in manifest for key in STATE_TOPIC_KEYS if row.get(key)
+        }
+    topics = [config[key] for key in STATE_TOPIC_KEYS if config.get(key)]
+    if not config.get(CONF_ZONES):
+        return set(topics)
+    return {template_filter(topic) for topic in topics}